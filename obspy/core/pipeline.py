@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Module for fused in-place processing of ObsPy Trace and Stream objects.
+
+:copyright:
+    The ObsPy Development Team (devs@obspy.org)
+:license:
+    GNU Lesser General Public License, Version 3
+    (http://www.gnu.org/copyleft/lesser.html)
+"""
+from obspy.core.trace import _decimationStages
+from obspy.core.util.base import _getFunctionFromEntryPoint
+import numpy as np
+
+
+def _detrend(buf, sampling_rate, trace, type='simple', **options):
+    """
+    Removes a trend from the buffer, see
+    :meth:`~obspy.core.trace.Trace.detrend`.
+
+    The mean or a straight line is subtracted from the buffer in place,
+    other detrend methods return a new buffer.
+    """
+    type = type.lower()
+    if type == 'demean':
+        type = 'constant'
+    npts = len(buf)
+    if type == 'constant' and not options:
+        options['type'] = type
+        buf -= buf.mean()
+    elif type in ('simple', 'linear') and not options:
+        ramp = np.arange(npts, dtype='float64')
+        if type == 'simple':
+            # line through the first and last sample
+            slope = (buf[-1] - buf[0]) / float(max(npts - 1, 1))
+            offset = buf[0]
+        else:
+            # least squares line
+            options['type'] = type
+            ramp -= (npts - 1) / 2.0
+            slope = 0.0
+            if npts > 1:
+                slope = np.dot(ramp, buf) / (npts * (npts ** 2 - 1) / 12.0)
+            offset = buf.mean()
+        ramp *= slope
+        ramp += offset
+        buf -= ramp
+    else:
+        func = _getFunctionFromEntryPoint('detrend', type)
+        if func.__module__.startswith('scipy'):
+            options['type'] = type
+        buf = np.require(func(buf, **options), dtype='float64')
+    return buf, sampling_rate, "detrend:%s:%s" % (type, options)
+
+
+def _taper(buf, sampling_rate, trace, type='cosine', *args, **kwargs):
+    """
+    Tapers the buffer in place, see :meth:`~obspy.core.trace.Trace.taper`.
+    """
+    type = type.lower()
+    func = _getFunctionFromEntryPoint('taper', type)
+    buf *= func(len(buf), *args, **kwargs)
+    return buf, sampling_rate, "taper:%s:%s:%s" % (type, args, kwargs)
+
+
+def _simulate(buf, sampling_rate, trace, paz_remove=None, paz_simulate=None,
+              remove_sensitivity=True, simulate_sensitivity=True, **kwargs):
+    """
+    Corrects the buffer for the instrument response, see
+    :meth:`~obspy.core.trace.Trace.simulate`.
+    """
+    if paz_remove == 'self':
+        paz_remove = trace.stats.paz
+    from obspy.signal import seisSim
+    buf = seisSim(buf, sampling_rate, paz_remove=paz_remove,
+                  paz_simulate=paz_simulate,
+                  remove_sensitivity=remove_sensitivity,
+                  simulate_sensitivity=simulate_sensitivity, **kwargs)
+    info = []
+    if paz_remove:
+        info.append("simulate:inverse:%s:sensitivity=%s" %
+                    (paz_remove, remove_sensitivity))
+    if paz_simulate:
+        info.append("simulate:forward:%s:sensitivity=%s" %
+                    (paz_simulate, simulate_sensitivity))
+    return buf, sampling_rate, "|".join(info)
+
+
+def _filter(buf, sampling_rate, trace, type, **options):
+    """
+    Filters the buffer, see :meth:`~obspy.core.trace.Trace.filter`.
+    """
+    type = type.lower()
+    func = _getFunctionFromEntryPoint('filter', type)
+    buf = func(buf, df=sampling_rate, **options)
+    return buf, sampling_rate, "filter:%s:%s" % (type, options)
+
+
+def _decimate(buf, sampling_rate, trace, factor, no_filter=False,
+              strict_length=False, multistage=False):
+    """
+    Downsamples the buffer by an integer factor, see
+    :meth:`~obspy.core.trace.Trace.decimate`.
+
+    Returns the new sampling rate, which is used by the following steps.
+    """
+    if strict_length and len(buf) % factor:
+        msg = "Endtime of trace would change and strict_length=True."
+        raise ValueError(msg)
+    info = []
+    if multistage and not no_filter:
+        stages = _decimationStages(factor)
+        if len(stages) > 1:
+            for stage in stages:
+                buf, sampling_rate, proc_info = _decimate(
+                    buf, sampling_rate, trace, stage)
+                info.append(proc_info)
+            return buf, sampling_rate, "|".join(info)
+    if not no_filter:
+        if factor > 16:
+            msg = "Automatic filter design is unstable for decimation " + \
+                  "factors above 16. Manual decimation is necessary."
+            raise ArithmeticError(msg)
+        freq = sampling_rate * 0.5 / float(factor)
+        buf, _, proc_info = _filter(buf, sampling_rate, trace,
+                                    'lowpassCheby2', freq=freq, maxorder=12)
+        info.append(proc_info)
+    # the decimated data is much smaller, so release the large buffer
+    buf = np.array(buf[::factor])
+    info.append("downsample:integerDecimation:%s" % factor)
+    return buf, sampling_rate / float(factor), "|".join(info)
+
+
+STEPS = {'detrend': _detrend, 'taper': _taper, 'simulate': _simulate,
+         'filter': _filter, 'decimate': _decimate}
+
+
+class Pipeline(object):
+    """
+    Declarative chain of processing steps applied to a Trace or Stream.
+
+    A pipeline performs the same operations as calling the respective
+    :class:`~obspy.core.trace.Trace` methods one after another, but copies
+    the data only once to a float64 buffer. Detrend and taper steps modify
+    this buffer in place, filter and simulate steps replace it by their
+    result without converting or copying it again.
+    Only a single entry summarizing all steps is added to
+    ``stats.processing`` of each processed trace. Data and header of a trace
+    are only replaced after all steps succeeded, so a failing step leaves the
+    trace unchanged.
+
+    :type steps: list of tuples, optional
+    :param steps: Processing steps as ``(method, kwargs)`` tuples. Supported
+        methods are ``'detrend'``, ``'taper'``, ``'simulate'``, ``'filter'``
+        and ``'decimate'``. The keyword arguments are the same as for the
+        respective Trace method.
+
+    .. rubric:: Example
+
+    >>> from obspy import read
+    >>> st = read()
+    >>> pipeline = Pipeline([('detrend', {'type': 'linear'})])
+    >>> pipeline.append('taper')
+    >>> pipeline.append('filter', type='lowpass', freq=10.0)
+    >>> pipeline.append('decimate', factor=4)
+    >>> pipeline.apply(st)
+    >>> print(st[0].stats.sampling_rate)
+    25.0
+    >>> print(len(st[0].stats.processing))
+    1
+    """
+    def __init__(self, steps=None):
+        self.steps = []
+        for method, kwargs in steps or []:
+            self.append(method, **kwargs)
+
+    def __str__(self):
+        return "Pipeline: " + " -> ".join([s[0] for s in self.steps])
+
+    def __len__(self):
+        return len(self.steps)
+
+    def append(self, method, **kwargs):
+        """
+        Appends a processing step to the pipeline.
+
+        :type method: str
+        :param method: Name of the processing step, one of ``'detrend'``,
+            ``'taper'``, ``'simulate'``, ``'filter'`` or ``'decimate'``.
+        :param kwargs: Keyword arguments of the respective Trace method.
+        """
+        if method not in STEPS:
+            msg = "Unsupported processing step '%s' (supported: %s)." % \
+                (method, ", ".join(sorted(STEPS.keys())))
+            raise ValueError(msg)
+        self.steps.append((method, kwargs))
+
+    def apply(self, data, workers=None):
+        """
+        Applies all steps in place to a Trace or to all traces of a Stream.
+
+        :type data: :class:`~obspy.core.trace.Trace` or
+            :class:`~obspy.core.stream.Stream`
+        :param data: Trace or Stream to process.
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces of a stream
+            concurrently. Defaults to ``None`` which processes one trace after
+            another.
+        """
+        if hasattr(data, 'traces'):
+            from obspy.core.stream import _map
+            _map(self._applyTrace, data.traces, workers)
+        else:
+            self._applyTrace(data)
+
+    def _applyTrace(self, trace):
+        """
+        Runs all steps on the data of a single trace.
+        """
+        if np.ma.is_masked(trace.data):
+            msg = "Trace with masked values found. This is not " + \
+                  "supported for this operation. Try the split() " + \
+                  "method on Trace/Stream to produce a Stream with " + \
+                  "unmasked Traces."
+            raise NotImplementedError(msg)
+        # single contiguous float buffer, the trace itself is only updated
+        # after all steps succeeded
+        buf = np.array(trace.data, dtype='float64', order='C')
+        sampling_rate = trace.stats.sampling_rate
+        info = []
+        for method, kwargs in self.steps:
+            buf, sampling_rate, proc_info = STEPS[method](
+                buf, sampling_rate, trace, **kwargs.copy())
+            info.append(proc_info)
+        trace.data = buf
+        trace.stats.sampling_rate = sampling_rate
+        trace._addProcessingInfo("pipeline:%s" % "|".join(info))
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(exclude_empty=True)
@@ -9,26 +9,27 @@ Module for handling ObsPy Stream objects.
     (http://www.gnu.org/copyleft/lesser.html)
 """
 from glob import glob, has_magic
-from obspy.core.trace import Trace
+from obspy.core.trace import Stats, Trace, CompactStats
 from obspy.core.utcdatetime import UTCDateTime
-from obspy.core.util import NamedTemporaryFile, getExampleFile
+from obspy.core.util import AttribDict, NamedTemporaryFile, getExampleFile
 from obspy.core.util.base import ENTRY_POINTS, _readFromPlugin, \
-    _getFunctionFromEntryPoint
+    _getFunctionFromEntryPoint, _getPluginFunction
 from obspy.core.util.decorator import uncompressFile, raiseIfMasked
-from pkg_resources import load_entry_point
+from multiprocessing.pool import ThreadPool
 import cPickle
 import copy
 import fnmatch
 import math
 import numpy as np
 import os
+import re
 import urllib2
 import warnings
 
 
 def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
          endtime=None, nearest_sample=True, dtype=None, apply_calib=False,
-         **kwargs):
+         workers=None, lazy=False, **kwargs):
     """
     Read waveform files into an ObsPy Stream object.
 
@@ -71,6 +72,17 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     :type apply_calib: bool, optional
     :param apply_calib: Automatically applies the calibration factor
         ``trace.stats.calib`` for each trace, if set. Defaults to ``False``.
+    :type workers: int, optional
+    :param workers: Number of threads used to read multiple files matched by
+        a wildcard file name in parallel. The resulting traces are always
+        ordered by file name, regardless of the order in which the files are
+        finished. Defaults to ``None`` which reads all files sequentially.
+    :type lazy: bool, optional
+    :param lazy: If set to ``True``, only the data headers of local files are
+        read. The data of each trace is read from the file on first access of
+        ``trace.data`` (see also :meth:`~obspy.core.trace.Trace.releaseData`).
+        Cannot be combined with ``starttime``, ``endtime``, ``dtype`` or
+        ``apply_calib``. Defaults to ``False``.
     :param kwargs: Additional keyword arguments passed to the underlying
         waveform reader method.
     :return: An ObsPy :class:`~obspy.core.stream.Stream` object.
@@ -198,6 +210,31 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
         >>> print(st)  # doctest: +ELLIPSIS
         1 Trace(s) in Stream:
         .RJOB..Z | 2005-08-31T02:33:59.999999Z - ... | 200.0 Hz, 2001 samples
+
+    (7) Reading multiple local files in parallel.
+
+        The ``workers`` parameter distributes the files matched by a wildcard
+        onto a pool of threads. Most of the time is spent within the C
+        libraries of the waveform plug-ins, so large archives are read
+        considerably faster.
+
+        >>> from obspy import read  # doctest: +SKIP
+        >>> st = read("/path/to/archive/*.mseed", workers=8)  # doctest: +SKIP
+
+    (8) Reading data of selected traces only.
+
+        Using ``lazy=True`` only the headers are read at first. Data samples
+        are read (and decoded) as soon as ``trace.data`` is accessed, so only
+        the traces actually used have to be decoded.
+
+        >>> from obspy import read
+        >>> st = read("/path/to/BW.BGLD.__.EHE.D.2008.001.first_10_records",
+        ...           lazy=True)
+        >>> print(st)  # doctest: +ELLIPSIS
+        1 Trace(s) in Stream:
+        BW.BGLD..EHE | 2007-12-31T23:59:59.915000Z - ... | 200.0 Hz, 4120 samples
+        >>> st[0].data[:3]
+        array([-363, -382, -388], dtype=int32)
     """
     # add default parameters to kwargs so sub-modules may handle them
     kwargs['starttime'] = starttime
@@ -241,8 +278,15 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
     else:
         # some file name
         pathname = pathname_or_url
-        for file in sorted(glob(pathname)):
-            st.extend(_read(file, format, headonly, **kwargs).traces)
+        files = sorted(glob(pathname))
+
+        def _readFile(file):
+            if lazy:
+                return _readLazy(file, format, **kwargs).traces
+            return _read(file, format, headonly, **kwargs).traces
+        # read files (concurrently) - the file order is kept
+        for traces in _map(_readFile, files, workers):
+            st.extend(traces)
         if len(st) == 0:
             # try to give more specific information why the stream is empty
             if has_magic(pathname) and not glob(pathname):
@@ -262,6 +306,11 @@ def read(pathname_or_url=None, format=None, headonly=False, starttime=None,
             " or dtype."
         warnings.warn(msg, UserWarning)
         return st
+    if lazy and (starttime or endtime or dtype or apply_calib):
+        msg = "Keyword lazy cannot be combined with starttime, endtime," + \
+            " dtype or apply_calib."
+        warnings.warn(msg, UserWarning)
+        return st
     if starttime:
         st._ltrim(starttime, nearest_sample=nearest_sample)
     if endtime:
@@ -290,6 +339,67 @@ def _read(filename, format=None, headonly=False, **kwargs):
     return stream
 
 
+def _map(func, items, workers=None):
+    """
+    Returns a list of the results of func for all items.
+
+    If workers is larger than one, the items are processed concurrently by a
+    pool of worker threads. The order of the results is kept.
+    """
+    if workers and workers > 1 and len(items) > 1:
+        pool = ThreadPool(min(workers, len(items)))
+        try:
+            return pool.map(func, items)
+        finally:
+            pool.close()
+            pool.join()
+    return [func(item) for item in items]
+
+
+def _readLazy(filename, format=None, **kwargs):
+    """
+    Reads the headers of a single file into a ObsPy Stream object, the data
+    of each trace is read on first access.
+    """
+    stream = _read(filename, format, headonly=True, **kwargs)
+    for _i, trace in enumerate(stream):
+        trace._setDataLoader(_DataLoader(filename, trace.stats._format, _i,
+                                         trace.stats, kwargs))
+    return stream
+
+
+class _DataLoader(object):
+    """
+    Reads the data of a single trace of a file read with ``lazy=True``.
+    """
+    def __init__(self, filename, format, index, stats, kwargs):
+        self.filename = filename
+        self.format = format
+        self.index = index
+        self.id = "%(network)s.%(station)s.%(location)s.%(channel)s" % stats
+        self.starttime = stats.starttime
+        self.endtime = stats.endtime
+        self.npts = stats.npts
+        self.kwargs = kwargs
+        # header as read from file, restored when releasing the data
+        self.stats = stats.copy()
+
+    def __call__(self):
+        kwargs = dict(self.kwargs)
+        if self.format == 'MSEED':
+            # let libmseed decode only the records of the requested trace
+            kwargs.update(starttime=self.starttime, endtime=self.endtime,
+                          sourcename=self.id)
+            stream = _read(self.filename, self.format, **kwargs)
+            for trace in stream:
+                if trace.id == self.id and trace.stats.npts == self.npts \
+                        and trace.stats.starttime == self.starttime:
+                    return trace.data
+            kwargs = dict(self.kwargs)
+        stream = _read(self.filename, self.format, **kwargs)
+        return stream[self.index].data
+
+
 def _createExampleStream(headonly=False):
     """
     Create an example stream.
@@ -327,6 +437,223 @@ def _createExampleStream(headonly=False):
     return st
 
 
+# filter types which support filtering of two dimensional data arrays along
+# the time axis, see Stream.filter
+_BATCH_FILTERS = ['bandpass', 'bandstop', 'lowpass', 'highpass',
+                 'lowpasscheby2']
+
+# compiled Unix shell-style wildcard patterns used by Stream.select
+_PATTERNS = {}
+_PATTERNS_MAXCACHE = 100
+
+
+def _matchPattern(value, pattern):
+    """
+    Checks if value matches the Unix shell-style wildcard pattern.
+
+    In contrast to :func:`fnmatch.fnmatch` patterns without wildcards are
+    compared directly and compiled patterns are cached.
+    """
+    try:
+        match = _PATTERNS[pattern]
+    except KeyError:
+        if has_magic(pattern):
+            match = re.compile(fnmatch.translate(pattern)).match
+        else:
+            match = lambda value: value == pattern
+        if len(_PATTERNS) >= _PATTERNS_MAXCACHE:
+            _PATTERNS.clear()
+        _PATTERNS[pattern] = match
+    return bool(match(value))
+
+
+def _writeChunk(data, mask, pos, chunk):
+    """
+    Writes a data chunk into the merge buffer, returns the (new) mask.
+    """
+    end = pos + len(chunk)
+    data[pos:end] = np.ma.getdata(chunk)
+    if isinstance(chunk, np.ma.masked_array):
+        if mask is None:
+            mask = np.zeros(len(data), dtype='bool')
+        mask[pos:end] = np.ma.getmaskarray(chunk)
+    elif mask is not None:
+        mask[pos:end] = False
+    return mask
+
+
+def _writeGap(data, mask, pos, npts, fill_value):
+    """
+    Writes a gap of npts samples into the merge buffer, returns the (new)
+    mask.
+
+    See :func:`~obspy.core.util.base.createEmptyDataChunk` for the handling
+    of ``fill_value``.
+    """
+    end = pos + npts
+    if fill_value is None:
+        if mask is None:
+            mask = np.zeros(len(data), dtype='bool')
+        mask[pos:end] = True
+        return mask
+    if isinstance(fill_value, (list, tuple)) and len(fill_value) == 2:
+        # interpolate between the samples bordering the gap
+        interpolation = np.linspace(fill_value[0], fill_value[1], npts + 2)
+        data[pos:end] = interpolation[1:-1]
+    else:
+        data[pos:end] = fill_value
+    if mask is not None:
+        mask[pos:end] = False
+    return mask
+
+
+def _reserve(data, mask, size):
+    """
+    Makes sure the merge buffer holds at least size samples.
+    """
+    if size <= len(data):
+        return data, mask
+    size = max(size, 2 * len(data))
+    new_data = np.empty(size, dtype=data.dtype)
+    new_data[:len(data)] = data
+    if mask is not None:
+        new_mask = np.zeros(size, dtype='bool')
+        new_mask[:len(mask)] = mask
+        mask = new_mask
+    return new_data, mask
+
+
+def _isEqual(data, mask, start, end, chunk):
+    """
+    Checks if the merge buffer data between start and end equals the given
+    chunk. Masked samples are ignored.
+    """
+    if start < 0 or end - start != len(chunk):
+        return False
+    chunk_mask = np.ma.getmaskarray(chunk) if \
+        isinstance(chunk, np.ma.masked_array) else None
+    equal = data[start:end] == np.ma.getdata(chunk)
+    if mask is None and chunk_mask is None:
+        return bool(np.all(equal))
+    ignore = np.zeros(end - start, dtype='bool')
+    if mask is not None:
+        ignore |= mask[start:end]
+    if chunk_mask is not None:
+        ignore |= chunk_mask
+    if len(ignore) and np.all(ignore):
+        return False
+    return bool(np.all(equal | ignore))
+
+
+def _mergeTraces(traces, method=0, fill_value=None,
+                 interpolation_samples=0):
+    """
+    Merges a list of traces with the same id sorted by start time.
+
+    The result equals adding up all traces one after another using
+    :meth:`~obspy.core.trace.Trace.__add__`, but the number of samples of the
+    merged trace is planned beforehand so the data array is allocated only
+    once and every sample is copied only once. A list holding a single trace
+    returns that trace unchanged.
+    """
+    first = traces[0]
+    if len(traces) == 1:
+        return first
+    sr = first.stats.sampling_rate
+    delta_t = first.stats.delta
+    starttime = first.stats.starttime
+    # plan the size of the merged data array using the trace offsets
+    size = len(first)
+    for trace in traces[1:]:
+        offset = int(round((trace.stats.starttime - starttime) * sr))
+        size = max(size, offset + len(trace) + 1)
+    data = np.empty(size, dtype=first.data.dtype)
+    mask = _writeChunk(data, None, 0, first.data)
+    npts = len(first)
+    for trace in traces[1:]:
+        rt = trace.data
+        endtime = starttime + (npts - 1) * delta_t
+        # check whether to use the latest value to fill a gap
+        if fill_value == "latest":
+            if mask is not None and mask[npts - 1]:
+                fill = None
+            else:
+                fill = data[npts - 1]
+        elif fill_value == "interpolate":
+            if (mask is not None and mask[npts - 1]) or \
+                    rt[0] is np.ma.masked:
+                fill = None
+            else:
+                fill = (data[npts - 1], rt[0])
+        else:
+            fill = fill_value
+        delta = (trace.stats.starttime - endtime) * sr
+        delta = int(round(delta)) - 1
+        delta_endtime = endtime - trace.stats.endtime
+        if delta < 0 and delta_endtime < 0:
+            # overlap
+            delta = abs(delta)
+            keep = max(npts - delta, 0)
+            size = keep + len(rt)
+            data, mask = _reserve(data, mask, size)
+            if _isEqual(data, mask, npts - delta, npts, rt[:delta]):
+                # data are the same
+                mask = _writeChunk(data, mask, keep, rt)
+            elif method == 0:
+                mask = _writeGap(data, mask, keep, delta, fill)
+                mask = _writeChunk(data, mask, keep + delta, rt[delta:])
+            elif method == 1 and interpolation_samples >= -1:
+                ls = max(npts - delta - 1, 0)
+                samples = interpolation_samples
+                if samples == -1 or samples > delta:
+                    samples = delta
+                if samples >= len(rt):
+                    # contained trace
+                    continue
+                if (mask is not None and mask[ls]) or \
+                        rt[samples] is np.ma.masked:
+                    # masked samples can't be interpolated
+                    interpolation = None
+                else:
+                    interpolation = (data[ls], rt[samples])
+                mask = _writeGap(data, mask, keep, samples, interpolation)
+                mask = _writeChunk(data, mask, keep + samples, rt[samples:])
+            else:
+                raise NotImplementedError
+            npts = size
+        elif delta < 0 and delta_endtime >= 0:
+            # contained trace
+            delta = abs(delta)
+            t1 = npts - delta
+            t2 = t1 + len(rt)
+            if _isEqual(data, mask, t1, t2, rt):
+                # data are the same
+                continue
+            elif method == 0:
+                data, mask = _reserve(data, mask, t2)
+                mask = _writeGap(data, mask, t1, len(rt), fill)
+                npts = max(npts, t2)
+            elif method == 1:
+                continue
+            else:
+                raise NotImplementedError
+        else:
+            # exact fit or gap, use fixed value or interpolate in between
+            size = npts + delta + len(rt)
+            data, mask = _reserve(data, mask, size)
+            if delta > 0:
+                mask = _writeGap(data, mask, npts, delta, fill)
+            mask = _writeChunk(data, mask, npts + delta, rt)
+            npts = size
+    out = first.__class__(header=copy.deepcopy(first.stats))
+    if npts != len(data):
+        data = data[:npts].copy()
+    if mask is not None:
+        data = np.ma.masked_array(data, mask=mask[:npts])
+    out.data = data
+    return out
+
+
 class Stream(object):
     """
     List like object of multiple ObsPy Trace objects.
@@ -727,7 +1054,7 @@ class Stream(object):
             msg = 'Extend only supports a list of Trace objects as argument.'
             raise TypeError(msg)
 
-    def getGaps(self, min_gap=None, max_gap=None):
+    def getGaps(self, min_gap=None, max_gap=None, as_array=False):
         """
         Returns a list of all trace gaps/overlaps of the Stream object.
 
@@ -735,6 +1062,12 @@ class Stream(object):
             value is assumed to be in seconds. Defaults to None.
         :param max_gap: All gaps larger than this value will be omitted. The
             value is assumed to be in seconds. Defaults to None.
+        :type as_array: bool, optional
+        :param as_array: If ``True``, a NumPy structured array with the fields
+            ``network``, ``station``, ``location``, ``channel``,
+            ``starttime``, ``endtime`` (both POSIX timestamps), ``duration``
+            and ``samples`` is returned instead of a list. Defaults to
+            ``False``.
 
         The returned list contains one item in the following form for each gap/
         overlap: [network, station, location, channel, starttime of the gap,
@@ -770,49 +1103,78 @@ class Stream(object):
         Source            Last Sample                 ...
         BW.RJOB..EHZ      2009-08-24T00:20:13.000000Z ...
         Total: 1 gap(s) and 0 overlap(s)
-        """
-        # Create shallow copy of the traces to be able to sort them later on.
-        copied_traces = copy.copy(self.traces)
-        self.sort()
+        >>> gaps = st.getGaps(as_array=True)
+        >>> len(gaps)
+        1
+        >>> print(gaps[0]['channel'])
+        EHZ
+        >>> print(gaps[0]['duration'])
+        1.0
+        >>> print(gaps[0]['samples'])
+        99
+        """
+        # collect the time information of all traces as NumPy arrays
+        stats = [tr.stats for tr in self.traces]
+        codes = [(s.network, s.station, s.location, s.channel) for s in stats]
+        # rank of the SEED identifiers as sorted by Stream.sort()
+        ranks = dict((code, i) for i, code in enumerate(sorted(set(codes))))
+        ids = np.array([ranks[code] for code in codes], dtype='int64')
+        starts = np.array([s.starttime.timestamp for s in stats],
+                          dtype='float64')
+        ends = np.array([s.endtime.timestamp for s in stats], dtype='float64')
+        deltas = np.array([s.delta for s in stats], dtype='float64')
+        srs = np.array([s.sampling_rate for s in stats], dtype='float64')
+        # sort by id, starttime and endtime - lexsort is stable
+        idx = np.lexsort((ends, starts, ids))
+        # consecutive traces with same id
+        left = idx[:-1]
+        right = idx[1:]
+        same = ids[left] == ids[right]
+        left = left[same]
+        right = right[same]
+        delta = starts[right] - ends[left]
+        # check that any overlap is not larger than the trace coverage
+        coverage = ends[right] - starts[right]
+        delta = np.where((delta < 0) & (-delta > coverage), -coverage, delta)
+        # check gap/overlap criteria
+        keep = np.ones(len(delta), dtype='bool')
+        if min_gap:
+            keep &= delta >= min_gap
+        if max_gap:
+            keep &= delta <= max_gap
+        # number of missing samples, rounding half away from zero
+        nsamples = np.floor(np.abs(delta) * srs[left] + 0.5).astype('int64')
+        # skip if equal to delta (1 / sampling rate) - different sampling
+        # rates should always result in a gap or overlap
+        keep &= ~((deltas[left] == deltas[right]) & (nsamples == 1))
+        nsamples = np.where(delta > 0, nsamples - 1, nsamples + 1)
+        left = left[keep]
+        right = right[keep]
+        delta = delta[keep]
+        nsamples = nsamples[keep]
+        if as_array:
+            dtype = [(key, 'S%d' % max([len(code[_i]) for code in codes] +
+                                      [1]))
+                     for _i, key in enumerate(['network', 'station',
+                                               'location', 'channel'])]
+            dtype += [('starttime', 'float64'), ('endtime', 'float64'),
+                      ('duration', 'float64'), ('samples', 'int64')]
+            gaps = np.empty(len(delta), dtype=dtype)
+            for _i, key in enumerate(['network', 'station', 'location',
+                                      'channel']):
+                gaps[key] = [codes[_j][_i] for _j in left]
+            gaps['starttime'] = ends[left]
+            gaps['endtime'] = starts[right]
+            gaps['duration'] = delta
+            gaps['samples'] = nsamples
+            return gaps
         gap_list = []
-        for _i in xrange(len(self.traces) - 1):
-            # skip traces with different network, station, location or channel
-            if self.traces[_i].id != self.traces[_i + 1].id:
-                continue
-            # different sampling rates should always result in a gap or overlap
-            if self.traces[_i].stats.delta == self.traces[_i + 1].stats.delta:
-                flag = True
-            else:
-                flag = False
-            stats = self.traces[_i].stats
-            stime = stats['endtime']
-            etime = self.traces[_i + 1].stats['starttime']
-            delta = etime.timestamp - stime.timestamp
-            # Check that any overlap is not larger than the trace coverage
-            if delta < 0:
-                temp = self.traces[_i + 1].stats['endtime'].timestamp - \
-                       etime.timestamp
-                if (delta * -1) > temp:
-                    delta = -1 * temp
-            # Check gap/overlap criteria
-            if min_gap and delta < min_gap:
-                continue
-            if max_gap and delta > max_gap:
-                continue
-            # Number of missing samples
-            nsamples = int(round(math.fabs(delta) * stats['sampling_rate']))
-            # skip if is equal to delta (1 / sampling rate)
-            if flag and nsamples == 1:
-                continue
-            elif delta > 0:
-                nsamples -= 1
-            else:
-                nsamples += 1
-            gap_list.append([stats['network'], stats['station'],
-                             stats['location'], stats['channel'],
-                             stime, etime, delta, nsamples])
-        # Set the original traces to not alter the stream object.
-        self.traces = copied_traces
+        for _i, _j, _delta, _nsamples in zip(left, right, delta, nsamples):
+            stats_i = stats[_i]
+            gap_list.append([stats_i.network, stats_i.station,
+                             stats_i.location, stats_i.channel,
+                             stats_i.endtime, stats[_j].starttime,
+                             float(_delta), int(_nsamples)])
         return gap_list
 
     def insert(self, position, object):
@@ -1295,8 +1657,8 @@ class Stream(object):
             # get format specific entry point
             format_ep = ENTRY_POINTS['waveform_write'][format]
             # search writeFormat method for given entry point
-            writeFormat = load_entry_point(format_ep.dist.key,
-                'obspy.plugin.waveform.%s' % (format_ep.name), 'writeFormat')
+            writeFormat = _getPluginFunction('waveform', format_ep,
+                                             'writeFormat')
         except (IndexError, ImportError, KeyError):
             msg = "Writing format \"%s\" is not supported. Supported types: %s"
             raise TypeError(msg % (format,
@@ -1531,35 +1893,70 @@ class Stream(object):
                 msg = "Selection criteria for channel and component are " + \
                       "mutually exclusive!"
                 raise ValueError(msg)
-        traces = []
-        for trace in self:
-            # skip trace if any given criterion is not matched
-            if id and not fnmatch.fnmatch(trace.id.upper(), id.upper()):
-                continue
-            if network and not fnmatch.fnmatch(trace.stats.network.upper(),
-                                               network.upper()):
-                continue
-            if station and not fnmatch.fnmatch(trace.stats.station.upper(),
-                                               station.upper()):
-                continue
-            if location and not fnmatch.fnmatch(trace.stats.location.upper(),
-                                                location.upper()):
-                continue
-            if channel and not fnmatch.fnmatch(trace.stats.channel.upper(),
-                                               channel.upper()):
+        if id:
+            id = id.upper()
+        criteria = [(_i, value.upper())
+                    for _i, value in enumerate([network, station, location,
+                                                channel])
+                    if value]
+        if component:
+            component = component.upper()
+        index = self._getSelectIndex()
+        if id and not has_magic(id):
+            # exact SEED id - direct lookup
+            items = [(id, index[id])] if id in index else []
+        else:
+            items = index.iteritems()
+        positions = []
+        for _id, (codes, trace_positions) in items:
+            # skip traces if any given criterion is not matched
+            if id and not _matchPattern(_id, id):
                 continue
+            for _i, value in criteria:
+                if not _matchPattern(codes[_i], value):
+                    break
+            else:
+                if component and \
+                        not _matchPattern(codes[3][-1:], component):
+                    continue
+                positions.extend(trace_positions)
+        positions.sort()
+        traces = []
+        for _i in positions:
+            trace = self.traces[_i]
             if sampling_rate and \
                float(sampling_rate) != trace.stats.sampling_rate:
                 continue
             if npts and int(npts) != trace.stats.npts:
                 continue
-            if component and \
-                    not fnmatch.fnmatch(trace.stats.channel[-1].upper(),
-                                        component.upper()):
-                continue
             traces.append(trace)
         return self.__class__(traces=traces)
 
+    def _getSelectIndex(self):
+        """
+        Returns a dictionary mapping the upper case SEED identifiers to the
+        upper case network, station, location and channel codes and the
+        positions of all traces with this identifier.
+
+        The index is cached and only rebuilt if traces have been added,
+        removed or replaced or if any SEED identifier has been changed.
+        """
+        key = (Stats._id_version, map(id, self.traces))
+        cache = getattr(self, '_select_index', None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        index = {}
+        for _i, trace in enumerate(self.traces):
+            stats = trace.stats
+            codes = (stats.network.upper(), stats.station.upper(),
+                     stats.location.upper(), stats.channel.upper())
+            try:
+                index['.'.join(codes)][1].append(_i)
+            except KeyError:
+                index['.'.join(codes)] = (codes, [_i])
+        self._select_index = (key, index)
+        return index
+
     def verify(self):
         """
         Verifies all traces of current Stream against available meta data.
@@ -1608,7 +2005,8 @@ class Stream(object):
                       "calibration factors.!"
                 raise Exception(msg)
 
-    def merge(self, method=0, fill_value=None, interpolation_samples=0):
+    def merge(self, method=0, fill_value=None, interpolation_samples=0,
+              keep_order=True):
         """
         Merges ObsPy Trace objects with same IDs.
 
@@ -1632,6 +2030,12 @@ class Stream(object):
             the number of samples which are used to interpolate between
             overlapping traces. Default to ``0``. If set to ``-1`` all
             overlapping samples are interpolated.
+        :type keep_order: bool, optional
+        :param keep_order: If ``True`` (default), traces which were not merged
+            keep their original order, merged traces are placed at the start
+            of the stream. If ``False``, the traces are left sorted by their
+            SEED identifier which is faster for streams consisting of many
+            traces. Not used for ``method=-1``.
 
         Importing waveform data containing gaps or overlaps results into
         a :class:`~obspy.core.stream.Stream` object with multiple traces having
@@ -1642,61 +2046,81 @@ class Stream(object):
         The ``method`` argument controls the handling of overlapping data
         values.
         """
-        def listsort(order, current):
-            """
-            Helper method for keeping trace's ordering
-            """
-            try:
-                return order.index(current)
-            except ValueError:
-                return -1
-
         if method == -1:
             self._cleanup()
             return
         # check sampling rates and dtypes
         self._mergeChecks()
         # remember order of traces
-        order = [id(i) for i in self.traces]
+        if keep_order:
+            order = dict((id(tr), i) for i, tr in enumerate(self.traces))
         # order matters!
         self.sort(keys=['network', 'station', 'location', 'channel',
                         'starttime', 'endtime'])
         # build up dictionary with with lists of traces with same ids
         traces_dict = {}
-        # using pop() and try-except saves memory
-        try:
-            while True:
-                trace = self.traces.pop(0)
-                # skip empty traces
-                if len(trace) == 0:
-                    continue
-                _id = trace.getId()
-                if _id not in traces_dict:
-                    traces_dict[_id] = [trace]
-                else:
-                    traces_dict[_id].append(trace)
-        except IndexError:
-            pass
+        ids = []
+        for trace in self.traces:
+            # skip empty traces
+            if len(trace) == 0:
+                continue
+            _id = trace.getId()
+            if _id not in traces_dict:
+                traces_dict[_id] = [trace]
+                ids.append(_id)
+            else:
+                traces_dict[_id].append(trace)
         # clear traces of current stream
         self.traces = []
-        # loop through ids
-        for _id in traces_dict.keys():
-            cur_trace = traces_dict[_id].pop(0)
-            # loop through traces of same id
-            for _i in xrange(len(traces_dict[_id])):
-                trace = traces_dict[_id].pop(0)
-                # disable sanity checks because there are already done
-                cur_trace = cur_trace.__add__(trace, method,
-                    fill_value=fill_value, sanity_checks=False,
-                    interpolation_samples=interpolation_samples)
-            self.traces.append(cur_trace)
+        # merge all traces of the same id at once - sanity checks are
+        # already done
+        for _id in ids:
+            self.traces.append(_mergeTraces(traces_dict.pop(_id), method,
+                fill_value=fill_value,
+                interpolation_samples=interpolation_samples))
+        if keep_order:
+            # restore order, newly created traces are placed at start
+            self.traces.sort(key=lambda x: order.get(id(x), -1))
+
+    def process(self, func_name, *args, **kwargs):
+        """
+        Applies a processing method of :class:`~obspy.core.trace.Trace` to all
+        traces of the stream.
+
+        :type func_name: str
+        :param func_name: Name of the Trace method, e.g. ``'filter'``,
+            ``'simulate'``, ``'resample'``, ``'decimate'``, ``'detrend'`` or
+            ``'taper'``.
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces concurrently.
+            Defaults to ``None`` which processes one trace after another.
+        :param args: Arguments passed to the Trace method.
+        :param kwargs: Keyword arguments passed to the Trace method.
+
+        Most of the processing time of these methods is spent in NumPy, SciPy
+        or C code releasing the global interpreter lock, so streams with many
+        traces are processed considerably faster using multiple threads.
+        Every trace records the applied processing in its own
+        ``stats.processing`` list, just as if the Trace method was called
+        directly.
+
+        .. rubric:: Example
 
-        # trying to restore order, newly created traces are placed at
-        # start
-        self.traces.sort(key=lambda x: listsort(order, id(x)))
+        >>> from obspy import read
+        >>> st = read()
+        >>> st.process('filter', 'highpass', freq=1.0, workers=3)
+        >>> print(st[0].stats.processing)
+        ["filter:highpass:{'freq': 1.0}"]
+        """
+        workers = kwargs.pop('workers', None)
+
+        def _process(trace):
+            getattr(trace, func_name)(*args, **kwargs)
+        _map(_process, self.traces, workers)
 
     def simulate(self, paz_remove=None, paz_simulate=None,
-                 remove_sensitivity=True, simulate_sensitivity=True, **kwargs):
+                 remove_sensitivity=True, simulate_sensitivity=True,
+                 workers=None, **kwargs):
         """
         Correct for instrument response / Simulate new instrument response.
 
@@ -1723,6 +2147,9 @@ class Stream(object):
             ``paz_simulate['sensitivity']`` to simulate overall sensitivity of
             new instrument (seismometer/digitizer) during instrument
             simulation.
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces concurrently.
+            Defaults to ``None`` which processes one trace after another.
 
         This function corrects for the original instrument response given by
         ``paz_remove`` and/or simulates a new instrument response given by
@@ -1782,10 +2209,11 @@ class Stream(object):
             st.simulate(paz_remove=paz_sts2, paz_simulate=paz_1hz)
             st.plot()
         """
-        for tr in self:
-            tr.simulate(paz_remove=paz_remove, paz_simulate=paz_simulate,
-                        remove_sensitivity=remove_sensitivity,
-                        simulate_sensitivity=simulate_sensitivity, **kwargs)
+        self.process('simulate', paz_remove=paz_remove,
+                     paz_simulate=paz_simulate,
+                     remove_sensitivity=remove_sensitivity,
+                     simulate_sensitivity=simulate_sensitivity,
+                     workers=workers, **kwargs)
         return
 
     def filter(self, type, **options):
@@ -1799,6 +2227,9 @@ class Stream(object):
         :param options: Necessary keyword arguments for the respective filter
             that will be passed on. (e.g. ``freqmin=1.0``, ``freqmax=20.0`` for
             ``"bandpass"``)
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces concurrently.
+            Defaults to ``None`` which processes one trace after another.
 
         .. note::
 
@@ -1809,6 +2240,11 @@ class Stream(object):
             This also makes an entry with information on the applied processing
             in ``stats.processing`` of every trace.
 
+        The IIR filters ``'bandpass'``, ``'bandstop'``, ``'lowpass'``,
+        ``'highpass'`` and ``'lowpassCheby2'`` are applied to all traces with
+        the same sampling rate, number of samples and data type at once,
+        designing the filter only once.
+
         .. rubric:: _`Supported Filter`
 
         ``'bandpass'``
@@ -1847,8 +2283,37 @@ class Stream(object):
             st.filter("highpass", freq=1.0)
             st.plot()
         """
+        workers = options.pop('workers', None)
+        # IIR filters can be applied to many traces at once
+        batch = type.lower() in _BATCH_FILTERS and \
+            not options.get('ba') and not options.get('freq_passband')
+        jobs = []
+        groups = {}
         for tr in self:
-            tr.filter(type, **options)
+            if not batch or not len(tr) or \
+                    isinstance(tr.data, np.ma.masked_array):
+                jobs.append([tr])
+                continue
+            key = (tr.stats.sampling_rate, len(tr), tr.data.dtype.str)
+            if key not in groups:
+                groups[key] = []
+                jobs.append(groups[key])
+            groups[key].append(tr)
+
+        def _filter(traces):
+            if len(traces) == 1:
+                traces[0].filter(type, **options)
+                return
+            # filter coefficients are designed only once for the stacked
+            # data of all traces with same sampling rate and length
+            func = _getFunctionFromEntryPoint('filter', type)
+            data = func(np.array([tr.data for tr in traces]),
+                        df=traces[0].stats.sampling_rate, **options)
+            proc_info = "filter:%s:%s" % (type.lower(), options)
+            for tr, row in zip(traces, data):
+                tr.data = row
+                tr._addProcessingInfo(proc_info)
+        _map(_filter, jobs, workers)
 
     def trigger(self, type, **options):
         """
@@ -1918,22 +2383,35 @@ class Stream(object):
             tr.trigger(type, **options)
 
     def resample(self, sampling_rate, window='hanning', no_filter=True,
-                 strict_length=False):
+                 strict_length=False, method='fft', fast_length=False,
+                 workers=None):
         """
-        Resample data in all traces of stream using Fourier method.
+        Resample data in all traces of stream using Fourier method or a
+        polyphase filter.
 
         :type sampling_rate: float
         :param sampling_rate: The sampling rate of the resampled signal.
         :type window: array_like, callable, string, float, or tuple, optional
         :param window: Specifies the window applied to the signal in the
             Fourier domain. Defaults ``'hanning'`` window. See
-            :func:`scipy.signal.resample` for details.
+            :func:`scipy.signal.resample` for details. Only used by
+            ``method='fft'``.
         :type no_filter: bool, optional
         :param no_filter: Deactivates automatic filtering if set to ``True``.
             Defaults to ``True``.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which endtime of trace
             would change. Defaults to ``False``.
+        :type method: ``'fft'`` or ``'polyphase'``, optional
+        :param method: Resampling method, see
+            :meth:`~obspy.core.trace.Trace.resample`. Defaults to ``'fft'``.
+        :type fast_length: bool, optional
+        :param fast_length: Zero pads the data to a length with only prime
+            factors 2, 3 and 5 before the Fourier transform of
+            ``method='fft'``. Defaults to ``False``.
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces concurrently.
+            Defaults to ``None`` which processes one trace after another.
 
         .. note::
 
@@ -1944,8 +2422,11 @@ class Stream(object):
             This also makes an entry with information on the applied processing
             in ``stats.processing`` of every trace.
 
-        Uses :func:`scipy.signal.resample`. Because a Fourier method is used,
-        the signal is assumed to be periodic.
+        ``method='fft'`` uses :func:`scipy.signal.resample`. Because a Fourier
+        method is used, the signal is assumed to be periodic.
+        ``method='polyphase'`` uses
+        :func:`~obspy.signal.filter.polyphaseResample` with costs growing
+        linearly with the length of the traces.
 
         .. rubric:: Example
 
@@ -1962,11 +2443,12 @@ class Stream(object):
         BW.RJOB..EHN | 2009-08-24T00:20:03.000000Z ... | 10.0 Hz, 300 samples
         BW.RJOB..EHE | 2009-08-24T00:20:03.000000Z ... | 10.0 Hz, 300 samples
         """
-        for tr in self:
-            tr.resample(sampling_rate, window=window, no_filter=no_filter,
-                        strict_length=strict_length)
+        self.process('resample', sampling_rate, window=window,
+                     no_filter=no_filter, strict_length=strict_length,
+                     method=method, fast_length=fast_length, workers=workers)
 
-    def decimate(self, factor, no_filter=False, strict_length=False):
+    def decimate(self, factor, no_filter=False, strict_length=False,
+                 multistage=False, workers=None):
         """
         Downsample data in all traces of stream by an integer factor.
 
@@ -1979,6 +2461,13 @@ class Stream(object):
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which endtime of trace
             would change. Defaults to ``False``.
+        :type multistage: bool, optional
+        :param multistage: Splits the decimation factor into several stages
+            of at most 16, each with its own anti-alias filter, see
+            :meth:`~obspy.core.trace.Trace.decimate`. Defaults to ``False``.
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces concurrently.
+            Defaults to ``None`` which processes one trace after another.
 
         Currently a simple integer decimation is implemented.
         Only every decimation_factor-th sample remains in the trace, all other
@@ -2018,9 +2507,9 @@ class Stream(object):
         >>> tr.data
         array([0, 4, 8])
         """
-        for tr in self:
-            tr.decimate(factor, no_filter=no_filter,
-                        strict_length=strict_length)
+        self.process('decimate', factor, no_filter=no_filter,
+                     strict_length=strict_length, multistage=multistage,
+                     workers=workers)
 
     def max(self):
         """
@@ -2096,7 +2585,7 @@ class Stream(object):
             tr.integrate(type=type)
 
     @raiseIfMasked
-    def detrend(self, type='simple'):
+    def detrend(self, type='simple', workers=None):
         """
         Method to remove a linear trend from all traces.
 
@@ -2104,6 +2593,9 @@ class Stream(object):
             optional
         :param type: Method to use for detrending. Defaults to ``'simple'``.
             See the `Supported Methods`_ section below for further details.
+        :type workers: int, optional
+        :param workers: Number of threads processing the traces concurrently.
+            Defaults to ``None`` which processes one trace after another.
 
         .. note::
 
@@ -2127,15 +2619,16 @@ class Stream(object):
         ``'constant'`` or ``'demean'``
             Mean of data is subtracted (uses :func:`scipy.signal.detrend`).
         """
-        for tr in self:
-            tr.detrend(type=type)
+        self.process('detrend', type=type, workers=workers)
 
     def taper(self, type='cosine', *args, **kwargs):
         """
         Method to taper all Traces in Stream.
 
         For details see the corresponding :meth:`~obspy.core.trace.Trace.taper`
-        method of :class:`~obspy.core.trace.Trace`.
+        method of :class:`~obspy.core.trace.Trace`. The keyword argument
+        ``workers`` sets the number of threads processing the traces
+        concurrently.
 
         .. note::
 
@@ -2144,8 +2637,8 @@ class Stream(object):
             original data, use :meth:`~obspy.core.stream.Stream.copy` to create
             a copy of your stream object.
         """
-        for tr in self:
-            tr.taper(type=type, *args, **kwargs)
+        workers = kwargs.pop('workers', None)
+        self.process('taper', type=type, *args, workers=workers, **kwargs)
 
     def std(self):
         """
@@ -2388,6 +2881,59 @@ class Stream(object):
         """
         return copy.deepcopy(self)
 
+    def compactStats(self):
+        """
+        Converts the headers of all traces to memory saving
+        :class:`~obspy.core.trace.CompactStats` objects.
+
+        All attributes besides the default ones, e.g. the format specific
+        ``stats.mseed`` dictionaries, which are equal for several traces are
+        shared by these traces instead of being kept once per trace. Shared
+        dictionaries and lists are copied to a trace when they are accessed
+        through its header, so changing the header of one trace never affects
+        other traces. This considerably reduces the memory of streams with
+        many short traces, e.g. of single SeedLink packets.
+
+        .. rubric:: Example
+
+        >>> from obspy import read
+        >>> st = read()
+        >>> st.compactStats()
+        >>> print(st[0].stats.__class__.__name__)
+        CompactStats
+        >>> print(st[0].stats.station)
+        RJOB
+        """
+        skip = CompactStats._slot_keys.union(('delta', 'endtime'))
+        values = {}
+        templates = {}
+        for tr in self:
+            stats = tr.stats
+            shared = {}
+            for key in stats:
+                if key in skip:
+                    continue
+                value = stats[key]
+                # use a single object for equal values of the same key
+                try:
+                    if isinstance(value, (dict, AttribDict)):
+                        frozen = frozenset(value.iteritems())
+                    elif isinstance(value, list):
+                        frozen = tuple(value)
+                    else:
+                        frozen = value
+                    value = values.setdefault((key, type(value), frozen),
+                                              value)
+                except TypeError:
+                    pass
+                shared[key] = value
+            # use a single shared dictionary for equal combinations
+            signature = frozenset((key, id(value))
+                                  for key, value in shared.iteritems())
+            shared = templates.setdefault(signature, shared)
+            header = dict((key, stats[key]) for key in CompactStats._slot_keys)
+            tr.stats = CompactStats(header, shared=shared)
+
     def clear(self):
         """
         Clear trace list (convenient method).
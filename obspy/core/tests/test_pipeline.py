@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+from obspy import read
+from obspy.core.pipeline import Pipeline
+import numpy as np
+import unittest
+
+
+class PipelineTestCase(unittest.TestCase):
+    """
+    Test suite for obspy.core.pipeline.
+    """
+
+    def test_equalsTraceMethods(self):
+        """
+        A pipeline gives the same result as the single Trace methods.
+        """
+        paz = {'poles': [-0.037004 + 0.037016j, -0.037004 - 0.037016j,
+                         -251.33 + 0j],
+               'zeros': [0j, 0j], 'gain': 60077000.0,
+               'sensitivity': 2516778400.0}
+        for detrend in ['simple', 'linear', 'demean', 'constant']:
+            st1 = read()
+            st2 = st1.copy()
+            st1.detrend(detrend)
+            st1.taper()
+            st1.simulate(paz_remove=paz)
+            st1.filter('bandpass', freqmin=0.5, freqmax=10.0)
+            st1.decimate(4)
+            pipeline = Pipeline([('detrend', {'type': detrend}),
+                                 ('taper', {}),
+                                 ('simulate', {'paz_remove': paz}),
+                                 ('filter', {'type': 'bandpass',
+                                             'freqmin': 0.5,
+                                             'freqmax': 10.0}),
+                                 ('decimate', {'factor': 4})])
+            self.assertEqual(len(pipeline), 5)
+            pipeline.apply(st2, workers=2)
+            for tr1, tr2 in zip(st1, st2):
+                self.assertEqual(tr1.stats.npts, tr2.stats.npts)
+                self.assertEqual(tr1.stats.sampling_rate,
+                                 tr2.stats.sampling_rate)
+                self.assertEqual(tr1.stats.endtime, tr2.stats.endtime)
+                self.assertEqual(tr2.data.dtype, np.float64)
+                np.testing.assert_array_almost_equal(
+                    tr1.data / abs(tr1.data).max(),
+                    tr2.data / abs(tr1.data).max())
+                # one consolidated processing entry
+                self.assertEqual(len(tr2.stats.processing), 1)
+                self.assertEqual(tr2.stats.processing[0],
+                    "pipeline:" + "|".join(tr1.stats.processing))
+
+    def test_failingStepLeavesTraceUnchanged(self):
+        """
+        Data and header of a trace are only replaced after all steps
+        succeeded.
+        """
+        tr = read()[0]
+        tr.data = tr.data.astype('float64')
+        data = tr.data
+        backup = tr.copy()
+        # highpass above Nyquist of the decimated trace raises
+        pipeline = Pipeline([('detrend', {'type': 'demean'}),
+                             ('decimate', {'factor': 4}),
+                             ('filter', {'type': 'highpass', 'freq': 20.0})])
+        self.assertRaises(ValueError, pipeline.apply, tr)
+        self.assertTrue(tr.data is data)
+        self.assertEqual(tr, backup)
+        self.assertFalse('processing' in tr.stats)
+        # without the failing step the trace is processed
+        pipeline.steps.pop()
+        pipeline.apply(tr)
+        self.assertEqual(tr.stats.sampling_rate, 25.0)
+        self.assertEqual(tr.stats.npts, 750)
+        np.testing.assert_array_equal(data, backup.data)
+
+    def test_detrendSingleSample(self):
+        """
+        Detrending a trace with a single sample gives the same result as the
+        Trace method.
+        """
+        for type in ['simple', 'linear', 'demean']:
+            tr1 = read()[0]
+            tr1.data = tr1.data[:1].astype('float64')
+            tr2 = tr1.copy()
+            tr1.detrend(type)
+            Pipeline([('detrend', {'type': type})]).apply(tr2)
+            np.testing.assert_array_equal(tr1.data, tr2.data)
+            np.testing.assert_array_equal(tr2.data, [0.0])
+
+    def test_decimateMultistage(self):
+        """
+        Multistage decimation gives the same result as the Trace method.
+        """
+        tr1 = read()[0]
+        tr2 = tr1.copy()
+        tr1.decimate(50, multistage=True)
+        Pipeline([('decimate', {'factor': 50, 'multistage': True})]).apply(tr2)
+        self.assertEqual(tr1.stats.sampling_rate, 2.0)
+        self.assertEqual(tr2.stats.sampling_rate, 2.0)
+        np.testing.assert_array_almost_equal(
+            tr1.data / abs(tr1.data).max(), tr2.data / abs(tr1.data).max())
+        self.assertEqual(tr2.stats.processing[0],
+                         "pipeline:" + "|".join(tr1.stats.processing))
+
+    def test_invalidStep(self):
+        """
+        Unsupported steps and masked data raise.
+        """
+        self.assertRaises(ValueError, Pipeline, [('resample', {})])
+        pipeline = Pipeline()
+        self.assertRaises(ValueError, pipeline.append, 'integrate')
+        pipeline.append('detrend')
+        st = read()
+        st.traces[0].data = np.ma.masked_array(st[0].data)
+        st.traces[0].data[10] = np.ma.masked
+        self.assertRaises(NotImplementedError, pipeline.apply, st[0])
+
+
+def suite():
+    return unittest.makeSuite(PipelineTestCase, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from obspy import Stream, Trace, UTCDateTime
 from obspy.core import Stats
+from obspy.core.trace import CompactStats
 from obspy.core.util import AttribDict
 import copy
 import pickle
@@ -223,6 +224,72 @@ class StatsTestCase(unittest.TestCase):
         self.assertEqual(ad, adict)
         self.assertEqual(adict, ad)
 
+    def test_compactStats(self):
+        """
+        CompactStats behaves like Stats.
+        """
+        header = {'network': 'BW', 'station': 'MANZ', 'npts': 101,
+                  'sampling_rate': 20.0, 'test': 1,
+                  'starttime': UTCDateTime(2009, 1, 1)}
+        stats = Stats(header)
+        cstats = CompactStats(header)
+        self.assertEqual(cstats, stats)
+        self.assertEqual(stats, cstats)
+        self.assertEqual(sorted(cstats.keys()), sorted(stats.keys()))
+        self.assertEqual(cstats.endtime, UTCDateTime(2009, 1, 1, 0, 0, 5))
+        self.assertEqual(str(cstats), str(stats))
+        # derived values
+        cstats.delta = 0.1
+        self.assertEqual(cstats.sampling_rate, 10.0)
+        self.assertEqual(cstats['endtime'], UTCDateTime(2009, 1, 1, 0, 0, 10))
+        self.assertRaises(AttributeError, cstats.__setitem__, 'endtime', 1)
+        cstats.other = {'a': 1}
+        self.assertEqual(cstats.other.__class__, AttribDict)
+        del cstats.other
+        self.assertFalse('other' in cstats)
+        self.assertRaises(KeyError, cstats.__getitem__, 'other')
+        # copies and pickling
+        for other in [cstats.copy(), copy.deepcopy(cstats),
+                      pickle.loads(pickle.dumps(cstats, protocol=2))]:
+            self.assertEqual(other.__class__, CompactStats)
+            self.assertEqual(other, cstats)
+        # traces keep compact headers
+        tr = Trace(header=cstats)
+        self.assertEqual(tr.stats.__class__, CompactStats)
+        self.assertEqual(tr.stats, cstats)
+
+    def test_compactStatsShared(self):
+        """
+        Shared attributes of CompactStats are never modified.
+        """
+        shared = {'mseed': AttribDict({'encoding': 'STEIM2'}), 'test': 1}
+        stats1 = CompactStats({'test': 2}, shared=shared)
+        stats2 = CompactStats(shared=shared)
+        self.assertEqual(stats1.test, 2)
+        self.assertEqual(stats2.test, 1)
+        stats1.mseed.encoding = 'STEIM1'
+        stats1['processing'] = ['test']
+        self.assertEqual(stats1.mseed.encoding, 'STEIM1')
+        self.assertEqual(stats2.mseed.encoding, 'STEIM2')
+        self.assertEqual(shared['mseed'].encoding, 'STEIM2')
+        del stats2.test
+        self.assertFalse('test' in stats2)
+        self.assertEqual(shared['test'], 1)
+        self.assertEqual(stats1.test, 2)
+        # convert stream
+        st = Stream([Trace(header={'station': 'A', 'mseed': {'a': 1}}),
+                     Trace(header={'station': 'B', 'mseed': {'a': 1}}),
+                     Trace(header={'station': 'C', 'mseed': {'a': 2}})])
+        st2 = st.copy()
+        st.compactStats()
+        for tr, tr2 in zip(st, st2):
+            self.assertEqual(tr.stats.__class__, CompactStats)
+            self.assertEqual(tr.stats, tr2.stats)
+        self.assertTrue(st[0].stats._shared is st[1].stats._shared)
+        self.assertFalse(st[0].stats._shared is st[2].stats._shared)
+        st[0].stats.mseed.a = 3
+        self.assertEqual(st[1].stats.mseed.a, 1)
+
 
 def suite():
     return unittest.makeSuite(StatsTestCase, 'test')
@@ -276,6 +276,25 @@ class StreamTestCase(unittest.TestCase):
             self.assertAlmostEqual(mseed_gap_list[_i][7], gap_list[_i][7],
                                    places=3)
 
+    def test_getGapsAsArray(self):
+        """
+        Tests the as_array option of the getGaps method.
+        """
+        stream = self.mseed_stream
+        gap_list = stream.getGaps()
+        gaps = stream.getGaps(as_array=True)
+        self.assertEqual(len(gaps), len(gap_list))
+        for gap, item in zip(gaps, gap_list):
+            self.assertEqual(list(gap)[:4], item[:4])
+            self.assertEqual(gap['starttime'], item[4].timestamp)
+            self.assertEqual(gap['endtime'], item[5].timestamp)
+            self.assertEqual(gap['duration'], item[6])
+            self.assertEqual(gap['samples'], item[7])
+        # no gaps
+        gaps = Stream().getGaps(as_array=True)
+        self.assertEqual(len(gaps), 0)
+        self.assertTrue('samples' in gaps.dtype.names)
+
     def test_getGapsMultiplexedStreams(self):
         """
         Tests the getGaps method of the Stream objects.
@@ -559,6 +578,49 @@ class StreamTestCase(unittest.TestCase):
         self.assertEqual(len(stream2), 1)
         self.assertTrue(stream[4] in stream2)
 
+    def test_selectIndexInvalidation(self):
+        """
+        The cached SEED id index used by select must be updated if traces
+        or their SEED identifiers change.
+        """
+        st = Stream([Trace(header={'station': 'A'}),
+                     Trace(header={'station': 'B'})])
+        self.assertEqual(len(st.select(station='A')), 1)
+        self.assertEqual(len(st.select(id='.A..')), 1)
+        # adding a trace
+        st.append(Trace(header={'station': 'A'}))
+        self.assertEqual(len(st.select(station='A')), 2)
+        # changing a header
+        st[1].stats.station = 'A'
+        self.assertEqual(len(st.select(station='A')), 3)
+        self.assertEqual(len(st.select(id='.a..')), 3)
+        # replacing a stats object
+        st[0].stats = st[0].stats.copy()
+        st[0].stats.station = 'C'
+        self.assertEqual(len(st.select(station='A')), 2)
+        # modifying the trace list directly
+        st.traces.pop(0)
+        st.traces.append(Trace(header={'station': 'D'}))
+        self.assertEqual(len(st.select(station='A')), 2)
+        self.assertEqual(len(st.select(station='[CD]')), 1)
+        self.assertEqual(len(st.select(id='.?..')), 3)
+        # original order is kept
+        st.traces.reverse()
+        self.assertTrue(st.select(station='A')[0] is st[1])
+
+    def test_selectMixedStrAndUnicode(self):
+        """
+        Selecting with str patterns on unicode headers and vice versa.
+        """
+        st = Stream([Trace(header={'network': u'BW', 'station': 'RJOB'})])
+        self.assertEqual(len(st.select(network='XX')), 0)
+        self.assertEqual(len(st.select(network='BW')), 1)
+        self.assertEqual(len(st.select(network=u'XX')), 0)
+        self.assertEqual(len(st.select(station=u'RJOB')), 1)
+        self.assertEqual(len(st.select(station=u'ROB')), 0)
+        self.assertEqual(len(st.select(id=u'BW.RJOB..')), 1)
+        self.assertEqual(len(st.select(id='BW.RJOB.XX.')), 0)
+
     def test_sort(self):
         """
         Tests the sort method of the Stream object.
@@ -970,6 +1032,59 @@ class StreamTestCase(unittest.TestCase):
         st = Stream([trace1, trace2, trace3])
         st.merge()
 
+    def test_mergeManyTracesEqualsTraceAdd(self):
+        """
+        Merging many gapped and overlapping traces at once must give the same
+        result as adding up the traces one after another.
+        """
+        np.random.seed(815)
+        traces = []
+        for i in xrange(50):
+            trace = Trace(data=np.random.randint(0, 3, 20).astype('int32'))
+            trace.stats.starttime = UTCDateTime(0) + \
+                np.random.randint(-5, 5) * 0.01 + i * 0.2
+            traces.append(trace)
+        for method in [0, 1]:
+            for fill_value in [None, 0, 'latest', 'interpolate']:
+                expected = traces[0]
+                for trace in traces[1:]:
+                    expected = expected.__add__(trace, method=method,
+                        fill_value=fill_value, interpolation_samples=2)
+                st = Stream([tr.copy() for tr in traces[::-1]])
+                st.merge(method=method, fill_value=fill_value,
+                         interpolation_samples=2)
+                self.assertEqual(len(st), 1)
+                self.assertEqual(st[0].stats, expected.stats)
+                self.assertEqual(type(st[0].data), type(expected.data))
+                np.testing.assert_array_equal(st[0].data, expected.data)
+                np.testing.assert_array_equal(np.ma.getmaskarray(st[0].data),
+                    np.ma.getmaskarray(expected.data))
+
+    def test_mergeKeepOrder(self):
+        """
+        Tests the keep_order option of Stream.merge.
+        """
+        traces = []
+        for channel in ['EHZ', 'EHN', 'EHE']:
+            trace = Trace(data=np.ones(10))
+            trace.stats.channel = channel
+            traces.append(trace)
+        trace = traces[1].copy()
+        trace.stats.starttime += 10
+        # not merged traces keep their order, merged ones are put first
+        st = Stream(traces + [trace])
+        st.merge()
+        self.assertEqual([tr.stats.channel for tr in st],
+                         ['EHN', 'EHZ', 'EHE'])
+        self.assertTrue(st[1] is traces[0])
+        self.assertTrue(st[2] is traces[2])
+        # traces sorted by id
+        st = Stream(traces + [trace])
+        st.merge(keep_order=False)
+        self.assertEqual([tr.stats.channel for tr in st],
+                         ['EHE', 'EHN', 'EHZ'])
+        self.assertEqual(st[1].stats.npts, 20)
+
     def test_mergeWithSmallSamplingRate(self):
         """
         Bugfix for merging multiple traces with very small sampling rate.
@@ -1590,6 +1705,63 @@ class StreamTestCase(unittest.TestCase):
         self.assertEqual(len(st), 1)
         UTCDateTime.DEFAULT_PRECISION = 6
 
+    def test_readLazy(self):
+        """
+        Tests reading data on first access using the lazy option of read.
+        """
+        for filename in ['/path/to/test.mseed',
+                         '/path/to/loc_RJOB20050831023349.z']:
+            st = read(filename)
+            st2 = read(filename, lazy=True)
+            self.assertEqual(len(st), len(st2))
+            tr = st2[0]
+            # headers only, even after printing
+            str(st2)
+            self.assertFalse('data' in tr.__dict__)
+            self.assertEqual(tr.stats.npts, st[0].stats.npts)
+            # data is read on first access
+            np.testing.assert_array_equal(tr.data, st[0].data)
+            self.assertTrue('data' in tr.__dict__)
+            self.assertEqual(tr, st[0])
+            # and may be released again
+            tr.data = tr.data * 0
+            tr.releaseData()
+            self.assertFalse('data' in tr.__dict__)
+            np.testing.assert_array_equal(tr.data, st[0].data)
+        # releasing the data restores the header as read from file
+        filename = '/path/to/BW.BGLD.__.EHE.D.2008.001.first_10_records'
+        tr = read(filename, lazy=True)[0]
+        t0 = tr.stats.starttime
+        stats = tr.stats.copy()
+        tr.trim(t0 + 5, t0 + 10)
+        self.assertEqual(len(tr.data), 1001)
+        tr.releaseData()
+        self.assertEqual(tr.stats, stats)
+        self.assertEqual(tr.stats.starttime, t0)
+        self.assertEqual(len(tr.data), tr.stats.npts)
+        tr.decimate(4)
+        self.assertEqual(tr.stats.sampling_rate, 50.0)
+        tr.releaseData()
+        self.assertEqual(tr.stats.sampling_rate, 200.0)
+        self.assertFalse('processing' in tr.stats)
+        self.assertEqual(len(tr.data), tr.stats.npts)
+        self.assertEqual(tr.stats.endtime, stats.endtime)
+        # copies of lazy traces are lazy too
+        st = read('/path/to/test.mseed', lazy=True)
+        tr = st.copy()[0]
+        self.assertFalse('data' in tr.__dict__)
+        self.assertEqual(len(tr), tr.stats.npts)
+        # releasing data of normal traces does nothing
+        tr = read()[0]
+        tr.releaseData()
+        self.assertEqual(len(tr.data), 3000)
+        # lazy reading can't be combined with time windows
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("ignore", UserWarning)
+            st = read('/path/to/test.mseed', lazy=True,
+                      starttime=UTCDateTime(2003, 5, 29, 2, 15))
+        self.assertFalse('data' in st[0].__dict__)
+
     def test_readArguments(self):
         """
         Testing arguments on read function.
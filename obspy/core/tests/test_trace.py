@@ -1126,6 +1126,32 @@ class TraceTestCase(unittest.TestCase):
         tr = Trace(x)
         self.assertRaises(NotImplementedError, tr.detrend)
 
+    def test_resampleMethods(self):
+        """
+        Tests polyphase resampling and fast length padding of resample().
+        """
+        t = np.arange(100003) / 100.0
+        data = np.sin(2 * np.pi * t)
+        for kwargs in [{'method': 'polyphase'}, {'fast_length': True}]:
+            tr = Trace(data=data.copy())
+            tr.stats.sampling_rate = 100.0
+            tr.resample(40.0, **kwargs)
+            self.assertEqual(tr.stats.sampling_rate, 40.0)
+            self.assertEqual(tr.stats.npts, 40001)
+            expected = np.sin(2 * np.pi * np.arange(40001) / 40.0)
+            np.testing.assert_array_almost_equal(tr.data[100:-100],
+                                                 expected[100:-100], 2)
+        self.assertTrue(tr.stats.processing[0].startswith("resample:40"))
+        tr = Trace(data=data.copy())
+        tr.stats.sampling_rate = 100.0
+        tr.resample(40.0, method='polyphase')
+        self.assertEqual(tr.stats.processing, ["resample:40:polyphase:2/5"])
+        # unsupported methods and ratios
+        self.assertRaises(ValueError, tr.resample, 20.0, method='spline')
+        self.assertRaises(ValueError, tr.resample, 39.99999,
+                          method='polyphase')
+        self.assertEqual(tr.stats.sampling_rate, 40.0)
+
 
 def suite():
     return unittest.makeSuite(TraceTestCase, 'test')
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 from obspy import UTCDateTime
+from obspy.core import utcdatetime
+from obspy.core.utcdatetime import UTCDateTimeArray, timeCacheInfo, \
+    clearTimeCache
 from obspy.core.util.decorator import skipIf
 import copy
 import datetime
@@ -358,9 +361,9 @@ class UTCDateTimeTestCase(unittest.TestCase):
         dt = UTCDateTime(-0.000001)
         self.assertAlmostEqual(dt.timestamp, -0.000001, 6)
         self.assertEqual(str(dt), "1969-12-31T23:59:59.999999Z")
-        # -0.00000000001
+        # -0.00000000001, rounded to full nanoseconds
         dt = UTCDateTime(-0.00000000001)
-        self.assertEqual(dt.timestamp, -0.00000000001)
+        self.assertEqual(dt.timestamp, 0.0)
         self.assertEqual(str(dt), "1970-01-01T00:00:00.000000Z")
         # -1000.1
         dt = UTCDateTime("1969-12-31T23:43:19.900000Z")
@@ -853,6 +856,173 @@ class UTCDateTimeTestCase(unittest.TestCase):
             self.assertFalse(obj >= dt)
             self.assertFalse(obj > dt)
 
+    def test_nanoseconds(self):
+        """
+        Tests the integer nanosecond representation.
+        """
+        dt = UTCDateTime(1240561632.0050001)
+        self.assertEqual(dt.ns, 1240561632005000114)
+        self.assertEqual(dt.timestamp, 1240561632.0050001)
+        self.assertEqual(UTCDateTime(-1.5).ns, -1500000000)
+        self.assertEqual(UTCDateTime(2009, 1, 1, 0, 0, 0, 1).ns,
+                         1230768000000001000)
+        self.assertEqual(UTCDateTime(dt).ns, dt.ns)
+        # arithmetic is exact in nanoseconds
+        t = UTCDateTime(2012, 1, 1)
+        for _i in xrange(100000):
+            t += 0.01
+        self.assertEqual(t.ns - UTCDateTime(2012, 1, 1).ns, 1000 * 10 ** 9)
+        self.assertEqual(t - UTCDateTime(2012, 1, 1), 1000.0)
+        # setting the timestamp
+        t.timestamp = 1.25
+        self.assertEqual(t.ns, 1250000000)
+        self.assertRaises(TypeError, t.__add__, 'string')
+        self.assertRaises(TypeError, t.__add__, t)
+        # string representation is exact
+        dt = UTCDateTime('2009-02-13T23:31:30.123456789', precision=9)
+        self.assertEqual(str(dt), '2009-02-13T23:31:30.123456789Z')
+        dt.precision = 11
+        self.assertEqual(str(dt), '2009-02-13T23:31:30.12345678900Z')
+        dt.precision = 8
+        self.assertEqual(str(dt), '2009-02-13T23:31:30.12345679Z')
+        dt = UTCDateTime('2009-12-31T23:59:59.9999996')
+        self.assertEqual(str(dt), '2010-01-01T00:00:00.000000Z')
+        self.assertEqual(str(UTCDateTime(-0.25)),
+                         '1969-12-31T23:59:59.750000Z')
+
+    def test_unpickleFloatTimestamp(self):
+        """
+        Objects pickled with a float timestamp can still be unpickled.
+        """
+        dt = UTCDateTime.__new__(UTCDateTime)
+        dt.__setstate__({'timestamp': 1240561632.5,
+                         '_UTCDateTime__precision': 4,
+                         '_UTCDateTime__ms_pattern': '%0.4f'})
+        self.assertEqual(dt, UTCDateTime(2009, 4, 24, 8, 27, 12, 500000))
+        self.assertEqual(dt.precision, 4)
+        self.assertEqual(str(dt), '2009-04-24T08:27:12.5000Z')
+
+    def test_UTCDateTimeArray(self):
+        """
+        Vectorized operations give the same results as single UTCDateTime
+        objects.
+        """
+        np.random.seed(815)
+        timestamps = np.random.uniform(0, 4e9, 500)
+        # whole days, hours, minutes and seconds
+        timestamps[:100] = timestamps[:100] // 86400 * 86400
+        timestamps[100:200] = timestamps[100:200] // 3600 * 3600
+        timestamps[200:300] = timestamps[200:300] // 60 * 60
+        timestamps[300:400] = np.floor(timestamps[300:400])
+        dts = [UTCDateTime(t) for t in timestamps]
+        # construction from floats, objects and strings
+        array = UTCDateTimeArray(timestamps)
+        self.assertEqual(array.ns.tolist(), [dt.ns for dt in dts])
+        self.assertEqual(UTCDateTimeArray(dts).ns.tolist(), array.ns.tolist())
+        strings = [str(dt) for dt in dts]
+        self.assertEqual(UTCDateTimeArray(strings).ns.tolist(),
+                         [UTCDateTime(s).ns for s in strings])
+        self.assertEqual(array.tolist(), dts)
+        self.assertEqual(array[5], dts[5])
+        self.assertEqual(len(array[5:10]), 5)
+        # formatting
+        self.assertEqual(array.isoformat(), [dt.isoformat() for dt in dts])
+        self.assertEqual(array.formatSEED(),
+                         [dt.formatSEED() for dt in dts])
+        self.assertEqual(array.formatSEED(compact=True),
+                         [dt.formatSEED(compact=True) for dt in dts])
+        # strings not in fixed layout are parsed one by one
+        strings = ['2009-12-31', '2009-365T12:23:34.5',
+                   '20091231T122334.5', '2009-12-31T12:23:34+01:15',
+                   u'2010-01-01T00:00:00.123456789Z', '2010-01-01 01:02:03']
+        self.assertEqual(UTCDateTimeArray(strings).ns.tolist(),
+                         [UTCDateTime(s).ns for s in strings])
+        self.assertRaises(ValueError, UTCDateTimeArray, ['2009-02-29'])
+        # int64 nanoseconds only cover the years 1677 to 2262
+        limits = ['1677-09-21T00:12:43.145224192',
+                  '2262-04-11T23:47:16.854775807']
+        self.assertEqual(UTCDateTimeArray(limits).ns.tolist(),
+                         [-2 ** 63, 2 ** 63 - 1])
+        for values in [np.array([-1e10]), np.array([1e10]),
+                       np.array([np.nan]), np.array([10 ** 10]),
+                       ['1500-01-01'], ['0001-01-01T00:00:00'],
+                       ['1677-09-21T00:12:43.145224191'],
+                       ['2262-04-11T23:47:16.854775808'],
+                       ['1500-01-01T00:00:00+01:00'],
+                       [UTCDateTime('1500-01-01')]]:
+            self.assertRaises(OverflowError, UTCDateTimeArray, values)
+        # comparisons and differences of times centuries apart
+        times = UTCDateTimeArray(['1700-01-01', '1900-01-01', '2250-01-01'])
+        for dt in [UTCDateTime(1690, 1, 1), UTCDateTime(2100, 1, 1),
+                   UTCDateTime(2260, 1, 1), UTCDateTime(1500, 1, 1),
+                   UTCDateTime(3000, 1, 1)]:
+            for op in ['__eq__', '__ne__', '__lt__', '__le__', '__gt__',
+                       '__ge__']:
+                self.assertEqual(getattr(times, op)(dt).tolist(),
+                                 [getattr(t, op)(dt) for t in times])
+            self.assertEqual((times - dt).tolist(),
+                             [t - dt for t in times])
+        self.assertEqual((times < times[::-1]).tolist(), [True, False, False])
+        self.assertEqual((times - times[::-1]).tolist(),
+                         [t1 - t2 for t1, t2 in zip(times, times[::-1])])
+        # arithmetic beyond the int64 range raises
+        times = UTCDateTimeArray(['2200-01-01T00:00:00'])
+        self.assertRaises(OverflowError, times.__add__, 100 * 365 * 86400)
+        self.assertRaises(OverflowError, times.__add__,
+                          np.array([100 * 365 * 86400]))
+        self.assertRaises(OverflowError, times.__add__, np.array([3.2e9]))
+        self.assertRaises(OverflowError, times.__sub__, 600 * 365 * 86400)
+        # comparisons respect the precision
+        other = array + 0.0000004
+        self.assertTrue((array == other).all())
+        self.assertFalse((array < other).any())
+        self.assertTrue((array <= other).all())
+        self.assertTrue((array + 1 > array).all())
+        self.assertEqual((dts[0] < array).tolist(),
+                         [dts[0] < dt for dt in dts])
+        self.assertEqual((array >= dts[0]).tolist(),
+                         [dt >= dts[0] for dt in dts])
+        # arithmetic
+        self.assertEqual((array + 1.5).tolist(), [dt + 1.5 for dt in dts])
+        self.assertEqual((10 + array).tolist(), [dt + 10 for dt in dts])
+        self.assertEqual((array - 2).tolist(), [dt - 2 for dt in dts])
+        np.testing.assert_allclose(array - dts[0],
+                                   [dt - dts[0] for dt in dts], atol=1e-6)
+        self.assertEqual(len(UTCDateTimeArray()), 0)
+
+    def test_timeStringCache(self):
+        """
+        Parsed time strings are cached, fixed layouts are parsed directly.
+        """
+        maxsize = utcdatetime.TIME_CACHE_SIZE
+        try:
+            clearTimeCache()
+            dt = UTCDateTime("2009-12-31T12:23:34.5Z")
+            self.assertEqual(dt, UTCDateTime(2009, 12, 31, 12, 23, 34, 500000))
+            self.assertEqual(UTCDateTime("2009-12-31T12:23:34.5Z"), dt)
+            info = timeCacheInfo()
+            self.assertEqual(info['misses'], 1)
+            self.assertEqual(info['hits'], 1)
+            # SEED time strings
+            self.assertEqual(UTCDateTime("2009,365,12:23:34.5000"), dt)
+            self.assertEqual(UTCDateTime("2008,366"),
+                             UTCDateTime(2008, 12, 31))
+            self.assertEqual(UTCDateTime("2009-12-31 12:23:34.123456789").ns,
+                             1262262214123456789)
+            # invalid strings are not cached
+            self.assertRaises(ValueError, UTCDateTime, "2009-02-29")
+            self.assertEqual(timeCacheInfo()['size'], 4)
+            # least recently used strings are dropped
+            utcdatetime.TIME_CACHE_SIZE = 2
+            UTCDateTime("2009-12-31T12:23:34.5Z")
+            UTCDateTime("2010-01-01")
+            self.assertEqual(timeCacheInfo()['size'], 2)
+            UTCDateTime("2009-12-31T12:23:34.5Z")
+            self.assertEqual(timeCacheInfo()['hits'], 3)
+        finally:
+            utcdatetime.TIME_CACHE_SIZE = maxsize
+            clearTimeCache()
+
 
 def suite():
     return unittest.makeSuite(UTCDateTimeTestCase, 'test')
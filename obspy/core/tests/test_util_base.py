@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 import unittest
 import os
-from obspy.core.util.base import getMatplotlibVersion, NamedTemporaryFile
+from obspy import read
+from obspy.core.util.base import getMatplotlibVersion, NamedTemporaryFile, \
+    getExampleFile, _getFormatCandidates, _getPluginFunction, _guessFormats, \
+    _readFromPlugin, _FORMAT_HINTS, _PLUGIN_FUNCTIONS, ENTRY_POINTS
 
 
 class UtilBaseTestCase(unittest.TestCase):
@@ -63,6 +66,65 @@ class UtilBaseTestCase(unittest.TestCase):
             filename = tf.name
         self.assertFalse(os.path.exists(filename))
 
+    def test_getPluginFunctionIsCached(self):
+        """
+        Entry points should be resolved only once.
+        """
+        ep = ENTRY_POINTS['waveform']['TSPAIR']
+        func1 = _getPluginFunction('waveform', ep, 'readFormat')
+        func2 = _getPluginFunction('waveform', ep, 'readFormat')
+        self.assertTrue(func1 is func2)
+        self.assertEqual(func1.__name__, 'readTSPAIR')
+
+    def test_guessFormats(self):
+        """
+        Tests guessing of formats via file extension and leading bytes.
+        """
+        self.assertEqual(_guessFormats(getExampleFile('tspair.ascii')),
+                         ['SLIST', 'TSPAIR'])
+        self.assertEqual(_guessFormats(getExampleFile('test.mseed'))[0],
+                         'MSEED')
+        self.assertEqual(_guessFormats(getExampleFile('test.sac')),
+                         ['SAC', 'SACXY'])
+        self.assertEqual(_guessFormats('/does/not/exist.gse2'), ['GSE2'])
+
+    def test_formatHint(self):
+        """
+        The format detected last within a directory is checked first.
+        """
+        filename = getExampleFile('tspair.ascii')
+        key = ('waveform', os.path.dirname(filename))
+        _FORMAT_HINTS.pop(key, None)
+        names = [ep.name for ep in _getFormatCandidates('waveform', filename)]
+        self.assertEqual(names[:2], ['SLIST', 'TSPAIR'])
+        self.assertEqual(sorted(names), sorted(ENTRY_POINTS['waveform']))
+        read(filename)
+        self.assertEqual(_FORMAT_HINTS[key], 'TSPAIR')
+        names = [ep.name for ep in _getFormatCandidates('waveform', filename)]
+        self.assertEqual(names[:2], ['TSPAIR', 'SLIST'])
+        self.assertEqual(sorted(names), sorted(ENTRY_POINTS['waveform']))
+
+    def test_formatHintKeepsPrecedence(self):
+        """
+        If a file matches multiple formats the format preferred by default is
+        used, regardless of the format detected last within the directory.
+        """
+        filename = getExampleFile('slist.ascii')
+        key = ('waveform', os.path.dirname(filename))
+        func_key = ('waveform', 'TSPAIR', 'isFormat')
+        isTSPAIR = _getPluginFunction('waveform',
+                                      ENTRY_POINTS['waveform']['TSPAIR'],
+                                      'isFormat')
+        # pretend the SLIST file is a valid TSPAIR file as well
+        _PLUGIN_FUNCTIONS[func_key] = lambda filename: True
+        try:
+            _FORMAT_HINTS[key] = 'TSPAIR'
+            _st, format = _readFromPlugin('waveform', filename)
+            self.assertEqual(format, 'SLIST')
+        finally:
+            _PLUGIN_FUNCTIONS[func_key] = isTSPAIR
+            _FORMAT_HINTS.pop(key, None)
+
 
 def suite():
     return unittest.makeSuite(UtilBaseTestCase, 'test')
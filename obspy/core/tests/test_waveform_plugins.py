@@ -2,12 +2,16 @@
 
 from obspy import Trace, read
 from obspy.core.utcdatetime import UTCDateTime
-from obspy.core.util.base import NamedTemporaryFile, _getEntryPoints
+from obspy.core.util.base import NamedTemporaryFile, _getEntryPoints, \
+    getExampleFile
 from pkg_resources import load_entry_point
 import StringIO
 import cStringIO
+import gzip
 import numpy as np
 import os
+import shutil
+import tempfile
 import threading
 import time
 import unittest
@@ -252,6 +256,32 @@ class WaveformPluginsTestCase(unittest.TestCase):
                     os.remove(outfile[:-4] + '.QBN')
                     os.remove(outfile[:-4] + '.QHD')
 
+    def test_readMultipleFilesWithWorkers(self):
+        """
+        Reading multiple files via a thread pool must result in the same
+        Stream with the same trace order as reading them sequentially.
+        """
+        tempdir = tempfile.mkdtemp(prefix='obspy-')
+        try:
+            for i in xrange(12):
+                tr = Trace(data=np.arange(i, 100 + i, dtype='int32'))
+                tr.stats.station = 'ST%02d' % i
+                tr.stats.starttime = UTCDateTime(2012, 1, 1) + i
+                tr.write(os.path.join(tempdir, 'file%02d.gse2' % i),
+                         format='GSE2')
+            pattern = os.path.join(tempdir, '*.gse2')
+            st1 = read(pattern)
+            st2 = read(pattern, workers=4)
+            st3 = read(pattern, workers=4, format='GSE2', headonly=True)
+        finally:
+            shutil.rmtree(tempdir)
+        self.assertEqual(len(st2), 12)
+        self.assertTrue(st1 == st2)
+        self.assertEqual([tr.stats.station for tr in st2],
+                         ['ST%02d' % i for i in xrange(12)])
+        self.assertEqual([tr.stats.station for tr in st3],
+                         ['ST%02d' % i for i in xrange(12)])
+
     def test_issue193(self):
         """
         Test for issue #193: if non-contiguous array is written correctly.
@@ -302,6 +332,22 @@ class WaveformPluginsTestCase(unittest.TestCase):
         st2 = read(os.path.join(path, 'data', 'slist.ascii'))
         self.assertTrue(st1 == st2)
 
+    def test_readGzipMSEEDFile(self):
+        """
+        Tests reading gzip compressed Mini-SEED waveforms, which are passed
+        to the plug-in as file-like object.
+        """
+        filename = getExampleFile('test.mseed')
+        with NamedTemporaryFile(suffix='.mseed.gz') as tf:
+            fh = gzip.GzipFile(fileobj=tf._fileobj, mode='wb')
+            fh.write(open(filename, 'rb').read())
+            fh.close()
+            tf.close()
+            st1 = read(tf.name)
+        st2 = read(filename)
+        self.assertTrue(st1 == st2)
+        self.assertEqual(st1[0].stats._format, 'MSEED')
+
     def test_raiseOnUnknownFormat(self):
         """
         Test case for issue #338:
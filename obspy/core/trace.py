@@ -9,6 +9,7 @@ Module for handling ObsPy Trace objects.
     (http://www.gnu.org/copyleft/lesser.html)
 """
 from copy import deepcopy, copy
+from fractions import Fraction
 from obspy.core.utcdatetime import UTCDateTime
 from obspy.core.util import AttribDict, createEmptyDataChunk
 from obspy.core.util.base import _getFunctionFromEntryPoint
@@ -126,6 +127,9 @@ class Stats(AttribDict):
         4
     """
     readonly = ['endtime']
+    # changed whenever any SEED identifier is set, used for invalidating
+    # cached trace indices (see Stream.select)
+    _id_version = 0
     defaults = {
         'sampling_rate': 1.0,
         'delta': 1.0,
@@ -174,6 +178,8 @@ class Stats(AttribDict):
                 timediff = (self.npts - 1) * delta
             self.__dict__['endtime'] = self.starttime + timediff
             return
+        if key in ('network', 'station', 'location', 'channel'):
+            Stats._id_version += 1
         # prevent a calibration factor of 0
         if key == 'calib' and value == 0:
             msg = 'Calibration factor set to 0.0!'
@@ -196,6 +202,240 @@ class Stats(AttribDict):
         return self._pretty_str(priorized_keys)
 
 
+class CompactStats(Stats):
+    """
+    Memory saving variant of :class:`~obspy.core.trace.Stats`.
+
+    The default attributes are stored in slots instead of an instance
+    dictionary, ``delta`` and ``endtime`` are computed on access instead of
+    on every change of ``starttime``, ``npts`` or ``sampling_rate`` and
+    string SEED identifiers are interned, so traces with the same codes share
+    the same string objects. All other attributes, e.g. format specific
+    sub-dictionaries like ``stats.mseed``, may be taken from a dictionary
+    ``shared`` by many objects. Shared values are never modified, mutable
+    values (dictionaries and lists) are copied to the object on first access.
+
+    A ``CompactStats`` object can be used anywhere a ``Stats`` object is
+    expected, see :meth:`~obspy.core.stream.Stream.compactStats` for
+    converting the headers of all traces of a stream.
+
+    :type header: dict or :class:`~obspy.core.trace.Stats`, optional
+    :param header: Dictionary containing meta information of a single
+        :class:`~obspy.core.trace.Trace` object.
+    :type shared: dict, optional
+    :param shared: Attributes shared with other objects, attributes in
+        ``header`` take precedence. Defaults to the shared attributes of
+        ``header`` if it is a ``CompactStats`` object.
+
+    .. rubric:: Example
+
+    >>> shared = {'mseed': {'encoding': 'STEIM2'}}
+    >>> stats = CompactStats({'network': 'BW', 'npts': 60}, shared=shared)
+    >>> stats.network
+    'BW'
+    >>> stats.endtime
+    UTCDateTime(1970, 1, 1, 0, 0, 59)
+    >>> stats.mseed.encoding = 'STEIM1'
+    >>> shared['mseed']['encoding']
+    'STEIM2'
+    """
+    __slots__ = ('sampling_rate', 'starttime', 'npts', 'calib', 'network',
+                 'station', 'location', 'channel', '_extra', '_shared')
+    _slot_keys = frozenset(__slots__[:8])
+
+    def __init__(self, header={}, shared=None):
+        """
+        """
+        for key in self._slot_keys:
+            object.__setattr__(self, key, self.defaults[key])
+        object.__setattr__(self, '_extra', None)
+        if isinstance(header, CompactStats):
+            if shared is None:
+                shared = header._shared
+            header = header._ownItems()
+        object.__setattr__(self, '_shared', shared)
+        self.update(header)
+
+    @property
+    def delta(self):
+        try:
+            return 1.0 / float(self.sampling_rate)
+        except ZeroDivisionError:
+            return 0
+
+    @property
+    def endtime(self):
+        if self.npts == 0:
+            return self.starttime
+        return self.starttime + (self.npts - 1) * self.delta
+
+    def _ownItems(self):
+        """
+        Returns a dictionary with all attributes not taken from the shared
+        attributes.
+        """
+        items = dict((key, getattr(self, key)) for key in self._slot_keys)
+        if self._extra is not None:
+            items.update(self._extra)
+        return items
+
+    def __getitem__(self, key, default=None):
+        if key in self._slot_keys or key in ('delta', 'endtime'):
+            return object.__getattribute__(self, key)
+        extra = self._extra
+        if extra is not None and key in extra:
+            return extra[key]
+        shared = self._shared
+        if shared is not None and key in shared:
+            value = shared[key]
+            # copy on first access, shared values are never modified
+            if isinstance(value, (dict, list, AttribDict)):
+                value = deepcopy(value)
+                if isinstance(value, dict):
+                    value = AttribDict(value)
+                self._setExtra(key, value)
+            return value
+        if default is None:
+            raise KeyError(key)
+        return default
+
+    def __getattr__(self, key):
+        # unset slots end up here, e.g. during copying
+        if key in self.__slots__:
+            raise AttributeError(key)
+        return self.__getitem__(key)
+
+    def __setitem__(self, key, value):
+        """
+        """
+        if key in self.readonly:
+            msg = 'Attribute "%s" in %s object is read only!'
+            raise AttributeError(msg % (key, self.__class__.__name__))
+        if key == 'delta':
+            key = 'sampling_rate'
+            value = 1.0 / float(value)
+        if key == 'sampling_rate':
+            value = float(value)
+        elif key == 'starttime':
+            value = UTCDateTime(value)
+        elif key == 'npts':
+            value = int(value)
+        elif key in ('network', 'station', 'location', 'channel'):
+            Stats._id_version += 1
+            if type(value) is str:
+                value = intern(value)
+        elif key == 'calib' and value == 0:
+            msg = 'Calibration factor set to 0.0!'
+            warnings.warn(msg, UserWarning)
+        if key in self._slot_keys:
+            object.__setattr__(self, key, value)
+            return
+        if isinstance(value, dict):
+            value = AttribDict(value)
+        self._setExtra(key, value)
+
+    __setattr__ = __setitem__
+
+    def _setExtra(self, key, value):
+        if self._extra is None:
+            object.__setattr__(self, '_extra', {})
+        self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._slot_keys or key in ('delta', 'endtime'):
+            msg = 'Attribute "%s" in %s object can not be deleted!'
+            raise AttributeError(msg % (key, self.__class__.__name__))
+        if self._shared is not None and key in self._shared:
+            # stop sharing instead of modifying the shared attributes
+            shared = dict(self._shared)
+            del shared[key]
+            object.__setattr__(self, '_shared', shared)
+            if self._extra is not None:
+                self._extra.pop(key, None)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    __delattr__ = __delitem__
+
+    def __iter__(self):
+        keys = set(self._slot_keys)
+        keys.update(('delta', 'endtime'))
+        if self._extra is not None:
+            keys.update(self._extra)
+        if self._shared is not None:
+            keys.update(self._shared)
+        return iter(keys)
+
+    def __len__(self):
+        return len(list(self.__iter__()))
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, dict(self.iteritems()))
+
+    def __reduce__(self):
+        # the shared attributes are pickled only once for all objects
+        return (self.__class__, (self._ownItems(), self._shared))
+
+    def copy(self):
+        return self.__class__(self)
+
+    def __deepcopy__(self, *args, **kwargs):  # @UnusedVariable
+        return self.__class__(deepcopy(self._ownItems()), self._shared)
+
+
+def _resamplingFactors(old, new, max_factor=1000):
+    """
+    Returns the integer factors ``(up, down)`` with ``new = old * up / down``
+    or ``None`` if one of the factors would exceed ``max_factor``.
+    """
+    ratio = Fraction(repr(float(new))) / Fraction(repr(float(old)))
+    if ratio.numerator > max_factor or ratio.denominator > max_factor:
+        return None
+    return ratio.numerator, ratio.denominator
+
+
+def _decimationStages(factor, max_factor=16):
+    """
+    Splits an integer decimation factor into stages of at most
+    ``max_factor``, largest stage first.
+
+    The prime factors are distributed over as few stages as possible, e.g.
+    200 is split into ``[10, 10, 2]``. Raises an :class:`ArithmeticError`
+    if ``factor`` has a prime factor above ``max_factor``.
+
+    >>> _decimationStages(200)
+    [10, 10, 2]
+    >>> _decimationStages(12)
+    [12]
+    """
+    primes = []
+    rest = factor
+    prime = 2
+    while prime * prime <= rest:
+        while rest % prime == 0:
+            primes.append(prime)
+            rest //= prime
+        prime += 1
+    if rest > 1:
+        primes.append(rest)
+    if primes and primes[-1] > max_factor:
+        msg = "Decimation factor %d has prime factor %d, automatic filter " + \
+              "design is unstable for decimation factors above %d."
+        raise ArithmeticError(msg % (factor, primes[-1], max_factor))
+    # first fit decreasing: put each prime into the first stage it fits in
+    stages = []
+    for prime in sorted(primes, reverse=True):
+        for i, stage in enumerate(stages):
+            if stage * prime <= max_factor:
+                stages[i] = stage * prime
+                break
+        else:
+            stages.append(prime)
+    return sorted(stages, reverse=True) or [1]
+
+
 class Trace(object):
     """
     An object containing data of a continuous series, such as a seismic trace.
@@ -238,7 +478,10 @@ class Trace(object):
             # KnownIssues#DefaultParameterValuesinPython
             header = {}
         header.setdefault('npts', len(data))
-        self.stats = Stats(header)
+        if isinstance(header, CompactStats):
+            self.stats = CompactStats(header)
+        else:
+            self.stats = Stats(header)
         # set data without changing npts in stats object (for headonly option)
         super(Trace, self).__setattr__('data', data)
 
@@ -333,8 +576,8 @@ class Trace(object):
                 out = out + ' | '\
                       "%(starttime)s - %(endtime)s | " + \
                       "%(sampling_rate).1f Hz, %(npts)d samples"
-        # check for masked array
-        if np.ma.count_masked(self.data):
+        # check for masked array - without loading data of lazy traces
+        if 'data' in self.__dict__ and np.ma.count_masked(self.data):
             out += ' (masked)'
         return trace_id + out % (self.stats)
 
@@ -367,8 +610,63 @@ class Trace(object):
                 msg = "Trace.data must be a NumPy array."
                 ValueError(msg)
             self.stats.npts = len(value)
+        elif key == 'stats':
+            Stats._id_version += 1
         return super(Trace, self).__setattr__(key, value)
 
+    def __getattr__(self, key):
+        """
+        __getattr__ method of Trace object.
+        """
+        # data of traces read with lazy=True is read on first access
+        if key == 'data':
+            loader = self.__dict__.get('_data_loader')
+            if loader is not None:
+                self.data = loader()
+                return self.data
+        msg = "'%s' object has no attribute '%s'"
+        raise AttributeError(msg % (self.__class__.__name__, key))
+
+    def _setDataLoader(self, loader):
+        """
+        Replaces the data by a callable returning the data on first access.
+        """
+        self.__dict__.pop('data', None)
+        self.__dict__['_data_loader'] = loader
+
+    def releaseData(self):
+        """
+        Releases the data of a trace read with ``lazy=True``.
+
+        The data will be read again from the file on next access of
+        ``trace.data``, any changes of the data are lost. The header is reset
+        to the one read from the file as well, so that it matches the data
+        again, e.g. after trimming or resampling the trace. Traces without a
+        file to read from are left unchanged.
+
+        .. rubric:: Example
+
+        >>> from obspy import read
+        >>> st = read("/path/to/BW.BGLD.__.EHE.D.2008.001.first_10_records",
+        ...           lazy=True)
+        >>> tr = st[0]
+        >>> tr.data[:3]
+        array([-363, -382, -388], dtype=int32)
+        >>> tr.data[0] = 0
+        >>> tr.trim(tr.stats.starttime + 5, tr.stats.starttime + 10)
+        >>> tr.stats.npts
+        1001
+        >>> tr.releaseData()
+        >>> tr.stats.npts
+        4120
+        >>> tr.data[:3]
+        array([-363, -382, -388], dtype=int32)
+        """
+        loader = self.__dict__.get('_data_loader')
+        if loader is not None:
+            self.__dict__.pop('data', None)
+            self.stats = loader.stats.copy()
+
     def __getitem__(self, index):
         """
         __getitem__ method of Trace object.
@@ -1311,22 +1609,33 @@ class Trace(object):
         self._addProcessingInfo(proc_info)
 
     def resample(self, sampling_rate, window='hanning', no_filter=True,
-                 strict_length=False):
+                 strict_length=False, method='fft', fast_length=False):
         """
-        Resample trace data using Fourier method.
+        Resample trace data using Fourier method or a polyphase filter.
 
         :type sampling_rate: float
         :param sampling_rate: The sampling rate of the resampled signal.
         :type window: array_like, callable, string, float, or tuple, optional
         :param window: Specifies the window applied to the signal in the
             Fourier domain. Defaults to ``'hanning'`` window. See
-            :func:`scipy.signal.resample` for details.
+            :func:`scipy.signal.resample` for details. Only used by
+            ``method='fft'``.
         :type no_filter: bool, optional
         :param no_filter: Deactivates automatic filtering if set to ``True``.
             Defaults to ``True``.
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which endtime of trace
             would change. Defaults to ``False``.
+        :type method: ``'fft'`` or ``'polyphase'``, optional
+        :param method: Resampling method, see below. Defaults to ``'fft'``.
+        :type fast_length: bool, optional
+        :param fast_length: Zero pads the data to a length with only prime
+            factors 2, 3 and 5 before the Fourier transform of
+            ``method='fft'``. This considerably speeds up resampling of long
+            traces whose length has large prime factors, but the padding
+            slightly changes the samples close to the end of the trace.
+            Ignored if the ratio of the sampling rates can not be expressed by
+            integer factors up to 1000. Defaults to ``False``.
 
         .. note::
 
@@ -1337,8 +1646,16 @@ class Trace(object):
             This also makes an entry with information on the applied processing
             in ``stats.processing`` of this trace.
 
-        Uses :func:`scipy.signal.resample`. Because a Fourier method is used,
-        the signal is assumed to be periodic.
+        ``method='fft'`` uses :func:`scipy.signal.resample`. Because a Fourier
+        method is used, the signal is assumed to be periodic.
+
+        ``method='polyphase'`` uses
+        :func:`~obspy.signal.filter.polyphaseResample`, upsampling and
+        downsampling the data by the integer factors given by the ratio of
+        the sampling rates using a Kaiser windowed FIR filter. Costs and
+        memory grow linearly with the length of the trace, which makes it the
+        preferable method for long traces, e.g. 100 Hz to 40 Hz conversions of
+        day-long records. Both factors are limited to 1000.
 
         .. rubric:: Example
 
@@ -1356,6 +1673,14 @@ class Trace(object):
         array([ 0.5       ,  0.40432914,  0.3232233 ,  0.26903012,  0.25 ...
         """
         from scipy.signal import resample
+        if method not in ('fft', 'polyphase'):
+            msg = "Unknown resampling method '%s'." % method
+            raise ValueError(msg)
+        factors = _resamplingFactors(self.stats.sampling_rate, sampling_rate)
+        if method == 'polyphase' and factors is None:
+            msg = "Ratio of sampling rates can not be expressed by " + \
+                  "integer factors up to 1000, use method='fft'."
+            raise ValueError(msg)
         factor = self.stats.sampling_rate / float(sampling_rate)
         # check if endtime changes and this is not explicitly allowed
         if strict_length and len(self.data) % factor != 0.0:
@@ -1373,13 +1698,30 @@ class Trace(object):
             self.filter('lowpassCheby2', freq=freq, maxorder=12)
         # resample
         num = int(self.stats.npts / factor)
-        self.data = resample(self.data, num, window=window)
+        if method == 'polyphase':
+            from obspy.signal.filter import polyphaseResample
+            up, down = factors
+            self.data = polyphaseResample(self.data, up, down)[:num]
+            proc_info = "resample:%d:polyphase:%d/%d" % (sampling_rate, up,
+                                                         down)
+        elif fast_length and factors is not None:
+            from obspy.signal.util import nextFastLength
+            # padded length has to be resampled to an integer length
+            up, down = factors
+            npts = nextFastLength(self.stats.npts, down)
+            data = np.zeros(npts, dtype=self.data.dtype)
+            data[:self.stats.npts] = self.data
+            self.data = resample(data, npts * up // down, window=window)[:num]
+            proc_info = "resample:%d:%s" % (sampling_rate, window)
+        else:
+            self.data = resample(self.data, num, window=window)
+            proc_info = "resample:%d:%s" % (sampling_rate, window)
         self.stats.sampling_rate = sampling_rate
         # add processing information to the stats dictionary
-        proc_info = "resample:%d:%s" % (sampling_rate, window)
         self._addProcessingInfo(proc_info)
 
-    def decimate(self, factor, no_filter=False, strict_length=False):
+    def decimate(self, factor, no_filter=False, strict_length=False,
+                 multistage=False):
         """
         Downsample trace data by an integer factor.
 
@@ -1392,6 +1734,10 @@ class Trace(object):
         :type strict_length: bool, optional
         :param strict_length: Leave traces unchanged for which endtime of trace
             would change. Defaults to ``False``.
+        :type multistage: bool, optional
+        :param multistage: Splits the decimation factor into several stages
+            of at most 16, each with its own anti-alias filter. Defaults to
+            ``False``.
 
         Currently a simple integer decimation is implemented.
         Only every ``decimation_factor``-th sample remains in the trace, all
@@ -1404,6 +1750,16 @@ class Trace(object):
         abort downsampling in case of changing endtimes set
         ``strict_length=True``.
 
+        The automatic filter design is only stable for decimation factors up
+        to 16. Larger factors, e.g. 200 for 200 Hz to 1 Hz, can be applied
+        with ``multistage=True``: the factor is split into its prime factors,
+        which are combined to as few stages of at most 16 as possible (200 is
+        decimated by 10, 10 and 2). Every stage is lowpass filtered at its own
+        Nyquist frequency and decimated before the next stage, so the later
+        filters run on much less data. The number of samples is the same as
+        for a single stage decimation. Factors with prime factors above 16
+        can not be decimated with automatic filtering.
+
         .. note::
 
             This operation is performed in place on the actual data arrays. The
@@ -1411,7 +1767,8 @@ class Trace(object):
             original data, use :meth:`~obspy.core.trace.Trace.copy` to create
             a copy of your trace object.
             This also makes an entry with information on the applied processing
-            in ``stats.processing`` of this trace.
+            in ``stats.processing`` of this trace, one for the filter and
+            decimation of every stage.
 
         .. rubric:: Example
 
@@ -1434,6 +1791,14 @@ class Trace(object):
             msg = "Endtime of trace would change and strict_length=True."
             raise ValueError(msg)
 
+        # decimate stage by stage, each with its own anti-alias filter
+        if multistage and not no_filter:
+            stages = _decimationStages(factor)
+            if len(stages) > 1:
+                for stage in stages:
+                    self.decimate(stage)
+                return
+
         # do automatic lowpass filtering
         if not no_filter:
             # be sure filter still behaves good
@@ -8,11 +8,168 @@ Module containing a UTC-based datetime class.
     GNU Lesser General Public License, Version 3
     (http://www.gnu.org/copyleft/lesser.html)
 """
+from obspy.core.util.types import OrderedDict
+from operator import truediv
 import datetime
+import numpy as np
+import re
+import threading
 import time
 
 
 TIMESTAMP0 = datetime.datetime(1970, 1, 1)
+# nanoseconds per second
+NS = 1000000000
+# proleptic Gregorian ordinal of the epoch
+ORDINAL0 = TIMESTAMP0.toordinal()
+# range of the int64 nanoseconds of UTCDateTimeArray as full seconds and
+# nanoseconds
+_NS_MIN = divmod(-2 ** 63, NS)
+_NS_MAX = divmod(2 ** 63 - 1, NS)
+
+# maximal number of parsed time strings kept in the time string cache
+TIME_CACHE_SIZE = 4096
+_TIME_CACHE = OrderedDict()
+_TIME_CACHE_INFO = {'hits': 0, 'misses': 0}
+_TIME_CACHE_LOCK = threading.Lock()
+
+# fixed layouts parsed without guessing a pattern: ISO8601 calendar dates
+# YYYY-MM-DD[Thh:mm:ss[.fffffffff]][Z] and SEED times YYYY,DDD[,hh:mm:ss.ffff]
+_ISO8601_FIXED = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):'
+                            r'(\d{2})(?:\.(\d{1,9}))?Z?)?$')
+_SEED_FIXED = re.compile(r'(\d{4}),(\d{3})'
+                         r'(?:,(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?)?$')
+
+
+def _floatToNs(value):
+    """
+    Returns the nearest integer number of nanoseconds of a float number of
+    seconds.
+    """
+    # splitting off the full seconds is exact, rounding only the fraction
+    # keeps the precision of large timestamps
+    seconds = int(value)
+    return seconds * NS + int(round((value - seconds) * NS))
+
+
+def _secondsToNs(value):
+    """
+    Returns the integer number of nanoseconds of a time span given as int,
+    float or :class:`datetime.timedelta`.
+    """
+    if type(value) is float:
+        return _floatToNs(value)
+    if type(value) in (int, long):
+        return value * NS
+    if isinstance(value, datetime.timedelta):
+        return ((value.days * 86400 + value.seconds) * 1000000 +
+                value.microseconds) * 1000
+    if isinstance(value, (basestring, UTCDateTime)):
+        msg = "unsupported time span type: '%s'" % type(value).__name__
+        raise TypeError(msg)
+    return _floatToNs(float(value))
+
+
+def _parseFixedTime(value):
+    """
+    Returns the nanoseconds of a time string in one of the fixed ISO8601 or
+    SEED layouts or ``None`` if the string has to be parsed by guessing its
+    pattern.
+    """
+    match = _ISO8601_FIXED.match(value)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        ordinal = datetime.date(int(year), int(month), int(day)).toordinal()
+    else:
+        match = _SEED_FIXED.match(value)
+        if not match:
+            return None
+        year, julday, hour, minute, second, fraction = match.groups()
+        year, julday = int(year), int(julday)
+        days = 366 if year % 4 == 0 and \
+            (year % 100 != 0 or year % 400 == 0) else 365
+        if not 1 <= julday <= days:
+            return None
+        ordinal = datetime.date(year, 1, 1).toordinal() + julday - 1
+    seconds = (ordinal - ORDINAL0) * 86400
+    if hour is not None:
+        hour, minute, second = int(hour), int(minute), int(second)
+        if hour > 23 or minute > 59 or second > 59:
+            return None
+        seconds += hour * 3600 + minute * 60 + second
+    ns = seconds * NS
+    if fraction:
+        ns += int(fraction.ljust(9, '0'))
+    return ns
+
+
+def _timeStringToNs(value):
+    """
+    Returns the nanoseconds of the given time string using the time string
+    cache.
+
+    The least recently used strings are dropped if more than
+    ``TIME_CACHE_SIZE`` strings are cached.
+    """
+    with _TIME_CACHE_LOCK:
+        try:
+            ns = _TIME_CACHE.pop(value)
+        except KeyError:
+            pass
+        else:
+            _TIME_CACHE[value] = ns
+            _TIME_CACHE_INFO['hits'] += 1
+            return ns
+    ns = _parseFixedTime(value.strip())
+    if ns is None:
+        dt = UTCDateTime.__new__(UTCDateTime)
+        dt._fromString(value)
+        ns = dt._ns
+    with _TIME_CACHE_LOCK:
+        _TIME_CACHE_INFO['misses'] += 1
+        _TIME_CACHE[value] = ns
+        while len(_TIME_CACHE) > max(TIME_CACHE_SIZE, 0):
+            _TIME_CACHE.popitem(last=False)
+    return ns
+
+
+def timeCacheInfo():
+    """
+    Returns statistics of the time string cache.
+
+    Creating a :class:`UTCDateTime` object from a string caches the parsed
+    time, so readers of formats repeating the same time strings many times,
+    e.g. QuakeML or Dataless SEED, parse each string only once.
+
+    :rtype: dict
+    :return: Dictionary with the number of cache ``hits`` and ``misses``,
+        the number of currently cached strings (``size``) and the maximal
+        number of cached strings (``maxsize``).
+
+    .. rubric:: Example
+
+    >>> clearTimeCache()
+    >>> for _i in range(3):
+    ...     dt = UTCDateTime("2009-12-31T12:23:34.5Z")
+    >>> sorted(timeCacheInfo().items())
+    [('hits', 2), ('maxsize', 4096), ('misses', 1), ('size', 1)]
+    """
+    with _TIME_CACHE_LOCK:
+        info = dict(_TIME_CACHE_INFO)
+        info['size'] = len(_TIME_CACHE)
+    info['maxsize'] = TIME_CACHE_SIZE
+    return info
+
+
+def clearTimeCache():
+    """
+    Removes all strings from the time string cache and resets its
+    statistics.
+    """
+    with _TIME_CACHE_LOCK:
+        _TIME_CACHE.clear()
+        _TIME_CACHE_INFO['hits'] = 0
+        _TIME_CACHE_INFO['misses'] = 0
 
 
 class UTCDateTime(object):
@@ -22,10 +179,10 @@ class UTCDateTime(object):
     This datetime class is based on the POSIX time, a system for describing
     instants in time, defined as the number of seconds elapsed since midnight
     Coordinated Universal Time (UTC) of Thursday, January 1, 1970. Using a
-    single float timestamp allows higher precision as the default Python
-    :class:`datetime.datetime` class. It features the full `ISO8601:2004`_
-    specification and some additional string patterns during object
-    initialization.
+    single integer number of nanoseconds allows higher precision as the
+    default Python :class:`datetime.datetime` class. It features the full
+    `ISO8601:2004`_ specification and some additional string patterns during
+    object initialization.
 
     :type args: int, float, string, :class:`datetime.datetime`, optional
     :param args: The creation of a new `UTCDateTime` object depends from the
@@ -44,6 +201,13 @@ class UTCDateTime(object):
         instead uses timestamp as a single floating point value which allows
         higher precision.
 
+    .. versionchanged:: dev
+        The time is stored as integer number of nanoseconds since
+        1970-01-01T00:00:00Z, see :attr:`ns`. The float ``timestamp`` is
+        derived from it. Arithmetic and comparisons of UTCDateTime objects
+        are exact integer operations, time spans and timestamps are rounded
+        to full nanoseconds.
+
     .. rubric:: Supported Operations
 
     ``UTCDateTime = UTCDateTime + delta``
@@ -199,7 +363,7 @@ class UTCDateTime(object):
 
     .. _ISO8601:2004: http://en.wikipedia.org/wiki/ISO_8601
     """
-    timestamp = 0.0
+    _ns = 0
     DEFAULT_PRECISION = 6
 
     def __init__(self, *args, **kwargs):
@@ -207,20 +371,35 @@ class UTCDateTime(object):
         Creates a new UTCDateTime object.
         """
         # set default precision
-        self.precision = kwargs.pop('precision', self.DEFAULT_PRECISION)
+        self.__precision = int(kwargs.pop('precision', self.DEFAULT_PRECISION))
+        # fast paths for UTCDateTime objects and timestamps
+        if len(args) == 1 and not kwargs:
+            value = args[0]
+            if isinstance(value, UTCDateTime):
+                self._ns = value._ns
+                return
+            elif type(value) is float:
+                self._ns = _floatToNs(value)
+                return
+            elif type(value) in (int, long):
+                self._ns = value * NS
+                return
+            elif isinstance(value, basestring):
+                self._ns = _timeStringToNs(value)
+                return
         # iso8601 flag
         iso8601 = kwargs.pop('iso8601', False) == True
         # check parameter
         if len(args) == 0 and len(kwargs) == 0:
             # use current time if no time is given
-            self.timestamp = time.time()
+            self._ns = _floatToNs(time.time())
             return
         elif len(args) == 1 and len(kwargs) == 0:
             value = args[0]
             # check types
             try:
                 # got a timestamp
-                self.timestamp = value.__float__()
+                self._ns = _floatToNs(value.__float__())
                 return
             except:
                 pass
@@ -235,66 +414,7 @@ class UTCDateTime(object):
                 return
             elif isinstance(value, basestring):
                 # got a string instance
-                value = value.strip()
-                # check for ISO8601 date string
-                if value.count("T") == 1 or iso8601:
-                    try:
-                        self.timestamp = self._parseISO8601(value).timestamp
-                        return
-                    except:
-                        if iso8601:
-                            raise
-                # try to apply some standard patterns
-                value = value.replace('T', ' ')
-                value = value.replace('_', ' ')
-                value = value.replace('-', ' ')
-                value = value.replace(':', ' ')
-                value = value.replace(',', ' ')
-                value = value.replace('Z', ' ')
-                value = value.replace('W', ' ')
-                # check for ordinal date (julian date)
-                parts = value.split(' ')
-                # check for patterns
-                if len(parts) == 1 and len(value) == 7 and value.isdigit():
-                    # looks like an compact ordinal date string
-                    pattern = "%Y%j"
-                elif len(parts) > 1 and len(parts[1]) == 3 and \
-                   parts[1].isdigit():
-                    # looks like an ordinal date string
-                    value = ''.join(parts)
-                    if len(parts) > 2:
-                        pattern = "%Y%j%H%M%S"
-                    else:
-                        pattern = "%Y%j"
-                else:
-                    # some parts should have 2 digits
-                    for i in range(1, min(len(parts), 6)):
-                        if len(parts[i]) == 1:
-                            parts[i] = '0' + parts[i]
-                    # standard date string
-                    value = ''.join(parts)
-                    if len(value) > 8:
-                        pattern = "%Y%m%d%H%M%S"
-                    else:
-                        pattern = "%Y%m%d"
-                ms = 0
-                if '.' in value:
-                    parts = value.split('.')
-                    value = parts[0].strip()
-                    try:
-                        ms = float('.' + parts[1].strip())
-                    except:
-                        pass
-                # The module copy.deepcopy passes a (binary) string to
-                # UTCDateTime which contains the class specifications. If
-                # argument is not a digit by now, it must be a binary string
-                # and we pass it to datetime.datetime,
-                if not ''.join(parts).isdigit():
-                    dt = datetime.datetime(*args, **kwargs)
-                    self._fromDateTime(dt)
-                    return
-                dt = datetime.datetime.strptime(value, pattern)
-                self._fromDateTime(dt, ms)
+                self._fromString(value, iso8601)
                 return
         # check for ordinal/julian date kwargs
         if 'julday' in kwargs:
@@ -323,6 +443,72 @@ class UTCDateTime(object):
         dt = datetime.datetime(*args, **kwargs)
         self._fromDateTime(dt)
 
+    def _fromString(self, value, iso8601=False):
+        """
+        Parses a time string guessing its pattern.
+        """
+        string = value
+        value = value.strip()
+        # check for ISO8601 date string
+        if value.count("T") == 1 or iso8601:
+            try:
+                self._ns = self._parseISO8601(value)._ns
+                return
+            except:
+                if iso8601:
+                    raise
+        # try to apply some standard patterns
+        value = value.replace('T', ' ')
+        value = value.replace('_', ' ')
+        value = value.replace('-', ' ')
+        value = value.replace(':', ' ')
+        value = value.replace(',', ' ')
+        value = value.replace('Z', ' ')
+        value = value.replace('W', ' ')
+        # check for ordinal date (julian date)
+        parts = value.split(' ')
+        # check for patterns
+        if len(parts) == 1 and len(value) == 7 and value.isdigit():
+            # looks like an compact ordinal date string
+            pattern = "%Y%j"
+        elif len(parts) > 1 and len(parts[1]) == 3 and \
+           parts[1].isdigit():
+            # looks like an ordinal date string
+            value = ''.join(parts)
+            if len(parts) > 2:
+                pattern = "%Y%j%H%M%S"
+            else:
+                pattern = "%Y%j"
+        else:
+            # some parts should have 2 digits
+            for i in range(1, min(len(parts), 6)):
+                if len(parts[i]) == 1:
+                    parts[i] = '0' + parts[i]
+            # standard date string
+            value = ''.join(parts)
+            if len(value) > 8:
+                pattern = "%Y%m%d%H%M%S"
+            else:
+                pattern = "%Y%m%d"
+        ms = 0
+        if '.' in value:
+            parts = value.split('.')
+            value = parts[0].strip()
+            try:
+                ms = float('.' + parts[1].strip())
+            except:
+                pass
+        # The module copy.deepcopy passes a (binary) string to
+        # UTCDateTime which contains the class specifications. If
+        # argument is not a digit by now, it must be a binary string
+        # and we pass it to datetime.datetime,
+        if not ''.join(parts).isdigit():
+            dt = datetime.datetime(string)
+            self._fromDateTime(dt)
+            return
+        dt = datetime.datetime.strptime(value, pattern)
+        self._fromDateTime(dt, ms)
+
     def _set(self, **kwargs):
         """
         Sets current timestamp using kwargs.
@@ -336,12 +522,12 @@ class UTCDateTime(object):
         microsecond = kwargs.get('microsecond', self.microsecond)
         julday = kwargs.get('julday', None)
         if julday:
-            self.timestamp = UTCDateTime(year=year, julday=julday, hour=hour,
-                                         minute=minute, second=second,
-                                         microsecond=microsecond).timestamp
+            self._ns = UTCDateTime(year=year, julday=julday, hour=hour,
+                                   minute=minute, second=second,
+                                   microsecond=microsecond)._ns
         else:
-            self.timestamp = UTCDateTime(year, month, day, hour, minute,
-                                         second, microsecond).timestamp
+            self._ns = UTCDateTime(year, month, day, hour, minute,
+                                   second, microsecond)._ns
 
     def _fromDateTime(self, dt, ms=0):
         """
@@ -352,10 +538,30 @@ class UTCDateTime(object):
         :type ms: float
         :param ms: extra seconds to add to current UTCDateTime object.
         """
-        # see datetime.timedelta.total_seconds
-        td = (dt - TIMESTAMP0)
-        self.timestamp = (td.microseconds + (td.seconds + td.days * 86400) * \
-                          1000000) / 1000000.0 + ms
+        self._ns = _secondsToNs(dt - TIMESTAMP0)
+        if ms:
+            self._ns += _floatToNs(ms)
+
+    @staticmethod
+    def _fromNs(ns):
+        """
+        Creates a new UTCDateTime object with default precision from integer
+        nanoseconds without parsing any arguments.
+        """
+        obj = object.__new__(UTCDateTime)
+        obj._ns = ns
+        obj.__precision = UTCDateTime.DEFAULT_PRECISION
+        return obj
+
+    def __setstate__(self, state):
+        """
+        Restores pickled objects, including those storing a float timestamp.
+        """
+        state = dict(state)
+        if 'timestamp' in state:
+            state['_ns'] = _floatToNs(state.pop('timestamp'))
+        state.pop('_UTCDateTime__ms_pattern', None)
+        self.__dict__.update(state)
 
     @staticmethod
     def _parseISO8601(value):
@@ -449,7 +655,36 @@ class UTCDateTime(object):
         >>> dt.timestamp
         1222864235.123456
         """
-        return self.timestamp
+        # integer true division is correctly rounded
+        return truediv(self._ns, NS)
+
+    def _setTimeStamp(self, value):
+        """
+        Sets UTC timestamp in seconds.
+
+        :type value: int or float
+        :param value: Timestamp in seconds, rounded to full nanoseconds.
+        """
+        self._ns = _secondsToNs(value)
+
+    timestamp = property(_getTimeStamp, _setTimeStamp)
+
+    def _getNs(self):
+        """
+        Returns UTC timestamp in nanoseconds.
+
+        :rtype: int
+        :return: Timestamp in integer nanoseconds.
+
+        .. rubric:: Example
+
+        >>> dt = UTCDateTime(2008, 10, 1, 12, 30, 35, 123456)
+        >>> dt.ns
+        1222864235123456000
+        """
+        return self._ns
+
+    ns = property(_getNs)
 
     def __float__(self):
         """
@@ -464,7 +699,7 @@ class UTCDateTime(object):
         >>> float(dt)
         1222864235.123456
         """
-        return self.timestamp
+        return truediv(self._ns, NS)
 
     def _getDateTime(self):
         """
@@ -479,7 +714,8 @@ class UTCDateTime(object):
         >>> dt.datetime
         datetime.datetime(2008, 10, 1, 12, 30, 35, 45020)
         """
-        return datetime.datetime.utcfromtimestamp(self.timestamp)
+        # rounded to full microseconds
+        return TIMESTAMP0 + datetime.timedelta(0, 0, (self._ns + 500) // 1000)
 
     datetime = property(_getDateTime)
 
@@ -730,7 +966,7 @@ class UTCDateTime(object):
         >>> dt
         UTCDateTime(2012, 2, 11, 10, 11, 20)
         """
-        self.timestamp += value - self.second
+        self._ns += _secondsToNs(value - self.second)
 
     second = property(_getSecond, _setSecond)
 
@@ -834,11 +1070,7 @@ class UTCDateTime(object):
         >>> UTCDateTime(1970, 1, 1, 0, 0) + 1.123456
         UTCDateTime(1970, 1, 1, 0, 0, 1, 123456)
         """
-        if isinstance(value, datetime.timedelta):
-            # see datetime.timedelta.total_seconds
-            value = (value.microseconds + (value.seconds + value.days * \
-                86400) * 1000000) / 1000000.0
-        return UTCDateTime(self.timestamp + value)
+        return UTCDateTime._fromNs(self._ns + _secondsToNs(value))
 
     def __sub__(self, value):
         """
@@ -863,12 +1095,8 @@ class UTCDateTime(object):
         86400.0
         """
         if isinstance(value, UTCDateTime):
-            return round(self.timestamp - value.timestamp, self.__precision)
-        elif isinstance(value, datetime.timedelta):
-            # see datetime.timedelta.total_seconds
-            value = (value.microseconds + (value.seconds + value.days * \
-                86400) * 1000000) / 1000000.0
-        return UTCDateTime(self.timestamp - value)
+            return round(truediv(self._ns - value._ns, NS), self.__precision)
+        return UTCDateTime._fromNs(self._ns - _secondsToNs(value))
 
     def __str__(self):
         """
@@ -882,8 +1110,18 @@ class UTCDateTime(object):
         >>> str(dt)
         '2008-10-01T12:30:35.045020Z'
         """
-        return "%s%sZ" % (self.strftime('%Y-%m-%dT%H:%M:%S'),
-                          (self.__ms_pattern % (abs(self.timestamp % 1)))[1:])
+        precision = self.__precision
+        ns = self._ns
+        if precision < 9:
+            # round to the given precision, may carry over to the seconds
+            unit = 10 ** (9 - precision)
+            ns = (ns + unit // 2) // unit * unit
+        seconds, fraction = divmod(ns, NS)
+        dt = TIMESTAMP0 + datetime.timedelta(0, seconds)
+        if precision <= 0:
+            return "%sZ" % dt.strftime('%Y-%m-%dT%H:%M:%S')
+        fraction = ("%09d" % fraction).ljust(precision, '0')[:precision]
+        return "%s.%sZ" % (dt.strftime('%Y-%m-%dT%H:%M:%S'), fraction)
 
     def __unicode__(self):
         """
@@ -925,9 +1163,16 @@ class UTCDateTime(object):
         False
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) == 0
-        except (TypeError, ValueError):
-            return False
+            diff = self._ns - other._ns
+        except AttributeError:
+            if isinstance(other, UTCDateTimeArray):
+                return NotImplemented
+            try:
+                return round(self.timestamp - float(other),
+                             self.__precision) == 0
+            except (TypeError, ValueError):
+                return False
+        return 2 * abs(diff) < self._tolerance()
 
     def __ne__(self, other):
         """
@@ -954,7 +1199,10 @@ class UTCDateTime(object):
         >>> t1 != t2
         True
         """
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
     def __lt__(self, other):
         """
@@ -982,9 +1230,16 @@ class UTCDateTime(object):
         True
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) < 0
-        except (TypeError, ValueError):
-            return False
+            diff = self._ns - other._ns
+        except AttributeError:
+            if isinstance(other, UTCDateTimeArray):
+                return NotImplemented
+            try:
+                return round(self.timestamp - float(other),
+                             self.__precision) < 0
+            except (TypeError, ValueError):
+                return False
+        return -2 * diff >= self._tolerance()
 
     def __le__(self, other):
         """
@@ -1012,9 +1267,16 @@ class UTCDateTime(object):
         False
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) <= 0
-        except (TypeError, ValueError):
-            return False
+            diff = self._ns - other._ns
+        except AttributeError:
+            if isinstance(other, UTCDateTimeArray):
+                return NotImplemented
+            try:
+                return round(self.timestamp - float(other),
+                             self.__precision) <= 0
+            except (TypeError, ValueError):
+                return False
+        return 2 * diff < self._tolerance()
 
     def __gt__(self, other):
         """
@@ -1042,9 +1304,16 @@ class UTCDateTime(object):
         True
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) > 0
-        except (TypeError, ValueError):
-            return False
+            diff = self._ns - other._ns
+        except AttributeError:
+            if isinstance(other, UTCDateTimeArray):
+                return NotImplemented
+            try:
+                return round(self.timestamp - float(other),
+                             self.__precision) > 0
+            except (TypeError, ValueError):
+                return False
+        return 2 * diff >= self._tolerance()
 
     def __ge__(self, other):
         """
@@ -1072,9 +1341,26 @@ class UTCDateTime(object):
         False
         """
         try:
-            return round(self.timestamp - float(other), self.__precision) >= 0
-        except (TypeError, ValueError):
-            return False
+            diff = self._ns - other._ns
+        except AttributeError:
+            if isinstance(other, UTCDateTimeArray):
+                return NotImplemented
+            try:
+                return round(self.timestamp - float(other),
+                             self.__precision) >= 0
+            except (TypeError, ValueError):
+                return False
+        return -2 * diff < self._tolerance()
+
+    def _tolerance(self):
+        """
+        Returns the difference in nanoseconds below which two times are equal
+        within the precision of this object.
+        """
+        precision = self.__precision
+        if precision >= 9:
+            return 1
+        return 10 ** (9 - precision)
 
     def __repr__(self):
         """
@@ -1087,7 +1373,7 @@ class UTCDateTime(object):
         Returns absolute timestamp value of the current UTCDateTime object.
         """
         # needed for unittest.assertAlmostEqual tests on linux
-        return abs(self.timestamp)
+        return abs(truediv(self._ns, NS))
 
     def strftime(self, format):
         """
@@ -1379,7 +1665,6 @@ class UTCDateTime(object):
             12
         """
         self.__precision = int(value)
-        self.__ms_pattern = "%%0.%df" % (self.__precision)
 
     precision = property(_getPrecision, _setPrecision)
 
@@ -1414,6 +1699,473 @@ class UTCDateTime(object):
         return UTCDateTime()
 
 
+def _daysFromCivil(year, month, day):
+    """
+    Returns the days since 1970-01-01 of the given proleptic Gregorian dates.
+
+    Works on integer NumPy arrays, see
+    http://howardhinnant.github.io/date_algorithms.html
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _civilFromDays(days):
+    """
+    Returns year, month and day of the given days since 1970-01-01.
+
+    Inverse of :func:`_daysFromCivil`, works on integer NumPy arrays.
+    """
+    days = days + 719468
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + np.where(mp < 10, 3, -9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _digits(values, width):
+    """
+    Returns the ASCII codes of the zero padded decimal digits of the given
+    non-negative integers as array of shape ``(len(values), width)``.
+    """
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype='int64')
+    return (values[:, np.newaxis] // powers % 10 + 48).astype('uint8')
+
+
+def _joinColumns(parts, lengths=None):
+    """
+    Joins the given ASCII code arrays and separator strings column wise to a
+    list of strings, optionally cut to the given lengths per row.
+    """
+    npts = len(parts[0])
+    columns = []
+    for part in parts:
+        if isinstance(part, str):
+            part = np.tile(np.array(map(ord, part), dtype='uint8'),
+                           (npts, 1))
+        columns.append(part)
+    chars = np.hstack(columns)
+    strings = chars.view('S%d' % chars.shape[1]).ravel().tolist()
+    if lengths is None:
+        return strings
+    return [string[:length] for string, length in zip(strings, lengths)]
+
+
+def _parseFixedLayout(strings):
+    """
+    Parses ISO8601 strings of the fixed layout ``YYYY-MM-DD`` or
+    ``YYYY-MM-DDThh:mm:ss[.fffffffff][Z]`` at once.
+
+    Returns the nanoseconds and a boolean array marking the successfully
+    parsed strings; all others have to be parsed one by one.
+    """
+    strings = [string.strip().rstrip('Z') for string in strings]
+    try:
+        array = np.array(strings, dtype='S')
+    except UnicodeError:
+        return np.zeros(len(strings), dtype='int64'), \
+            np.zeros(len(strings), dtype='bool')
+    width = max(array.dtype.itemsize, 20)
+    chars = np.zeros((len(strings), width), dtype='uint8')
+    chars[:, :array.dtype.itemsize] = \
+        array.view('uint8').reshape(len(strings), -1)
+    lengths = np.array([len(string) for string in strings])
+    isdigit = (chars >= 48) & (chars <= 57)
+    digit = np.where(isdigit, chars.astype('int64') - 48, 0)
+
+    def number(start, stop):
+        value = np.zeros(len(strings), dtype='int64')
+        for i in xrange(start, stop):
+            value = value * 10 + digit[:, i]
+        return value
+
+    date_ok = isdigit[:, [0, 1, 2, 3, 5, 6, 8, 9]].all(axis=1) & \
+        (chars[:, 4] == ord('-')) & (chars[:, 7] == ord('-'))
+    time_ok = isdigit[:, [11, 12, 14, 15, 17, 18]].all(axis=1) & \
+        ((chars[:, 10] == ord('T')) | (chars[:, 10] == ord(' '))) & \
+        (chars[:, 13] == ord(':')) & (chars[:, 16] == ord(':'))
+    # fraction of seconds: all characters after the dot are digits
+    columns = np.arange(width)
+    fraction = (columns >= 20) & (columns < 29)
+    after_dot = fraction & (columns < lengths[:, np.newaxis])
+    fraction_ok = (lengths > 20) & (lengths <= 29) & \
+        (chars[:, 19] == ord('.')) & (isdigit | ~after_dot).all(axis=1)
+    ok = date_ok & ((lengths == 10) |
+                    (time_ok & ((lengths == 19) | fraction_ok)))
+    year, month, day = number(0, 4), number(5, 7), number(8, 10)
+    hour, minute, second = number(11, 13), number(14, 16), number(17, 19)
+    # invalid dates would silently roll over, e.g. February 30
+    days = _daysFromCivil(year, month, day)
+    check = _civilFromDays(days)
+    ok &= (month >= 1) & (month <= 12) & (check[1] == month) & \
+        (check[2] == day) & (hour < 24) & (minute < 60) & (second < 60)
+    seconds = ((days * 24 + hour) * 60 + minute) * 60 + second
+    fraction = np.zeros(len(strings), dtype='int64')
+    if width > 20:
+        weights = 10 ** np.clip(28 - columns[20:], 0, 8).astype('int64')
+        weights[columns[20:] >= 29] = 0
+        fraction = digit[:, 20:].dot(weights)
+    _checkNsRange(seconds[ok], fraction[ok])
+    return seconds * NS + fraction, ok
+
+
+def _checkNsRange(seconds, fraction=0):
+    """
+    Raises an OverflowError if any time given as full seconds and
+    nanoseconds ``0 <= fraction < NS`` is out of the int64 nanosecond range.
+    """
+    out_of_range = (seconds < _NS_MIN[0]) | (seconds > _NS_MAX[0]) | \
+        ((seconds == _NS_MIN[0]) & (fraction < _NS_MIN[1])) | \
+        ((seconds == _NS_MAX[0]) & (fraction > _NS_MAX[1]))
+    if np.any(out_of_range):
+        raise _rangeError()
+
+
+def _rangeError():
+    """
+    Returns the error for times out of the range of UTCDateTimeArray.
+    """
+    msg = "UTCDateTimeArray only supports times from " + \
+        "1677-09-21T00:12:43.145224192 to 2262-04-11T23:47:16.854775807."
+    return OverflowError(msg)
+
+
+def _floatsToNs(values):
+    """
+    Vectorized version of :func:`_floatToNs` for float arrays.
+    """
+    # values beyond the int64 range would silently wrap around
+    if not (np.abs(values) < -_NS_MIN[0]).all():
+        raise _rangeError()
+    seconds = np.trunc(values).astype('int64')
+    fraction = (values - seconds) * NS
+    # round half away from zero like the built-in round()
+    fraction = np.where(fraction >= 0, np.floor(fraction + 0.5),
+                        np.ceil(fraction - 0.5)).astype('int64')
+    _checkNsRange(seconds + fraction // NS, fraction % NS)
+    return seconds * NS + fraction
+
+
+def _scalarNs(dt):
+    """
+    Returns the nanoseconds of a single UTCDateTime within the int64 range.
+    """
+    _checkNsRange(*divmod(dt._ns, NS))
+    return dt._ns
+
+
+def _addNs(ns, offset):
+    """
+    Adds nanoseconds to an int64 array of nanoseconds, raising an
+    OverflowError instead of silently wrapping around.
+    """
+    if not np.ndim(offset):
+        _checkNsRange(*divmod(offset, NS))
+        offset = np.int64(offset)
+    result = ns + offset
+    # overflow if both summands have a sign different from the result
+    if np.any(((ns ^ result) & (offset ^ result)) < 0):
+        raise _rangeError()
+    return result
+
+
+def _toNs(values):
+    """
+    Converts a sequence of times to an int64 array of nanoseconds.
+    """
+    if isinstance(values, UTCDateTimeArray):
+        return values.ns.copy()
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'iu':
+        _checkNsRange(values)
+        return values.astype('int64') * NS
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return _floatsToNs(values)
+    values = list(values)
+    ns = np.empty(len(values), dtype='int64')
+    strings = []
+    for i, value in enumerate(values):
+        if isinstance(value, UTCDateTime):
+            ns[i] = _scalarNs(value)
+        elif isinstance(value, basestring):
+            strings.append(i)
+        else:
+            ns[i] = _scalarNs(UTCDateTime(value))
+    if strings:
+        parsed, ok = _parseFixedLayout([values[i] for i in strings])
+        ns[strings] = parsed
+        for i in np.array(strings)[~ok]:
+            ns[i] = _scalarNs(UTCDateTime(values[i]))
+    return ns
+
+
+class UTCDateTimeArray(object):
+    """
+    An array of UTC based times stored as NumPy array of nanoseconds.
+
+    Bulk operations on many times, e.g. comparing, shifting or formatting
+    all pick times of a catalog, are done at once on the underlying int64
+    array instead of object by object.
+
+    :type values: list, :class:`numpy.ndarray` or
+        :class:`~obspy.core.utcdatetime.UTCDateTimeArray`, optional
+    :param values: Times given as :class:`UTCDateTime` objects, timestamps in
+        seconds or strings. Strings of the layouts ``YYYY-MM-DD`` and
+        ``YYYY-MM-DDThh:mm:ss.ffffff`` (with optional ``Z``) are parsed at
+        once, all others as done by :class:`UTCDateTime`.
+    :type precision: int, optional
+    :param precision: Precision used by the rich comparison operators, see
+        :class:`UTCDateTime`. Defaults to
+        :attr:`UTCDateTime.DEFAULT_PRECISION`.
+
+    Comparisons return boolean arrays, the difference of two arrays an array
+    of seconds. Indexing with an integer returns a :class:`UTCDateTime`
+    object, indexing with slices, index or boolean arrays returns a new
+    array.
+
+    .. rubric:: Example
+
+    >>> times = UTCDateTimeArray(["2012-01-01T00:00:00Z",
+    ...                           "2012-01-01T12:00:00.5Z"])
+    >>> times[1]
+    UTCDateTime(2012, 1, 1, 12, 0, 0, 500000)
+    >>> (times > UTCDateTime(2012, 1, 1, 6)).tolist()
+    [False, True]
+    >>> (times + 86400).isoformat()
+    ['2012-01-02T00:00:00', '2012-01-02T12:00:00.500000']
+    >>> (times - times[0]).tolist()
+    [0.0, 43200.5]
+    """
+    __hash__ = None
+
+    def __init__(self, values=[], precision=None):
+        if precision is None:
+            precision = getattr(values, 'precision',
+                                UTCDateTime.DEFAULT_PRECISION)
+        self.precision = int(precision)
+        self.ns = _toNs(values)
+
+    @staticmethod
+    def fromNs(ns, precision=None):
+        """
+        Creates an array from nanoseconds since 1970-01-01T00:00:00Z.
+
+        :type ns: array_like of int
+        :param ns: Nanoseconds, the array is not copied if it is an int64
+            array already.
+        :rtype: :class:`~obspy.core.utcdatetime.UTCDateTimeArray`
+        """
+        times = UTCDateTimeArray(precision=precision)
+        times.ns = np.asarray(ns, dtype='int64')
+        return times
+
+    def _new(self, ns):
+        return UTCDateTimeArray.fromNs(ns, self.precision)
+
+    def __len__(self):
+        return len(self.ns)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, long, np.integer)):
+            dt = UTCDateTime._fromNs(int(self.ns[index]))
+            dt.precision = self.precision
+            return dt
+        return self._new(self.ns[index])
+
+    def __iter__(self):
+        for i in xrange(len(self.ns)):
+            yield self[i]
+
+    def tolist(self):
+        """
+        Returns the times as list of :class:`UTCDateTime` objects.
+        """
+        return list(self)
+
+    def __repr__(self):
+        return "UTCDateTimeArray(%s)" % [str(dt) for dt in self]
+
+    def __str__(self):
+        return str([str(dt) for dt in self])
+
+    def _getTimeStamp(self):
+        """
+        Returns the UTC timestamps in seconds as float64 array.
+        """
+        return self.ns // NS + self.ns % NS / float(NS)
+
+    timestamp = property(_getTimeStamp)
+
+    def __add__(self, value):
+        """
+        Adds seconds given as number or array to all times.
+        """
+        if isinstance(value, (UTCDateTime, UTCDateTimeArray)):
+            msg = "unsupported operand type: '%s'" % type(value).__name__
+            raise TypeError(msg)
+        if np.ndim(value):
+            value = np.asarray(value)
+            if value.dtype.kind in 'iu':
+                _checkNsRange(value)
+                return self._new(_addNs(self.ns, value.astype('int64') * NS))
+            return self._new(_addNs(self.ns, _floatsToNs(value)))
+        return self._new(_addNs(self.ns, _secondsToNs(value)))
+
+    __radd__ = __add__
+
+    def __sub__(self, value):
+        """
+        Subtracts seconds from all times or returns the differences in
+        seconds to a :class:`UTCDateTime` or an array of times.
+        """
+        if isinstance(value, UTCDateTime):
+            seconds, fraction = divmod(value._ns, NS)
+        elif isinstance(value, UTCDateTimeArray):
+            seconds, fraction = value.ns // NS, value.ns % NS
+        else:
+            return self.__add__(-np.asarray(value) if np.ndim(value)
+                                else -value)
+        # full seconds and fractions separately, the difference of the
+        # nanoseconds may exceed the int64 range
+        diff = (self.ns // NS - seconds) + \
+            (self.ns % NS - fraction) / float(NS)
+        return np.round(diff, self.precision)
+
+    def _distance(self, other):
+        """
+        Returns whether the times are later than the other times, the
+        absolute differences in nanoseconds and the largest difference of
+        equal times with respect to the precision.
+        """
+        if isinstance(other, UTCDateTimeArray):
+            other = other.ns
+        elif np.ndim(other):
+            other = _toNs(other)
+        else:
+            if not isinstance(other, UTCDateTime):
+                other = UTCDateTime(other)
+            other = other._ns
+        # times are equal if 2 * distance < 10 ** (9 - precision)
+        limit = 0
+        if self.precision < 9:
+            limit = (10 ** (9 - self.precision) - 1) // 2
+        limit = np.uint64(limit)
+        if not np.ndim(other) and not -2 ** 63 <= other < 2 ** 63:
+            # single time out of the int64 range differs from all times
+            later = np.empty(len(self.ns), dtype='bool')
+            later.fill(other < 0)
+            distance = np.empty(len(self.ns), dtype='uint64')
+            distance.fill(2 ** 64 - 1)
+            return later, distance, limit
+        other = np.asarray(other, dtype='int64')
+        later = self.ns > other
+        # the unsigned difference is exact, the signed one may overflow
+        ns = self.ns.astype('uint64')
+        other = other.astype('uint64')
+        return later, np.where(later, ns - other, other - ns), limit
+
+    def __eq__(self, other):
+        _later, distance, limit = self._distance(other)
+        return distance <= limit
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    def __lt__(self, other):
+        later, distance, limit = self._distance(other)
+        return ~later & (distance > limit)
+
+    def __le__(self, other):
+        return ~self.__gt__(other)
+
+    def __gt__(self, other):
+        later, distance, limit = self._distance(other)
+        return later & (distance > limit)
+
+    def __ge__(self, other):
+        return ~self.__lt__(other)
+
+    def _components(self):
+        """
+        Returns year, month, day, julian day, hour, minute, second and
+        microsecond arrays, rounded to full microseconds like
+        :attr:`UTCDateTime.datetime`.
+        """
+        us = (self.ns + 500) // 1000
+        days = us // (86400 * 1000000)
+        year, month, day = _civilFromDays(days)
+        julday = days - _daysFromCivil(year, np.ones_like(year),
+                                       np.ones_like(year)) + 1
+        seconds = us // 1000000 % 86400
+        hour = seconds // 3600
+        minute = seconds // 60 % 60
+        second = seconds % 60
+        us = us % 1000000
+        return year, month, day, julday, hour, minute, second, us
+
+    def isoformat(self, sep="T"):
+        """
+        Returns the times as list of ISO8601 strings like
+        :meth:`UTCDateTime.isoformat`.
+
+        :type sep: str, optional
+        :param sep: Separator between date and time. Defaults to ``"T"``.
+        :rtype: list of str
+
+        .. rubric:: Example
+
+        >>> times = UTCDateTimeArray([UTCDateTime(2008, 10, 1, 12, 30, 35),
+        ...                           UTCDateTime(2008, 10, 1, 12, 30, 36, 5)])
+        >>> times.isoformat()
+        ['2008-10-01T12:30:35', '2008-10-01T12:30:36.000005']
+        """
+        year, month, day, _, hour, minute, second, us = self._components()
+        lengths = np.where(us, 26, 19)
+        return _joinColumns([_digits(year, 4), '-', _digits(month, 2), '-',
+                             _digits(day, 2), sep, _digits(hour, 2), ':',
+                             _digits(minute, 2), ':', _digits(second, 2),
+                             '.', _digits(us, 6)], lengths)
+
+    def formatSEED(self, compact=False):
+        """
+        Returns the times as list of SEED strings like
+        :meth:`UTCDateTime.formatSEED`.
+
+        :type compact: bool, optional
+        :param compact: Delivers a compact SEED date string if enabled.
+            Defaults to ``False``.
+        :rtype: list of str
+
+        .. rubric:: Example
+
+        >>> times = UTCDateTimeArray([UTCDateTime(2008, 10, 1),
+        ...                           UTCDateTime(2008, 10, 1, 12, 30)])
+        >>> times.formatSEED()
+        ['2008,275', '2008,275,12:30:00.0000']
+        >>> times.formatSEED(compact=True)
+        ['2008,275', '2008,275,12:30']
+        """
+        year, _, _, julday, hour, minute, second, us = self._components()
+        midnight = (hour == 0) & (minute == 0) & (second == 0) & (us == 0)
+        if compact:
+            lengths = np.select([midnight, us != 0, second != 0, minute != 0],
+                                [8, 22, 17, 14], 11)
+        else:
+            lengths = np.where(midnight, 8, 22)
+        return _joinColumns([_digits(year, 4), ',', _digits(julday, 3), ',',
+                             _digits(hour, 2), ':', _digits(minute, 2), ':',
+                             _digits(second, 2), '.', _digits(us // 100, 4)],
+                            lengths)
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(exclude_empty=True)
@@ -35,6 +35,33 @@ WAVEFORM_PREFERRED_ORDER = ['MSEED', 'SAC', 'GSE2', 'SEISAN', 'SACXY', 'GSE1',
                             'Q', 'SH_ASC', 'SLIST', 'TSPAIR', 'SEGY', 'SU',
                             'SEG2', 'WAV', 'PICKLE', 'DATAMARK', 'CSS']
 
+# file name extensions commonly associated with a format - only used to sort
+# the candidates of the automatic format detection
+FORMAT_EXTENSIONS = {
+    '.mseed': ['MSEED'], '.msd': ['MSEED'], '.miniseed': ['MSEED'],
+    '.seed': ['MSEED'], '.sac': ['SAC', 'SACXY'], '.gse': ['GSE2', 'GSE1'],
+    '.gse1': ['GSE1'], '.gse2': ['GSE2'], '.qhd': ['Q'], '.qbn': ['Q'],
+    '.asc': ['SH_ASC', 'SLIST', 'TSPAIR'], '.ascii': ['SLIST', 'TSPAIR'],
+    '.segy': ['SEGY'], '.sgy': ['SEGY'], '.su': ['SU'], '.seg2': ['SEG2'],
+    '.sg2': ['SEG2'], '.wav': ['WAV'], '.pickle': ['PICKLE'],
+    '.pkl': ['PICKLE'], '.wfdisc': ['CSS'], '.xml': ['QUAKEML']}
+
+# leading bytes ("magic") of a file commonly associated with a format - only
+# used to sort the candidates of the automatic format detection
+FORMAT_MAGIC = [
+    ('DELTA:', ['SH_ASC']),
+    ('43981', ['Q']),
+    ('TIMESERIES', ['SLIST', 'TSPAIR']),
+    ('RIFF', ['WAV']),
+    ('\x55\x3a', ['SEG2']),
+    ('\x3a\x55', ['SEG2']),
+    ('WID2', ['GSE2']),
+    ('BEGIN', ['GSE2']),
+    ('DATA_TYPE', ['GSE2']),
+    ('WID1', ['GSE1']),
+    ('XW01', ['GSE1']),
+    ('<?xml', ['QUAKEML'])]
+
 _sys_is_le = sys.byteorder == 'little'
 NATIVE_BYTEORDER = _sys_is_le and '<' or '>'
 
@@ -382,6 +409,94 @@ def getMatplotlibVersion():
     return version
 
 
+# resolved plug-in functions, e.g. isFormat or readFormat of each format
+_PLUGIN_FUNCTIONS = {}
+# last format detected within a directory per plug-in type
+_FORMAT_HINTS = {}
+
+
+def _getPluginFunction(plugin_type, format_ep, name):
+    """
+    Returns the given function of a format's entry point.
+
+    Entry points are resolved only once per process, any following call
+    returns the cached function.
+
+    .. rubric:: Example
+
+    >>> ep = ENTRY_POINTS['waveform']['SLIST']
+    >>> _getPluginFunction('waveform', ep, 'isFormat')  # doctest: +ELLIPSIS
+    <function isSLIST at 0x...>
+    """
+    key = (plugin_type, format_ep.name, name)
+    try:
+        return _PLUGIN_FUNCTIONS[key]
+    except KeyError:
+        pass
+    func = load_entry_point(format_ep.dist.key,
+        'obspy.plugin.%s.%s' % (plugin_type, format_ep.name), name)
+    _PLUGIN_FUNCTIONS[key] = func
+    return func
+
+
+def _guessFormats(filename):
+    """
+    Guesses likely formats of a file using its extension and leading bytes.
+
+    The result is only used to reorder the format detection, so the returned
+    list may contain wrong or unknown format names.
+
+    .. rubric:: Example
+
+    >>> _guessFormats(getExampleFile('slist.ascii'))
+    ['SLIST', 'TSPAIR']
+    """
+    formats = []
+    if not isinstance(filename, basestring):
+        return formats
+    try:
+        with open(filename, 'rb') as fh:
+            header = fh.read(10)
+    except IOError:
+        header = ''
+    # Mini-SEED/full SEED - sequence number followed by a header type
+    if len(header) >= 7 and header[6] in 'DRQMV' and \
+            header[0:6].replace('\x00', ' ').strip().isdigit():
+        formats.append('MSEED')
+    for magic, names in FORMAT_MAGIC:
+        if header.startswith(magic):
+            formats.extend(names)
+    extension = os.path.splitext(filename)[1].lower()
+    formats.extend(FORMAT_EXTENSIONS.get(extension, []))
+    # remove duplicates but keep order
+    return [name for i, name in enumerate(formats)
+            if name not in formats[:i]]
+
+
+def _getFormatCandidates(plugin_type, filename):
+    """
+    Returns entry points of all formats in the order they should be checked.
+
+    The format last detected within the same directory comes first, followed
+    by the formats guessed via :func:`_guessFormats` and finally all remaining
+    formats in their default order. This order only determines which format
+    is checked first, see :func:`_readFromPlugin`.
+    """
+    EPS = ENTRY_POINTS[plugin_type]
+    names = []
+    if isinstance(filename, basestring):
+        hint = _FORMAT_HINTS.get((plugin_type, os.path.dirname(filename)))
+        if hint:
+            names.append(hint)
+        names.extend(_guessFormats(filename))
+    names.extend(EPS.keys())
+    candidates = OrderedDict()
+    for name in names:
+        if name in EPS and name not in candidates:
+            candidates[name] = EPS[name]
+    return candidates.values()
+
+
 def _readFromPlugin(plugin_type, filename, format=None, **kwargs):
     """
     Reads a single file from a plug-in's readFormat function.
@@ -390,17 +505,32 @@ def _readFromPlugin(plugin_type, filename, format=None, **kwargs):
     # get format entry point
     format_ep = None
     if not format:
-        # auto detect format - go through all known formats in given sort order
-        for format_ep in EPS.values():
+        # auto detect format - go through all known formats starting with
+        # the most likely ones
+        checked = set()
+        for format_ep in _getFormatCandidates(plugin_type, filename):
             # search isFormat for given entry point
-            isFormat = load_entry_point(format_ep.dist.key,
-                'obspy.plugin.%s.%s' % (plugin_type, format_ep.name),
-                'isFormat')
+            isFormat = _getPluginFunction(plugin_type, format_ep, 'isFormat')
             # check format
             if isFormat(filename):
                 break
+            checked.add(format_ep.name)
         else:
             raise TypeError('Unknown format for file %s' % filename)
+        # a matching format preceding the detected one in the default order
+        # takes precedence, so that the result does not depend on the order
+        # of the checks
+        for ep in EPS.values():
+            if ep.name == format_ep.name:
+                break
+            if ep.name not in checked and \
+                    _getPluginFunction(plugin_type, ep, 'isFormat')(filename):
+                format_ep = ep
+                break
+        # remember format for following files within the same directory
+        if isinstance(filename, basestring):
+            _FORMAT_HINTS[(plugin_type, os.path.dirname(filename))] = \
+                format_ep.name
     else:
         # format given via argument
         format = format.upper()
@@ -412,8 +542,7 @@ def _readFromPlugin(plugin_type, filename, format=None, **kwargs):
     # file format should be known by now
     try:
         # search readFormat for given entry point
-        readFormat = load_entry_point(format_ep.dist.key,
-            'obspy.plugin.%s.%s' % (plugin_type, format_ep.name), 'readFormat')
+        readFormat = _getPluginFunction(plugin_type, format_ep, 'readFormat')
     except ImportError:
         msg = "Format \"%s\" is not supported. Supported types: %s"
         raise TypeError(msg % (format_ep.name, ', '.join(EPS)))
@@ -9,6 +9,7 @@ Decorator used in ObsPy.
     (http://www.gnu.org/copyleft/lesser.html)
 """
 
+from cStringIO import StringIO
 from obspy.core.util.base import NamedTemporaryFile
 import numpy as np
 import functools
@@ -105,7 +106,12 @@ def skipIf(condition, reason):
 
 def uncompressFile(func):
     """
-    Decorator used for temporary uncompressing file if .gz or .bz2 archive.
+    Decorator used for uncompressing file if .gz or .bz2 archive.
+
+    The uncompressed data is passed as a file-like object to the wrapped
+    function. Only if this raises a :class:`TypeError`, e.g. the format does
+    not support file-like objects, the data is written to a temporary file
+    which is then passed instead.
     """
     def wrapped_func(filename, *args, **kwargs):
         if not isinstance(filename, basestring):
@@ -130,7 +136,13 @@ def uncompressFile(func):
             except:
                 pass
         if unpacked_data:
-            # we unpacked something without errors - create temporary file
+            # we unpacked something without errors - first try reading
+            # directly from memory
+            try:
+                return func(StringIO(unpacked_data), *args, **kwargs)
+            except TypeError:
+                pass
+            # otherwise create temporary file
             with NamedTemporaryFile() as tempfile:
                 tempfile._fileobj.write(unpacked_data)
                 # call wrapped function
@@ -56,6 +56,15 @@ of each trace.
 >>> print(st[0].data)
 [2787 2776 2774 ..., 2850 2853 2853]
 
+Files larger than the available memory can be processed piece by piece using
+:func:`~obspy.mseed.core.iterMSEED`, which decodes only a limited number of
+records at a time and yields the resulting traces:
+
+>>> from obspy.mseed.core import iterMSEED
+>>> for tr in iterMSEED("/path/to/huge.mseed",  # doctest: +SKIP
+...                     chunk_records=4096):
+...     tr.filter("highpass", freq=1.0)  # doctest: +SKIP
+
 Writing
 -------
 You may export the data to the file system using the
@@ -13,7 +13,6 @@ from obspy.core.util import NATIVE_BYTEORDER
 from obspy.mseed.headers import blkt_100_s
 import ctypes as C
 import numpy as np
-import os
 import util
 import warnings
 
@@ -22,7 +21,7 @@ def isMSEED(filename):
     """
     Checks whether a file is Mini-SEED/full SEED or not.
 
-    :type filename: string
+    :type filename: string or file-like object
     :param filename: Mini-SEED/full SEED file to be checked.
     :rtype: bool
     :return: ``True`` if a Mini-SEED file.
@@ -35,8 +34,26 @@ def isMSEED(filename):
     checks if it has a data part and returns False otherwise.
 
     Thus it cannot be used to validate a Mini-SEED or SEED file.
+
+    File-like objects are checked from their current position, which will be
+    restored afterwards.
     """
-    fp = open(filename, 'rb')
+    if hasattr(filename, 'read') and hasattr(filename, 'seek'):
+        initial_position = filename.tell()
+        try:
+            return _isMSEED(filename)
+        finally:
+            filename.seek(initial_position, 0)
+    with open(filename, 'rb') as fp:
+        return _isMSEED(fp)
+
+
+def _isMSEED(fp):
+    """
+    Checks whether the open file object contains Mini-SEED/full SEED data
+    starting at its current position.
+    """
+    start = fp.tell()
     header = fp.read(7)
     # File has less than 7 characters
     if len(header) != 7:
@@ -76,9 +93,10 @@ def isMSEED(filename):
         record_length = pow(2, int(fp.read(2)))
     except:
         return False
-    file_size = os.path.getsize(filename)
+    fp.seek(0, 2)
+    file_size = fp.tell()
     # Jump to the second record.
-    fp.seek(record_length + 6)
+    fp.seek(start + record_length + 6, 0)
     # Loop over all records and return True if one record is a data
     # record
     while fp.tell() < file_size:
@@ -91,7 +109,7 @@ def isMSEED(filename):
 
 def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
               sourcename=None, reclen=None, recinfo=True, details=False,
-              header_byteorder=None, verbose=None, **kwargs):
+              header_byteorder=None, verbose=None, index=None, **kwargs):
     """
     Reads a Mini-SEED file and returns a Stream object.
 
@@ -140,6 +158,12 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
         little-endian, ``1`` or ``'>'`` for MBF or big-endian. ``'='`` is the
         native byteorder. Used to enforce the header byteorder. Useful in some
         rare cases where the automatic byte order detection fails.
+    :type index: str or :class:`numpy.ndarray`, optional
+    :param index: Record index of the file as returned by
+        :func:`~obspy.mseed.util.buildRecordIndex` or the name of a file the
+        index has been written to. Only the records overlapping the given
+        ``starttime``/``endtime`` and matching the given ``sourcename`` are
+        read from the file. Requires ``mseed_object`` to be a file name.
 
     .. rubric:: Example
 
@@ -159,29 +183,8 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
     NL.HGN.00.BHZ | 2003-05-29T02:15:59.993400Z - ... | 40.0 Hz, 5629 samples
     """
     # Parse the headonly and reclen flags.
-    if headonly is True:
-        unpack_data = 0
-    else:
-        unpack_data = 1
-    if reclen is None:
-        reclen = -1
-    elif reclen is not None and reclen not in VALID_RECORD_LENGTHS:
-        msg = 'Invalid record length. Autodetection will be used.'
-        warnings.warn(msg)
-        reclen = -1
-    else:
-        reclen = int(log(reclen, 2))
-
-    # Determine the byteorder.
-    if header_byteorder == "=":
-        header_byteorder = NATIVE_BYTEORDER
-
-    if header_byteorder is None:
-        header_byteorder = -1
-    elif header_byteorder in [0, "0", "<"]:
-        header_byteorder = 0
-    elif header_byteorder in [1, "1", ">"]:
-        header_byteorder = 1
+    unpack_data, reclen, header_byteorder = _parseReadFlags(headonly, reclen,
+                                                            header_byteorder)
 
     # The quality flag is no more supported. Raise a warning.
     if 'quality' in kwargs:
@@ -192,27 +195,41 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
 
     # Parse some information about the file.
     if recinfo:
-        # Pass the byteorder if enforced.
-        if header_byteorder == 0:
-            bo = "<"
-        elif header_byteorder > 0:
-            bo = ">"
-        else:
-            bo = None
-
-        info = util.getRecordInformation(mseed_object, endian=bo)
-        info['encoding'] = ENCODINGS[info['encoding']][0]
-        # Only keep information relevant for the whole file.
-        info = {'encoding': info['encoding'],
-                'filesize': info['filesize'],
-                'record_length': info['record_length'],
-                'byteorder': info['byteorder'],
-                'number_of_records': info['number_of_records']}
-
-    # If its a filename just read it.
-    if isinstance(mseed_object,  basestring):
-        # Read to NumPy array which is used as a buffer.
-        buffer = np.fromfile(mseed_object, dtype='b')
+        info = _getFileInformation(mseed_object, header_byteorder)
+
+    # Read only the selected records if an index is given.
+    if index is not None:
+        if not isinstance(mseed_object, basestring):
+            msg = 'Reading via a record index requires a file name'
+            raise ValueError(msg)
+        if isinstance(index, basestring):
+            index = util.readRecordIndex(index)
+        records = util._selectRecords(index, starttime, endtime, sourcename)
+        if not len(records):
+            return Stream()
+        buffer = np.memmap(mseed_object, dtype='b', mode='r')
+        if (records['offset'] + records['record_length']).max() > \
+                len(buffer):
+            msg = 'Record index does not match file %s' % mseed_object
+            raise ValueError(msg)
+        # Join adjacent records to read contiguous chunks of the file.
+        chunks = []
+        for offset, record_length in izip(records['offset'],
+                                          records['record_length']):
+            if chunks and chunks[-1][1] == offset:
+                chunks[-1][1] += record_length
+            else:
+                chunks.append([offset, offset + record_length])
+        buffer = np.concatenate([buffer[start:end] for start, end in chunks])
+    # If its a filename map it into memory. Only the pages of the file which
+    # are actually accessed by libmseed will be read, e.g. just the headers
+    # of all records not matching the given time window or source name.
+    elif isinstance(mseed_object,  basestring):
+        try:
+            buffer = np.memmap(mseed_object, dtype='b', mode='r')
+        except (EnvironmentError, ValueError):
+            # empty files or files which can not be mapped
+            buffer = np.fromfile(mseed_object, dtype='b')
     elif hasattr(mseed_object, 'read'):
         buffer = np.fromstring(mseed_object.read(), dtype='b')
 
@@ -241,8 +258,164 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
             continue
         break
     buffer = buffer[offset:]
-    buflen = len(buffer)
 
+    traces = _readMSEEDBuffer(buffer, starttime, endtime, headonly,
+                              sourcename, unpack_data, reclen, verbose,
+                              details, header_byteorder)
+    # Release the buffer - closes the memory map of the file if any.
+    del buffer
+
+    # Append information if necessary.
+    if recinfo:
+        for trace in traces:
+            for key, value in info.iteritems():
+                setattr(trace.stats.mseed, key, value)
+    return Stream(traces=traces)
+
+
+def iterMSEED(mseed_object, chunk_records=1024, starttime=None,
+              endtime=None, headonly=False, sourcename=None, reclen=None,
+              recinfo=True, details=False, header_byteorder=None,
+              verbose=None):
+    """
+    Iterates over a Mini-SEED file decoding only a limited number of records
+    at a time.
+
+    This allows processing files larger than the available memory. All
+    arguments except ``chunk_records`` are the same as for
+    :func:`~obspy.mseed.core.readMSEED`.
+
+    :param mseed_object: Filename or open file like object that contains the
+        binary Mini-SEED data.
+    :type chunk_records: int, optional
+    :param chunk_records: Maximal number of records decoded at once. Defaults
+        to ``1024``.
+    :return: Generator yielding :class:`~obspy.core.trace.Trace` objects. Each
+        trace contains a continuous piece of data of a single chunk, thus
+        consecutive traces of the same id may be directly adjacent. Use
+        :meth:`~obspy.core.stream.Stream.merge` to combine them.
+
+    .. note::
+        All records of the file are assumed to have the same record length as
+        the first data record unless ``reclen`` is given.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import getExampleFile
+    >>> filename = getExampleFile("test.mseed")
+    >>> for tr in iterMSEED(filename, chunk_records=1):
+    ...     print(tr)  # doctest: +ELLIPSIS
+    NL.HGN.00.BHZ | 2003-05-29T02:13:22.043400Z - ... | 40.0 Hz, 5980 samples
+    NL.HGN.00.BHZ | 2003-05-29T02:15:51.543400Z - ... | 40.0 Hz, 5967 samples
+    """
+    if chunk_records < 1:
+        msg = 'chunk_records needs to be a positive integer'
+        raise ValueError(msg)
+    if isinstance(mseed_object, basestring):
+        fh = open(mseed_object, 'rb')
+    else:
+        fh = mseed_object
+    try:
+        unpack_data, reclen_exp, header_byteorder = _parseReadFlags(
+            headonly, reclen, header_byteorder)
+        info = _getFileInformation(fh, header_byteorder)
+        if reclen_exp > 0:
+            record_length = reclen
+        else:
+            record_length = info['record_length']
+        # Skip all control header records of full SEED files.
+        while True:
+            header = fh.read(7)
+            if len(header) < 7 or ord(header[6]) not in SEED_CONTROL_HEADERS:
+                fh.seek(-len(header), 1)
+                break
+            fh.seek(record_length - 7, 1)
+        while True:
+            data = fh.read(chunk_records * record_length)
+            if not data:
+                break
+            buffer = np.fromstring(data, dtype='b')
+            del data
+            traces = _readMSEEDBuffer(buffer, starttime, endtime, headonly,
+                                      sourcename, unpack_data, reclen_exp,
+                                      verbose, details, header_byteorder)
+            del buffer
+            for trace in traces:
+                if recinfo:
+                    for key, value in info.iteritems():
+                        setattr(trace.stats.mseed, key, value)
+                yield trace
+    finally:
+        if fh is not mseed_object:
+            fh.close()
+
+
+def _parseReadFlags(headonly, reclen, header_byteorder):
+    """
+    Converts the headonly, reclen and header_byteorder arguments of
+    :func:`~obspy.mseed.core.readMSEED` to the values expected by libmseed.
+    """
+    # Parse the headonly and reclen flags.
+    if headonly is True:
+        unpack_data = 0
+    else:
+        unpack_data = 1
+    if reclen is None:
+        reclen = -1
+    elif reclen is not None and reclen not in VALID_RECORD_LENGTHS:
+        msg = 'Invalid record length. Autodetection will be used.'
+        warnings.warn(msg)
+        reclen = -1
+    else:
+        reclen = int(log(reclen, 2))
+
+    # Determine the byteorder.
+    if header_byteorder == "=":
+        header_byteorder = NATIVE_BYTEORDER
+
+    if header_byteorder is None:
+        header_byteorder = -1
+    elif header_byteorder in [0, "0", "<"]:
+        header_byteorder = 0
+    elif header_byteorder in [1, "1", ">"]:
+        header_byteorder = 1
+    return unpack_data, reclen, header_byteorder
+
+
+def _getFileInformation(mseed_object, header_byteorder):
+    """
+    Returns the record information relevant for the whole file, which is
+    stored in the stats.mseed AttribDict of every read trace.
+    """
+    # Pass the byteorder if enforced.
+    if header_byteorder == 0:
+        bo = "<"
+    elif header_byteorder > 0:
+        bo = ">"
+    else:
+        bo = None
+
+    info = util.getRecordInformation(mseed_object, endian=bo)
+    info['encoding'] = ENCODINGS[info['encoding']][0]
+    # Only keep information relevant for the whole file.
+    info = {'encoding': info['encoding'],
+            'filesize': info['filesize'],
+            'record_length': info['record_length'],
+            'byteorder': info['byteorder'],
+            'number_of_records': info['number_of_records']}
+    return info
+
+
+def _readMSEEDBuffer(buffer, starttime, endtime, headonly, sourcename,
+                     unpack_data, reclen, verbose, details, header_byteorder):
+    """
+    Decodes all data records contained in the given NumPy buffer and returns
+    a list of Trace objects.
+
+    The buffer needs to start with a data record, the reclen and
+    header_byteorder arguments have to be parsed by :func:`_parseReadFlags`.
+    """
+    buflen = len(buffer)
     # If no selection is given pass None to the C function.
     if starttime is None and endtime is None and sourcename is None:
         selections = None
@@ -315,7 +488,7 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
     except ValueError:
         clibmseed.lil_free(lil)
         del lil
-        return Stream()
+        return traces
 
     while True:
         # Init header with the essential information.
@@ -351,10 +524,6 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
                 header['npts'] = currentSegment.samplecnt
             # Make sure to init the number of samples.
             trace = Trace(header=header, data=data)
-            # Append information if necessary.
-            if recinfo:
-                for key, value in info.iteritems():
-                    setattr(trace.stats.mseed, key, value)
             traces.append(trace)
             # A Null pointer access results in a ValueError
             try:
@@ -368,7 +537,7 @@ def readMSEED(mseed_object, starttime=None, endtime=None, headonly=False,
 
     clibmseed.lil_free(lil)
     del lil
-    return Stream(traces=traces)
+    return traces
 
 
 def writeMSEED(stream, filename, encoding=None, reclen=None, byteorder=None,
@@ -3,9 +3,10 @@ from obspy import UTCDateTime, Stream, Trace, read
 from obspy.core import AttribDict
 from obspy.core.util import NamedTemporaryFile
 from obspy.mseed import util
-from obspy.mseed.core import readMSEED, writeMSEED, isMSEED
+from obspy.mseed.core import readMSEED, writeMSEED, isMSEED, iterMSEED
 from obspy.mseed.headers import clibmseed, ENCODINGS
 from obspy.mseed.msstruct import _MSStruct
+from StringIO import StringIO
 import copy
 import numpy as np
 import os
@@ -231,6 +232,19 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
             is_mseed = isMSEED(filename)
             self.assertFalse(is_mseed)
 
+    def test_isMSEEDFileLikeObject(self):
+        """
+        isMSEED should work on file-like objects and restore their position.
+        """
+        for filename, expected in (('test.mseed', True),
+                                   ('fullseed.mseed', True),
+                                   ('../__init__.py', False)):
+            with open(os.path.join(self.path, 'data', filename), 'rb') as fh:
+                buf = StringIO(fh.read())
+            buf.seek(0)
+            self.assertEqual(isMSEED(buf), expected)
+            self.assertEqual(buf.tell(), 0)
+
     def test_readSingleRecordToMSR(self):
         """
         Tests readSingleRecordtoMSR against start and endtimes.
@@ -549,6 +563,55 @@ class MSEEDReadingAndWritingTestCase(unittest.TestCase):
         tr2 = read(file2)[0]
         np.testing.assert_array_equal(tr1.data, tr2.data)
 
+    def test_readPartsOfMemoryMappedFile(self):
+        """
+        Files are memory mapped, reading a time window from a file name must
+        give the same result as reading it from a file-like object. The data
+        of the returned trace must not refer to the mapped file.
+        """
+        file = os.path.join(self.path, 'data',
+                            'BW.BGLD.__.EHE.D.2008.001.first_10_records')
+        t = [UTCDateTime(2008, 1, 1, 0, 0, 1, 975000),
+             UTCDateTime(2008, 1, 1, 0, 0, 4, 30000)]
+        st1 = readMSEED(file, starttime=t[0], endtime=t[1])
+        with open(file, 'rb') as fh:
+            st2 = readMSEED(StringIO(fh.read()), starttime=t[0],
+                            endtime=t[1])
+        self.assertEqual(st1, st2)
+        self.assertFalse(isinstance(st1[0].data, np.memmap))
+        self.assertEqual(len(readMSEED(file, sourcename='XX.*')), 0)
+
+    def test_iterMSEED(self):
+        """
+        Iterating over a file in chunks of records must yield the same data as
+        reading the whole file at once.
+        """
+        for filename in ('BW.BGLD.__.EHE.D.2008.001.first_10_records',
+                         'fullseed.mseed', 'test.mseed'):
+            file = os.path.join(self.path, 'data', filename)
+            st1 = readMSEED(file)
+            for chunk_records in (1, 3, 1000):
+                st2 = Stream(list(iterMSEED(file,
+                                            chunk_records=chunk_records)))
+                st2.merge()
+                self.assertEqual(len(st1), len(st2))
+                for tr1, tr2 in zip(st1, st2):
+                    self.assertEqual(tr1.stats, tr2.stats)
+                    np.testing.assert_array_equal(tr1.data, tr2.data)
+        # file-like object and time window
+        file = os.path.join(self.path, 'data',
+                            'BW.BGLD.__.EHE.D.2008.001.first_10_records')
+        t = [UTCDateTime(2008, 1, 1, 0, 0, 1, 975000),
+             UTCDateTime(2008, 1, 1, 0, 0, 4, 30000)]
+        st1 = readMSEED(file, starttime=t[0], endtime=t[1])
+        with open(file, 'rb') as fh:
+            st2 = Stream(list(iterMSEED(fh, chunk_records=2, starttime=t[0],
+                                        endtime=t[1])))
+        st2.merge()
+        self.assertEqual(st1, st2)
+        # invalid chunk size
+        self.assertRaises(ValueError, list, iterMSEED(file, chunk_records=0))
+
     def test_readWithGSE2Option(self):
         """
         Test that reading will still work if wrong option (of gse2)
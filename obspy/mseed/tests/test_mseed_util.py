@@ -137,6 +137,46 @@ class MSEEDUtilTestCase(unittest.TestCase):
             self.assertEqual(start, stream[0].stats.starttime)
             self.assertEqual(end, stream[0].stats.endtime)
 
+    def test_buildRecordIndex(self):
+        """
+        Tests creating a record index and reading time windows with it.
+
+        The results are compared with reading the file without an index.
+        """
+        for filename in ['BW.BGLD.__.EHE.D.2008.001.first_10_records',
+                         'fullseed.mseed', 'two_channels.mseed']:
+            filename = os.path.join(self.path, 'data', filename)
+            info = util.getRecordInformation(filename)
+            stream = readMSEED(filename)
+            with NamedTemporaryFile() as tf:
+                index = util.buildRecordIndex(filename, tf.name)
+                np.testing.assert_array_equal(index,
+                                              util.readRecordIndex(tf.name))
+                self.assertEqual(index[0]['starttime'],
+                                 info['starttime'].timestamp)
+                self.assertEqual(index[0]['endtime'],
+                                 info['endtime'].timestamp)
+                # whole file
+                self.assertEqual(readMSEED(filename, index=tf.name), stream)
+                # time window and source name
+                tr = stream[-1]
+                start = tr.stats.starttime + 1.5
+                end = tr.stats.starttime + 4
+                st1 = readMSEED(filename, starttime=start, endtime=end,
+                                sourcename=tr.id)
+                st2 = readMSEED(filename, starttime=start, endtime=end,
+                                sourcename=tr.id, index=index)
+                self.assertEqual(st1, st2)
+                self.assertEqual(len(st2), 1)
+                # nothing selected
+                st = readMSEED(filename, sourcename='XX.*', index=index)
+                self.assertEqual(len(st), 0)
+        # index not matching the file
+        index = util.buildRecordIndex(os.path.join(self.path, 'data',
+                                                   'fullseed.mseed'))
+        filename = os.path.join(self.path, 'data', 'test.mseed')
+        self.assertRaises(ValueError, readMSEED, filename, index=index)
+
     def test_getTimingQuality(self):
         """
         This test reads a self-made Mini-SEED file with Timing Quality
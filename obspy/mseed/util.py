@@ -8,10 +8,19 @@ from obspy.core.util import scoreatpercentile
 from struct import unpack
 import sys
 import ctypes as C
+import fnmatch
 import numpy as np
 import warnings
 
 
+# Structure of a record index as created by buildRecordIndex. Times are POSIX
+# timestamps, the endtime is the time of the last sample of the record.
+RECORD_INDEX_DTYPE = np.dtype([('network', 'S2'), ('station', 'S5'),
+                               ('location', 'S2'), ('channel', 'S3'),
+                               ('starttime', 'f8'), ('endtime', 'f8'),
+                               ('offset', 'i8'), ('record_length', 'i4')])
+
+
 def getStartAndEndTime(file_or_file_object):
     """
     Returns the start- and endtime of a Mini-SEED file or file-like object.
@@ -224,6 +233,103 @@ def getTimingAndDataQuality(file_or_file_object):
     return result
 
 
+def buildRecordIndex(filename, index_filename=None):
+    """
+    Creates an index of all data records in a Mini-SEED file.
+
+    For every record the network, station, location and channel code, the
+    start and end time and the position in the file is stored. The index may
+    be passed to :func:`~obspy.mseed.core.readMSEED` via its ``index``
+    argument to read a time window without scanning the whole file.
+
+    :type filename: str
+    :param filename: Name of the Mini-SEED file.
+    :type index_filename: str, optional
+    :param index_filename: If given, the index is also written to this file.
+        It can be loaded again with :func:`readRecordIndex`.
+    :rtype: :class:`numpy.ndarray`
+    :return: Structured array of dtype :const:`RECORD_INDEX_DTYPE` with one
+        entry per data record in file order.
+
+    .. rubric:: Example
+
+    >>> from obspy.core.util import getExampleFile
+    >>> filename = getExampleFile("test.mseed")
+    >>> index = buildRecordIndex(filename)
+    >>> print(index['station'])
+    ['HGN' 'HGN']
+    >>> print(index['offset'])
+    [   0 4096]
+    >>> print(UTCDateTime(index[1]['starttime']))
+    2003-05-29T02:15:51.543400Z
+    """
+    records = []
+    with open(filename, 'rb') as f:
+        f.seek(0, 2)
+        filesize = f.tell()
+        offset = 0
+        control_record_length = None
+        # A valid record needs to have a record length of at least 256 bytes.
+        while offset <= filesize - 256:
+            f.seek(offset, 0)
+            header = f.read(20)
+            f.seek(0, 0)
+            # skip control header records of full SEED files
+            if header[6] not in ['D', 'R', 'Q', 'M']:
+                if control_record_length is None:
+                    control_record_length = \
+                        _getRecordInformation(f)['record_length']
+                offset += control_record_length
+                continue
+            info = _getRecordInformation(f, offset=offset)
+            records.append((header[18:20].strip(), header[8:13].strip(),
+                            header[13:15].strip(), header[15:18].strip(),
+                            info['starttime'].timestamp,
+                            info['endtime'].timestamp, offset,
+                            info['record_length']))
+            offset += info['record_length']
+    index = np.array(records, dtype=RECORD_INDEX_DTYPE)
+    if index_filename is not None:
+        with open(index_filename, 'wb') as f:
+            np.save(f, index)
+    return index
+
+
+def readRecordIndex(index_filename):
+    """
+    Reads a record index written by :func:`buildRecordIndex`.
+
+    :type index_filename: str
+    :param index_filename: Name of the index file.
+    :rtype: :class:`numpy.ndarray`
+    """
+    with open(index_filename, 'rb') as f:
+        index = np.load(f)
+    if index.dtype != RECORD_INDEX_DTYPE:
+        msg = "File %s does not contain a Mini-SEED record index."
+        raise ValueError(msg % index_filename)
+    return index
+
+
+def _selectRecords(index, starttime=None, endtime=None, sourcename=None):
+    """
+    Returns all entries of a record index overlapping the given time window
+    and matching the given source name.
+    """
+    mask = np.ones(len(index), dtype='bool')
+    if starttime is not None:
+        mask &= index['endtime'] >= starttime.timestamp
+    if endtime is not None:
+        mask &= index['starttime'] <= endtime.timestamp
+    if sourcename is not None:
+        for _i in np.nonzero(mask)[0]:
+            id = '.'.join([index[_i]['network'], index[_i]['station'],
+                           index[_i]['location'], index[_i]['channel']])
+            if not fnmatch.fnmatch(id, sourcename):
+                mask[_i] = False
+    return index[mask]
+
+
 def getRecordInformation(file_or_file_object, offset=0, endian=None):
     """
     Returns record information about given files and file-like object.
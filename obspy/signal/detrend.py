@@ -17,11 +17,14 @@ def simple(data):
     Detrend signal simply by subtracting a line through the first and last
     point of the trace
 
-    :param data: Data to detrend, type numpy.ndarray.
+    :param data: Data to detrend, type numpy.ndarray. Multidimensional
+        arrays are detrended along the last axis.
     :return: Detrended data.
     """
-    ndat = len(data)
-    x1, x2 = data[0], data[-1]
+    ndat = data.shape[-1]
+    x1, x2 = data[..., :1], data[..., -1:]
+    if ndat < 2:
+        return data - x1
     return data - (x1 + np.arange(ndat) * (x2 - x1) / float(ndat - 1))
 
 
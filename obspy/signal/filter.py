@@ -17,11 +17,98 @@ Various Seismogram Filtering Functions
     (http://www.gnu.org/copyleft/lesser.html)
 """
 
+import threading
 import warnings
+import numpy as np
+from fractions import gcd
 from numpy import array, where, fft
+from obspy.core.util import OrderedDict
 from scipy.fftpack import hilbert
 from scipy.signal import iirfilter, lfilter, remez, convolve, get_window, \
-    cheby2, cheb2ord
+    cheby2, cheb2ord, firwin
+
+
+# maximal number of filter designs kept in the filter design cache
+FILTER_CACHE_SIZE = 128
+_FILTER_CACHE = OrderedDict()
+_FILTER_CACHE_INFO = {'hits': 0, 'misses': 0}
+_FILTER_CACHE_LOCK = threading.Lock()
+
+
+def _cachedDesign(key, design):
+    """
+    Returns the filter design for the given key from the filter design cache.
+
+    The design function is only called if the key is not cached yet. The least
+    recently used designs are dropped if more than ``FILTER_CACHE_SIZE``
+    designs are cached.
+    """
+    with _FILTER_CACHE_LOCK:
+        try:
+            value = _FILTER_CACHE.pop(key)
+        except KeyError:
+            pass
+        else:
+            _FILTER_CACHE[key] = value
+            _FILTER_CACHE_INFO['hits'] += 1
+            return value
+    value = design()
+    with _FILTER_CACHE_LOCK:
+        _FILTER_CACHE_INFO['misses'] += 1
+        _FILTER_CACHE[key] = value
+        while len(_FILTER_CACHE) > max(FILTER_CACHE_SIZE, 0):
+            _FILTER_CACHE.popitem(last=False)
+    return value
+
+
+def _butterworth(corners, wn, btype):
+    """
+    Returns the cached Butterworth filter coefficients (b, a).
+    """
+    key = ('butter', btype, corners, wn)
+    return _cachedDesign(key, lambda: iirfilter(corners, wn, btype=btype,
+                                                ftype='butter', output='ba'))
+
+
+def filterCacheInfo():
+    """
+    Returns statistics of the filter design cache.
+
+    The filter functions :func:`bandpass`, :func:`bandstop`, :func:`lowpass`,
+    :func:`highpass` and :func:`lowpassCheby2` cache the designed filter
+    coefficients, so filtering many data arrays with the same filter
+    parameters and sampling rate designs the filter only once.
+
+    :rtype: dict
+    :return: Dictionary with the number of cache ``hits`` and ``misses``,
+        the number of currently cached designs (``size``) and the maximal
+        number of cached designs (``maxsize``).
+
+    .. rubric:: Example
+
+    >>> import numpy as np
+    >>> clearFilterCache()
+    >>> for _i in range(3):
+    ...     data = lowpass(np.random.randn(100), 5.0, df=100.0)
+    >>> sorted(filterCacheInfo().items())
+    [('hits', 2), ('maxsize', 128), ('misses', 1), ('size', 1)]
+    """
+    with _FILTER_CACHE_LOCK:
+        info = dict(_FILTER_CACHE_INFO)
+        info['size'] = len(_FILTER_CACHE)
+    info['maxsize'] = FILTER_CACHE_SIZE
+    return info
+
+
+def clearFilterCache():
+    """
+    Removes all designs from the filter design cache and resets its
+    statistics.
+    """
+    with _FILTER_CACHE_LOCK:
+        _FILTER_CACHE.clear()
+        _FILTER_CACHE_INFO['hits'] = 0
+        _FILTER_CACHE_INFO['misses'] = 0
 
 
 def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
@@ -30,7 +117,8 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
 
     Filter data from ``freqmin`` to ``freqmax`` using ``corners`` corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional
+        arrays are filtered along the last axis.
     :param freqmin: Pass band low corner frequency.
     :param freqmax: Pass band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -53,11 +141,10 @@ def bandpass(data, freqmin, freqmax, df, corners=4, zerophase=False):
     if low > 1:
         msg = "Selected low corner frequency is above Nyquist."
         raise ValueError(msg)
-    [b, a] = iirfilter(corners, [low, high], btype='band',
-                       ftype='butter', output='ba')
+    [b, a] = _butterworth(corners, (low, high), 'band')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -69,7 +156,8 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     Filter data removing data between frequencies ``freqmin`` and ``freqmax``
     using ``corners`` corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional
+        arrays are filtered along the last axis.
     :param freqmin: Stop band low corner frequency.
     :param freqmax: Stop band high corner frequency.
     :param df: Sampling rate in Hz.
@@ -92,11 +180,10 @@ def bandstop(data, freqmin, freqmax, df, corners=4, zerophase=False):
     if low > 1:
         msg = "Selected low corner frequency is above Nyquist."
         raise ValueError(msg)
-    [b, a] = iirfilter(corners, [low, high],
-                       btype='bandstop', ftype='butter', output='ba')
+    [b, a] = _butterworth(corners, (low, high), 'bandstop')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -108,7 +195,8 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
     Filter data removing data over certain frequency ``freq`` using ``corners``
     corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional
+        arrays are filtered along the last axis.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners. Note: This is twice the value of PITSA's
@@ -126,11 +214,10 @@ def lowpass(data, freq, df, corners=4, zerophase=False):
         msg = "Selected corner frequency is above Nyquist. " + \
               "Setting Nyquist as high corner."
         warnings.warn(msg)
-    [b, a] = iirfilter(corners, f, btype='lowpass', ftype='butter',
-                       output='ba')
+    [b, a] = _butterworth(corners, f, 'lowpass')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -142,7 +229,8 @@ def highpass(data, freq, df, corners=4, zerophase=False):
     Filter data removing data below certain frequency ``freq`` using
     ``corners`` corners.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional
+        arrays are filtered along the last axis.
     :param freq: Filter corner frequency.
     :param df: Sampling rate in Hz.
     :param corners: Filter corners. Note: This is twice the value of PITSA's
@@ -158,11 +246,10 @@ def highpass(data, freq, df, corners=4, zerophase=False):
     if f > 1:
         msg = "Selected corner frequency is above Nyquist."
         raise ValueError(msg)
-    [b, a] = iirfilter(corners, f, btype='highpass', ftype='butter',
-                       output='ba')
+    [b, a] = _butterworth(corners, f, 'highpass')
     if zerophase:
         firstpass = lfilter(b, a, data)
-        return lfilter(b, a, firstpass[::-1])[::-1]
+        return lfilter(b, a, firstpass[..., ::-1])[..., ::-1]
     else:
         return lfilter(b, a, data)
 
@@ -319,6 +406,84 @@ def integerDecimation(data, decimation_factor):
     return data
 
 
+def polyphaseResample(data, up, down, window=('kaiser', 5.0)):
+    """
+    Resampling by a rational factor using a polyphase FIR filter.
+
+    The data is upsampled by zero insertion by the integer factor ``up``,
+    lowpass filtered with a linear phase FIR filter and decimated by the
+    integer factor ``down``. Only the filter outputs actually kept are
+    computed, sorted by the polyphase components of the filter, so the
+    costs grow linearly with the data length and only arrays of the size of
+    input and output are allocated. The delay of the FIR filter is
+    compensated.
+
+    New sampling rate is old sampling rate multiplied by ``up / down``.
+
+    :param data: Data to resample.
+    :param up: Integer upsampling factor.
+    :param down: Integer downsampling factor.
+    :param window: Window used for the FIR filter design, see
+        :func:`scipy.signal.firwin`. Defaults to a Kaiser window with shape
+        parameter 5.0.
+    :return: Resampled data (array length: old length * up / down, rounded
+        up).
+
+    .. rubric:: Example
+
+    >>> data = np.sin(2 * np.pi * np.arange(500) / 50.0)
+    >>> resampled = polyphaseResample(data, 2, 5)
+    >>> len(resampled)
+    200
+    >>> expected = np.sin(2 * np.pi * np.arange(200) / 20.0)
+    >>> bool(abs(resampled - expected)[20:-20].max() < 0.01)
+    True
+    """
+    if not isinstance(up, (int, long)) or not isinstance(down, (int, long)) \
+       or up < 1 or down < 1:
+        msg = "Resampling factors up and down must be positive integers!"
+        raise TypeError(msg)
+    data = np.asarray(data, dtype='float64')
+    divisor = gcd(up, down)
+    up //= divisor
+    down //= divisor
+    if up == down == 1:
+        return data.copy()
+    npts = len(data)
+    npts_out = -(-npts * up // down)
+    # anti-alias filter at the lower of both Nyquist frequencies, scaled by up
+    # to preserve the amplitudes after zero insertion
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    if isinstance(window, list):
+        window = tuple(window)
+    key = ('polyphase', up, down, window)
+    h = _cachedDesign(key, lambda: firwin(2 * half_len + 1, 1.0 / max_rate,
+                                          window=window) * up)
+    # number of taps of each polyphase component
+    taps = -(-len(h) // up)
+    # output n is sum_k h[k] * x_up[n * down + half_len - k], for a fixed
+    # output phase only every up-th coefficient hits a non-zero sample
+    last = ((npts_out - 1) * down + half_len) // up
+    padded = np.zeros(max(last + 1, npts) + taps)
+    padded[taps:taps + npts] = data
+    out = np.zeros(npts_out)
+    for first in xrange(min(up, npts_out)):
+        acc = out[first::up]
+        count = len(acc)
+        pos = first * down + half_len
+        phase = pos % up
+        start = pos // up + taps
+        # outputs of the same phase read every down-th input sample
+        for j in xrange(taps):
+            k = phase + j * up
+            if k >= len(h):
+                break
+            stop = start - j + (count - 1) * down + 1
+            acc += h[k] * padded[start - j:stop:down]
+    return out
+
+
 def lowpassCheby2(data, freq, df, maxorder=12, ba=False,
                   freq_passband=False):
     """
@@ -332,7 +497,8 @@ def lowpassCheby2(data, freq, df, maxorder=12, ba=False,
     band frequency is determined dynamically, such that the
     values above the stop band frequency are lower than -96dB.
 
-    :param data: Data to filter, type numpy.ndarray.
+    :param data: Data to filter, type numpy.ndarray. Multidimensional
+        arrays are filtered along the last axis.
     :param freq: The frequency above which signals are attenuated
         with 95 dB
     :param df: Sampling rate in Hz.
@@ -345,23 +511,29 @@ def lowpassCheby2(data, freq, df, maxorder=12, ba=False,
     """
     nyquist = df * 0.5
     # rp - maximum ripple of passband, rs - attenuation of stopband
-    rp, rs, order = 1, 96, 1e99
+    rp, rs = 1, 96
     ws = freq / nyquist  # stop band frequency
-    wp = ws              # pass band frequency
+    wp0 = ws             # initial pass band frequency
     # raise for some bad scenarios
     if ws > 1:
         ws = 1.0
         msg = "Selected corner frequency is above Nyquist. " + \
               "Setting Nyquist as high corner."
         warnings.warn(msg)
-    while True:
-        if order <= maxorder:
-            break
-        wp = wp * 0.99
-        order, wn = cheb2ord(wp, ws, rp, rs, analog=0)
-    b, a = cheby2(order, rs, wn, btype='low', analog=0, output='ba')
+
+    def design():
+        wp, order = wp0, 1e99
+        while True:
+            if order <= maxorder:
+                break
+            wp = wp * 0.99
+            order, wn = cheb2ord(wp, ws, rp, rs, analog=0)
+        b, a = cheby2(order, rs, wn, btype='low', analog=0, output='ba')
+        return b, a, wp
+    key = ('cheby2', wp0, ws, rp, rs, maxorder)
+    b, a, wp = _cachedDesign(key, design)
     if ba:
-        return b, a
+        return b.copy(), a.copy()
     if freq_passband:
         return lfilter(b, a, data), wp * nyquist
     return lfilter(b, a, data)
@@ -19,6 +19,7 @@ to m/s.
     (http://www.gnu.org/copyleft/lesser.html)
 """
 
+from obspy.core.util import OrderedDict
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.core.util.decorator import deprecated_keywords
 from obspy.signal.detrend import simple as simpleDetrend
@@ -28,6 +29,7 @@ import math as M
 import numpy as np
 import os
 import scipy.signal
+import threading
 import util
 import warnings
 
@@ -244,6 +246,125 @@ def cornFreq2Paz(fc, damp=0.707):
     return {'poles': poles, 'zeros': [0j, 0j], 'gain': 1, 'sensitivity': 1.0}
 
 
+# maximal number of bytes of frequency responses kept in the response cache
+RESPONSE_CACHE_SIZE = 64 * 1024 ** 2
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_INFO = {'hits': 0, 'misses': 0, 'bytes': 0}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _cachedResponse(key, compute):
+    """
+    Returns the arrays for the given key from the frequency response cache.
+
+    The compute function is only called if the key is not cached yet. Cached
+    arrays are read-only. The least recently used responses are dropped if the
+    cached arrays exceed ``RESPONSE_CACHE_SIZE`` bytes, responses larger than
+    the whole cache are not cached at all.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        try:
+            value = _RESPONSE_CACHE.pop(key)
+        except KeyError:
+            pass
+        else:
+            _RESPONSE_CACHE[key] = value
+            _RESPONSE_CACHE_INFO['hits'] += 1
+            return value
+    value = compute()
+    nbytes = 0
+    for arr in value:
+        arr.flags.writeable = False
+        nbytes += arr.nbytes
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE_INFO['misses'] += 1
+        if nbytes > RESPONSE_CACHE_SIZE or key in _RESPONSE_CACHE:
+            return value
+        _RESPONSE_CACHE[key] = value
+        _RESPONSE_CACHE_INFO['bytes'] += nbytes
+        while _RESPONSE_CACHE_INFO['bytes'] > RESPONSE_CACHE_SIZE:
+            _k, old = _RESPONSE_CACHE.popitem(last=False)
+            _RESPONSE_CACHE_INFO['bytes'] -= sum([a.nbytes for a in old])
+    return value
+
+
+def _pazKey(paz, t_samp, nfft):
+    """
+    Returns a hashable key of the PAZ contents, sampling interval and nfft.
+    """
+    return (tuple([complex(p) for p in paz['poles']]),
+            tuple([complex(z) for z in paz['zeros']]),
+            float(paz['gain']), float(t_samp), int(nfft))
+
+
+def _pazResponse(paz, t_samp, nfft):
+    """
+    Returns the cached (read-only) frequency response and frequencies of the
+    given PAZ, see :func:`pazToFreqResp`.
+    """
+    key = _pazKey(paz, t_samp, nfft)
+    return _cachedResponse(key, lambda: _pazToFreqResp(paz['poles'],
+        paz['zeros'], paz['gain'], t_samp, nfft))
+
+
+def _inversePazResponse(paz, t_samp, nfft, water_level):
+    """
+    Returns the cached (read-only) water-levelled inverse frequency response
+    and frequencies of the given PAZ, see :func:`specInv`.
+    """
+    def compute():
+        freq_response, freqs = _pazResponse(paz, t_samp, nfft)
+        freq_response = freq_response.copy()
+        specInv(freq_response, water_level)
+        return freq_response, freqs
+    key = _pazKey(paz, t_samp, nfft) + (float(water_level),)
+    return _cachedResponse(key, compute)
+
+
+def responseCacheInfo():
+    """
+    Returns statistics of the frequency response cache.
+
+    :func:`seisSim` caches the frequency responses and the water-levelled
+    inverse responses of the given PAZ for each sampling rate and FFT length,
+    so correcting many data segments of the same channel and length computes
+    the responses only once.
+
+    :rtype: dict
+    :return: Dictionary with the number of cache ``hits`` and ``misses``,
+        the number of currently cached responses (``size``), the bytes used
+        by them (``bytes``) and the maximal number of bytes (``maxbytes``).
+
+    .. rubric:: Example
+
+    >>> import numpy as np
+    >>> paz = cornFreq2Paz(1.0)
+    >>> clearResponseCache()
+    >>> for _i in range(3):
+    ...     data = seisSim(np.random.randn(100), 100.0, paz_remove=paz)
+    >>> info = responseCacheInfo()
+    >>> info['hits'], info['misses'], info['size']
+    (2, 2, 2)
+    """
+    with _RESPONSE_CACHE_LOCK:
+        info = dict(_RESPONSE_CACHE_INFO)
+        info['size'] = len(_RESPONSE_CACHE)
+    info['maxbytes'] = RESPONSE_CACHE_SIZE
+    return info
+
+
+def clearResponseCache():
+    """
+    Removes all responses from the frequency response cache and resets its
+    statistics.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+        _RESPONSE_CACHE_INFO['hits'] = 0
+        _RESPONSE_CACHE_INFO['misses'] = 0
+        _RESPONSE_CACHE_INFO['bytes'] = 0
+
+
 @deprecated_keywords({'pitsa': None})
 def pazToFreqResp(poles, zeros, scale_fac, t_samp, nfft, freq=False):
     """
@@ -275,6 +396,19 @@ def pazToFreqResp(poles, zeros, scale_fac, t_samp, nfft, freq=False):
         negative values in order to get a plot from [0, 2pi]:
         where(phi<0,phi+2*pi,phi); plot(f,phi)
     """
+    paz = {'poles': poles, 'zeros': zeros, 'gain': scale_fac}
+    h, f = _pazResponse(paz, t_samp, nfft)
+    # return writable copies, cached responses are shared
+    if freq:
+        return h.copy(), f.copy()
+    return h.copy()
+
+
+def _pazToFreqResp(poles, zeros, scale_fac, t_samp, nfft):
+    """
+    Computes the frequency response and frequencies of the given PAZ without
+    using the response cache, see :func:`pazToFreqResp`.
+    """
     n = nfft // 2
     b, a = scipy.signal.ltisys.zpk2tf(zeros, poles, scale_fac)
     # a has to be a list for the scipy.signal.freqs() call later but zpk2tf()
@@ -285,9 +419,7 @@ def pazToFreqResp(poles, zeros, scale_fac, t_samp, nfft, freq=False):
     # start at zero to get zero for offset / DC of fft
     f = np.linspace(0, fy, n + 1)
     _w, h = scipy.signal.freqs(b, a, f * 2 * np.pi)
-    if freq:
-        return h, f
-    return h
+    return h, f
 
 
 def waterlevel(spec, wlev):
@@ -340,7 +472,8 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
     Simulate/Correct seismometer.
 
     :type data: NumPy ndarray
-    :param data: Seismogram, detrend before hand (e.g. zero mean)
+    :param data: Seismogram, detrend before hand (e.g. zero mean).
+        Multidimensional arrays are simulated along the last axis.
     :type samp_rate: Float
     :param samp_rate: Sample Rate of Seismogram
     :type paz_remove: Dictionary, None
@@ -433,10 +566,10 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
     # Translated from PITSA: spr_resg.c
     delta = 1.0 / samp_rate
     #
-    ndat = len(data)
+    ndat = data.shape[-1]
     data = data.astype("float64")
     if zero_mean:
-        data -= data.mean()
+        data -= data.mean(axis=-1)[..., np.newaxis]
     if taper:
         if sacsim:
             data *= cosTaper(ndat, taper_fraction,
@@ -459,10 +592,8 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
     data = np.fft.rfft(data, n=nfft)
     # Inverse filtering = Instrument correction
     if paz_remove:
-        freq_response, freqs = pazToFreqResp(paz_remove['poles'],
-                                             paz_remove['zeros'],
-                                             paz_remove['gain'], delta, nfft,
-                                             freq=True)
+        freq_response, freqs = _inversePazResponse(paz_remove, delta, nfft,
+                                                   water_level)
     if seedresp:
         freq_response, freqs = evalresp(delta, nfft, seedresp['filename'],
                                         seedresp['date'],
@@ -483,17 +614,17 @@ def seisSim(data, samp_rate, paz_remove=None, paz_simulate=None,
                 cos_win = cosTaper(freqs.size, freqs=freqs,
                                    flimit=(fl1, fl2, fl3, fl4))
             data *= cos_win
-        specInv(freq_response, water_level)
+        if seedresp:
+            specInv(freq_response, water_level)
         data *= freq_response
         del freq_response
     # Forward filtering = Instrument simulation
     if paz_simulate:
-        data *= pazToFreqResp(paz_simulate['poles'],
-                paz_simulate['zeros'], paz_simulate['gain'], delta, nfft)
+        data *= _pazResponse(paz_simulate, delta, nfft)[0]
 
-    data[-1] = abs(data[-1]) + 0.0j
+    data[..., -1] = abs(data[..., -1]) + 0.0j
     # transform data back into the time domain
-    data = np.fft.irfft(data)[0:ndat]
+    data = np.fft.irfft(data)[..., 0:ndat]
     if pitsasim:
         # linear detrend
         data = simpleDetrend(data)
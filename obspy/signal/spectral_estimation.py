@@ -22,10 +22,16 @@ import warnings
 import pickle
 import math
 import bisect
+import collections
+import copy
+import multiprocessing
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from scipy import sparse
 from obspy import Trace, Stream
-from obspy.core.util import getMatplotlibVersion
-from obspy.signal import cosTaper
+from obspy.core.utcdatetime import UTCDateTimeArray
+from obspy.core.util import AttribDict, getMatplotlibVersion
+from obspy.signal import cosTaper, seisSim
 from obspy.signal.util import prevpow2
 
 
@@ -224,6 +230,116 @@ def welch_window(N):
     return taper
 
 
+def _linear_detrend(data):
+    """
+    Removes the least squares line along the last axis (like
+    :func:`matplotlib.mlab.detrend_linear` does for 1D data).
+    """
+    x = np.arange(data.shape[-1], dtype=np.float64)
+    x -= x.mean()
+    data = data - data.mean(axis=-1)[..., np.newaxis]
+    slope = np.dot(data, x) / np.dot(x, x)
+    data -= slope[..., np.newaxis] * x
+    return data
+
+
+def _gradient(data, delta):
+    """
+    Returns the gradient along the last axis (like :func:`numpy.gradient`
+    does for 1D data), i.e. central differences in the interior and one-sided
+    differences at the boundaries.
+    """
+    gradient = np.empty_like(data)
+    gradient[..., 1:-1] = (data[..., 2:] - data[..., :-2]) / (2.0 * delta)
+    gradient[..., 0] = (data[..., 1] - data[..., 0]) / delta
+    gradient[..., -1] = (data[..., -1] - data[..., -2]) / delta
+    return gradient
+
+
+def _welch_psd(data, nfft, sampling_rate, noverlap):
+    """
+    Computes the onesided psds of all rows of data at once, like :func:`psd`
+    with linear detrending and :func:`fft_taper` as window does for a single
+    row.
+
+    The overlapping windows of all rows are taken as strided view on the data
+    and transformed by a single FFT.
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    step = nfft - noverlap
+    num_windows = 1 + (data.shape[-1] - nfft) // step
+    itemsize = data.strides[-1]
+    windows = as_strided(data, shape=(len(data), num_windows, nfft),
+                         strides=(data.strides[0], step * itemsize, itemsize))
+    windows = _linear_detrend(windows)
+    taper = fft_taper(np.ones(nfft))
+    windows *= taper
+    spec = np.fft.rfft(windows)
+    spec = spec.real ** 2 + spec.imag ** 2
+    # onesided density: scale everything except the offset and the Nyquist
+    # frequency, normalize to dB/Hz and compensate the windowing loss
+    spec[..., 1:-1] *= 2.0
+    spec /= sampling_rate
+    spec /= (taper ** 2).sum()
+    return spec.mean(axis=1)
+
+
+def _process_segments(args):
+    """
+    Computes the psds of a batch of PPSD segments.
+
+    All arguments are passed as a single tuple of the segments (one per row),
+    the poles and zeros, the sampling rate, nfft, the number of overlapping
+    samples and the rotational data flag, so the function can be used with a
+    process pool. Returns the psds in dB sorted by increasing period, one
+    segment per row.
+    """
+    data, paz, sampling_rate, nfft, nlap, is_rotational_data = args
+    # restitution:
+    # mcnamara apply the correction at the end in freq-domain,
+    # does it make a difference?
+    if is_rotational_data:
+        # in case of rotational data just remove sensitivity
+        data = data.astype("float64")
+        data /= paz['sensitivity']
+    else:
+        data = seisSim(data, sampling_rate, paz_remove=paz,
+                       remove_sensitivity=True, paz_simulate=None,
+                       simulate_sensitivity=False)
+        # go to acceleration, do nothing for rotational data
+        data = _gradient(data, 1.0 / sampling_rate)
+    spec = _welch_psd(data, nfft, sampling_rate, nlap)
+    # leave out first entry (offset) and reverse the spectrum, we are working
+    # with the periods not frequencies later
+    spec = spec[:, :0:-1]
+    # avoid calculating log of zero
+    spec[spec < dtiny] = dtiny
+    # go to dB
+    spec = np.log10(spec)
+    spec *= 10
+    return spec
+
+
+def _imap_bounded(pool, func, items, size):
+    """
+    Applies func to the arguments of all ``(key, args)`` items in the worker
+    processes of the pool, yielding ``(key, result)`` in order.
+
+    In contrast to ``pool.imap`` the items are only taken from the iterator
+    while less than ``size`` results are pending, so that a generator of
+    large arguments is not consumed at once.
+    """
+    pending = collections.deque()
+    for key, args in items:
+        pending.append((key, pool.apply_async(func, (args,))))
+        if len(pending) >= size:
+            key, result = pending.popleft()
+            yield key, result.get()
+    while pending:
+        key, result = pending.popleft()
+        yield key, result.get()
+
+
 class PPSD():
     """
     Class to compile probabilistic power spectral densities for one combination
@@ -270,6 +386,14 @@ class PPSD():
     >>> import pickle
     >>> ppsd = pickle.load("myfile.pkl")  # doctest: +SKIP
 
+    A more compact and portable alternative is saving the histogram and time
+    coverage as NumPy ``.npz`` file. PPSDs of the same station computed
+    separately, e.g. day by day, can be combined afterwards.
+
+    >>> ppsd.save_npz("myfile.npz") # doctest: +SKIP
+    >>> ppsd = PPSD.load_npz("myfile.npz") # doctest: +SKIP
+    >>> ppsd += PPSD.load_npz("myfile2.npz") # doctest: +SKIP
+
     For a real world example see the `ObsPy Tutorial`_.
 
     .. note::
@@ -281,7 +405,8 @@ class PPSD():
     .. _`ObsPy Tutorial`: http://docs.obspy.org/tutorial/
     """
     def __init__(self, stats, paz=None, parser=None, skip_on_gaps=False,
-                 is_rotational_data=False, db_bins=[-200, -50, 0.5]):
+                 is_rotational_data=False, db_bins=[-200, -50, 0.5],
+                 keep_psds=False):
         """
         Initialize the PPSD object setting all fixed information on the station
         that should not change afterwards to guarantee consistent spectral
@@ -329,6 +454,10 @@ class PPSD():
         :param db_bins: Specify the lower and upper boundary and the width of
                 the db bins. The bin width might get adjusted to fit  a number
                 of equally spaced bins in between the given boundaries.
+        :type keep_psds: Boolean (optional)
+        :param keep_psds: If set to True the octave averaged psd of every
+                processed segment is stored, so histograms and percentiles of
+                arbitrary sub-periods can be computed later on.
         """
         # check if matplotlib is available, no official dependency for
         # obspy.signal
@@ -374,11 +503,16 @@ class PPSD():
         self.times_data = []
         self.times_gaps = []
         self.hist_stack = None
+        self.keep_psds = keep_psds
+        self.psd_times = []
+        self.psd_values = []
         self.__setup_bins()
         # set up the binning for the db scale
         num_bins = int((db_bins[1] - db_bins[0]) / db_bins[2])
         self.spec_bins = np.linspace(db_bins[0], db_bins[1], num_bins + 1,
                                      endpoint=True)
+        self.xedges = np.array(self.period_bins)
+        self.yedges = self.spec_bins
         self.colormap = LinearSegmentedColormap('mcnamara', CDICT, 1024)
 
     def __setup_bins(self):
@@ -424,6 +558,114 @@ class PPSD():
         # mid-points of all the period bins
         self.period_bin_centers = np.mean((self.period_bins[:-1],
                                            self.period_bins[1:]), axis=0)
+        self.__setup_octave_averaging()
+
+    def __setup_octave_averaging(self):
+        """
+        Sets up the sparse matrix summing up a spectrum over all octave bins,
+        the number of spectral values per octave bin and the period bin index
+        of every octave bin.
+        """
+        # the periods are sorted, so every octave bin is a contiguous range
+        # of periods
+        starts = self.per.searchsorted(self.per_octaves_left, side="left")
+        stops = self.per.searchsorted(self.per_octaves_right, side="right")
+        counts = stops - starts
+        rows = np.repeat(np.arange(len(counts)), counts)
+        cols = np.concatenate([np.arange(start, stop)
+                               for start, stop in zip(starts, stops)])
+        self.__octave_sums = sparse.coo_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(counts), len(self.per))).tocsr()
+        self.__octave_counts = counts.astype("float64")
+        # the octave bin centers are the period bin edges, the last center
+        # belongs to the last period bin (as in np.histogram2d)
+        self.__period_bin_index = np.minimum(np.arange(len(counts)),
+                                             len(self.period_bins) - 2)
+
+    def __setstate__(self, state):
+        """
+        Restores pickled PPSD objects, including those pickled before the
+        octave summation matrix was introduced.
+        """
+        self.__dict__.update(state)
+        if "_PPSD__octave_sums" not in state:
+            self.__setup_octave_averaging()
+        if "keep_psds" not in state:
+            self.keep_psds = False
+            self.psd_times = []
+            self.psd_values = []
+
+    def __add__(self, other):
+        """
+        Returns a new PPSD combining the histograms and time coverage of both
+        PPSD objects, see :meth:`merge`.
+        """
+        ppsd = copy.deepcopy(self)
+        ppsd.merge(other)
+        return ppsd
+
+    def __iadd__(self, other):
+        """
+        Merges the other PPSD into the current one, see :meth:`merge`.
+        """
+        self.merge(other)
+        return self
+
+    def merge(self, other):
+        """
+        Merges the histogram and the time coverage of another PPSD of the same
+        station into the current PPSD, e.g. to combine PPSDs computed day by
+        day on different machines.
+
+        Both PPSD objects must use the same processing parameters and bins,
+        must both store the psds of single segments or not and must not cover
+        the same time segments. Stored psds of single segments are merged as
+        well.
+
+        :type other: :class:`~obspy.signal.spectral_estimation.PPSD`
+        :param other: PPSD to merge into the current one.
+        """
+        if not isinstance(other, PPSD):
+            msg = "Only PPSD objects can be merged, got %s" % \
+                type(other).__name__
+            raise TypeError(msg)
+        if other.id != self.id:
+            raise TypeError("PPSD ID differs")
+        if other.sampling_rate != self.sampling_rate:
+            raise TypeError("Sampling rate differs")
+        if other.is_rotational_data != self.is_rotational_data:
+            raise TypeError("Processing of rotational data differs")
+        if other.nfft != self.nfft or other.nlap != self.nlap or \
+           not np.array_equal(other.period_bins, self.period_bins) or \
+           not np.array_equal(other.spec_bins, self.spec_bins):
+            raise TypeError("Period or db binning differs")
+        if other.merge_method != self.merge_method:
+            raise TypeError("Handling of gaps (skip_on_gaps) differs")
+        if other.keep_psds != self.keep_psds:
+            raise TypeError("Storing of single psds (keep_psds) differs")
+        for utcdatetime in other.times_used:
+            if self.__check_time_present(utcdatetime):
+                msg = "Already covered time spans detected (e.g. %s)"
+                raise ValueError(msg % utcdatetime)
+        if other.hist_stack is not None:
+            if self.hist_stack is None:
+                self.hist_stack = other.hist_stack.copy()
+            else:
+                self.hist_stack += other.hist_stack
+        # keep the identity of the time lists, self.times is an alias
+        self.times_used.extend(other.times_used)
+        self.times_used.sort()
+        self.times_data += other.times_data
+        self.times_data.sort()
+        self.times_gaps += other.times_gaps
+        self.times_gaps.sort()
+        if self.keep_psds:
+            times = self.psd_times + other.psd_times
+            values = self.psd_values + other.psd_values
+            order = sorted(range(len(times)), key=times.__getitem__)
+            self.psd_times = [times[i] for i in order]
+            self.psd_values = [values[i] for i in order]
 
     def __sanity_check(self, trace):
         """
@@ -466,7 +708,7 @@ class PPSD():
         self.times_data += \
                 [[tr.stats.starttime, tr.stats.endtime] for tr in stream]
 
-    def __check_time_present(self, utcdatetime):
+    def __check_time_present(self, utcdatetime, times=None):
         """
         Checks if the given UTCDateTime is already part of the current PPSD
         instance. That is, checks if from utcdatetime to utcdatetime plus 1
@@ -474,25 +716,40 @@ class PPSD():
         Returns True if adding an one hour piece starting at the given time
         would result in an overlap of the ppsd data base, False if it is OK to
         insert this piece of data.
+
+        Optionally checks against the given sorted list of start times
+        instead of the used times of the PPSD.
         """
-        index1 = bisect.bisect_left(self.times_used, utcdatetime)
-        index2 = bisect.bisect_right(self.times_used,
-                                     utcdatetime + PPSD_LENGTH)
+        if times is None:
+            times = self.times_used
+        index1 = bisect.bisect_left(times, utcdatetime)
+        index2 = bisect.bisect_right(times, utcdatetime + PPSD_LENGTH)
         if index1 != index2:
             return True
         else:
             return False
 
-    def add(self, stream, verbose=False):
+    def add(self, stream, verbose=False, batch_size=8, processes=None):
         """
         Process all traces with compatible information and add their spectral
         estimates to the histogram containg the probabilistic psd.
         Also ensures that no piece of data is inserted twice.
 
+        The one hour segments are processed in batches sharing the same
+        instrument response, computing the psds of all segments of a batch at
+        once. The batches can be distributed to multiple processes.
+
         :type stream: :class:`~obspy.core.stream.Stream` or
                 :class:`~obspy.core.trace.Trace`
         :param stream: Stream or trace with data that should be added to the
                 probabilistic psd histogram.
+        :type batch_size: int (optional)
+        :param batch_size: Maximal number of one hour segments processed at
+                once. Larger batches need more memory.
+        :type processes: int (optional)
+        :param processes: Number of worker processes the batches are
+                distributed to. By default all batches are processed in the
+                current process.
         :returns: True if appropriate data were found and the ppsd statistics
                 were changed, False otherwise.
         """
@@ -510,143 +767,193 @@ class PPSD():
         # merge depending on skip_on_gaps set during __init__
         stream.merge(self.merge_method, fill_value=0)
 
+        batches = self.__batches(stream, verbose, batch_size)
+        pool = None
+        if processes:
+            pool = multiprocessing.Pool(processes)
+            # only a few batches per process are pending at any time
+            results = _imap_bounded(pool, _process_segments, batches,
+                                    2 * processes)
+        else:
+            results = ((times, _process_segments(args))
+                       for times, args in batches)
+        try:
+            for times, spec in results:
+                # mean of the spectral values in all octave bins of all
+                # segments of the batch at once
+                spec_octaves = (self.__octave_sums * spec.T).T / \
+                    self.__octave_counts
+                self.__add_to_histogram(spec_octaves)
+                if self.keep_psds:
+                    self.__insert_psds(times, spec_octaves)
+                for t in times:
+                    self.__insert_used_time(t)
+                changed = True
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        return changed
+
+    def __batches(self, stream, verbose=False, batch_size=8):
+        """
+        Generator yielding the start times and the arguments of
+        :func:`_process_segments` for batches of one hour segments not yet
+        covered by the PPSD. The segments of a batch share the same
+        instrument response and are copied from a strided view on the trace
+        data.
+
+        The start times of the segments are only inserted into the list of
+        used times once their psds are added, segments overlapping with
+        already selected ones are skipped nonetheless.
+        """
+        settings = (self.sampling_rate, self.nfft, self.nlap,
+                    self.is_rotational_data)
+        # start times of all segments selected so far
+        selected = []
         for tr in stream:
             # the following check should not be necessary due to the select()..
             if not self.__sanity_check(tr):
                 msg = "Skipping incompatible trace."
                 warnings.warn(msg)
                 continue
+            data = tr.data
+            # if trace has a masked array we fill in zeros
+            if isinstance(data, np.ma.masked_array):
+                data = data.filled(0)
+            if len(data) < self.len:
+                continue
+            # view on the one hour segments starting at every sample
+            segments = as_strided(data,
+                                  shape=(len(data) - self.len + 1, self.len),
+                                  strides=(data.strides[0], data.strides[0]))
+            starts = []
+            times = []
+            batch_paz = None
             t1 = tr.stats.starttime
             t2 = tr.stats.endtime
             while t1 + PPSD_LENGTH <= t2:
-                if self.__check_time_present(t1):
+                start = int(round((t1 - tr.stats.starttime) *
+                                  self.sampling_rate))
+                if self.__check_time_present(t1) or \
+                        self.__check_time_present(t1, selected):
                     msg = "Already covered time spans detected (e.g. %s), " + \
                           "skipping these slices."
                     msg = msg % t1
                     warnings.warn(msg)
-                else:
-                    # throw warnings if trace length is different
-                    # than one hour..!?!
-                    slice = tr.slice(t1, t1 + PPSD_LENGTH)
-                    # XXX not good, should be working in place somehow
-                    # XXX how to do it with the padding, though?
-                    success = self.__process(slice)
-                    if success:
-                        self.__insert_used_time(t1)
+                elif start < len(segments):
+                    paz = self.__get_paz(t1)
+                    if paz is not None:
+                        if starts and (paz != batch_paz or
+                                       len(starts) >= batch_size):
+                            yield times, \
+                                (segments[starts], batch_paz) + settings
+                            starts = []
+                            times = []
+                        starts.append(start)
+                        times.append(t1)
+                        batch_paz = paz
+                        bisect.insort(selected, t1)
                         if verbose:
                             print t1
-                        changed = True
                 t1 += PPSD_STRIDE  # advance half an hour
+            if starts:
+                yield times, (segments[starts], batch_paz) + settings
 
-            # enforce time limits, pad zeros if gaps
-            #tr.trim(t, t+PPSD_LENGTH, pad=True)
-        return changed
-
-    def __process(self, tr):
+    def __get_paz(self, starttime):
         """
-        Processes a one-hour segment of data and adds the information to the
-        PPSD histogram. If Trace is compatible (station, channel, ...) has to
-        checked beforehand.
-
-        :type tr: :class:`~obspy.core.trace.Trace`
-        :param tr: Compatible Trace with data of one PPSD segment
-        :returns: True if segment was successfully added to histogram, False
-                otherwise.
+        Returns the instrument response for a segment starting at the given
+        time, preferably from the parser object, or None if no response
+        information is available.
         """
-        # XXX DIRTY HACK!!
-        if len(tr) == self.len + 1:
-            tr.data = tr.data[:-1]
-        # one last check..
-        if len(tr) != self.len:
-            msg = "Got an non-one-hour piece of data to process. Skipping"
-            warnings.warn(msg)
-            print len(tr), self.len
-            return False
-        # being paranoid, only necessary if in-place operations would follow
-        tr.data = tr.data.astype("float64")
-        # if trace has a masked array we fill in zeros
-        try:
-            tr.data[tr.data.mask] = 0.0
-        # if it is no masked array, we get an AttributeError
-        # and have nothing to do
-        except AttributeError:
-            pass
-
-        # get instrument response preferably from parser object
         try:
-            paz = self.parser.getPAZ(self.id, datetime=tr.stats.starttime)
+            paz = self.parser.getPAZ(self.id, datetime=starttime)
         except Exception, e:
             if self.parser is not None:
                 msg = "Error getting response from parser:\n%s: %s\n" \
                       "Skipping time segment(s)."
                 msg = msg % (e.__class__.__name__, e.message)
                 warnings.warn(msg)
-                return False
+                return None
             paz = self.paz
         if paz is None:
             msg = "Missing poles and zeros information for response " \
                   "removal. Skipping time segment(s)."
             warnings.warn(msg)
-            return False
-        # restitution:
-        # mcnamara apply the correction at the end in freq-domain,
-        # does it make a difference?
-        # probably should be done earlier on bigger chunk of data?!
-        if self.is_rotational_data:
-            # in case of rotational data just remove sensitivity
-            tr.data /= paz['sensitivity']
-        else:
-            tr.simulate(paz_remove=paz, remove_sensitivity=True,
-                        paz_simulate=None, simulate_sensitivity=False)
+            return None
+        return paz
 
-        # go to acceleration, do nothing for rotational data:
-        if self.is_rotational_data:
-            pass
+    def __add_to_histogram(self, spec_octaves):
+        """
+        Adds the octave averaged psds of one or more segments (one segment
+        per row) to the histogram stack.
+        """
+        hist = self.__histogram(spec_octaves)
+        if self.hist_stack is None:
+            # only during first run initialize stack with first histogram
+            self.hist_stack = hist
         else:
-            tr.data = np.gradient(tr.data, self.delta)
-
-        # use our own wrapper for mlab.psd to have consistent results on all
-        # matplotlib versions
-        spec, _freq = psd(tr.data, self.nfft, self.sampling_rate,
-                          detrend=mlab.detrend_linear, window=fft_taper,
-                          noverlap=self.nlap)
-
-        # leave out first entry (offset)
-        spec = spec[1:]
-
-        # working with the periods not frequencies later so reverse spectrum
-        spec = spec[::-1]
-
-        # avoid calculating log of zero
-        idx = spec < dtiny
-        spec[idx] = dtiny
-
-        # go to dB
-        spec = np.log10(spec)
-        spec *= 10
-
-        spec_octaves = []
-        # do this for the whole period range and append the values to our lists
-        for per_left, per_right in zip(self.per_octaves_left,
-                                       self.per_octaves_right):
-            specs = spec[(per_left <= self.per) & (self.per <= per_right)]
-            spec_center = specs.mean()
-            spec_octaves.append(spec_center)
-        spec_octaves = np.array(spec_octaves)
+            self.hist_stack += hist
 
-        hist, self.xedges, self.yedges = np.histogram2d(self.per_octaves,
-                spec_octaves, bins=(self.period_bins, self.spec_bins))
+    def __histogram(self, spec_octaves):
+        """
+        Returns the histogram of the octave averaged psds of one or more
+        segments (one segment per row).
 
-        try:
-            # we have to make sure manually that the bins are always the same!
-            # this is done with the various assert() statements above.
-            self.hist_stack += hist
-        except TypeError:
-            # only during first run initialize stack with first histogram
-            self.hist_stack = hist
-        return True
+        psd values outside the db range are skipped, the upper edge of the db
+        range belongs to the last bin (as in np.histogram2d).
+        """
+        spec_octaves = np.atleast_2d(spec_octaves)
+        num_period_bins = len(self.period_bins) - 1
+        num_spec_bins = len(self.spec_bins) - 1
+        db_index = self.spec_bins.searchsorted(spec_octaves, side="right") - 1
+        db_index[spec_octaves == self.spec_bins[-1]] = num_spec_bins - 1
+        valid = (db_index >= 0) & (db_index < num_spec_bins)
+        index = self.__period_bin_index * num_spec_bins + db_index
+        hist = np.bincount(index[valid],
+                           minlength=num_period_bins * num_spec_bins)
+        return hist.reshape(num_period_bins, num_spec_bins).astype("float64")
+
+    def __insert_psds(self, times, spec_octaves):
+        """
+        Stores the octave averaged psds of the segments starting at the given
+        times keeping the order of the start times intact.
+        """
+        for utcdatetime, spec in zip(times, spec_octaves):
+            index = bisect.bisect(self.psd_times, utcdatetime)
+            self.psd_times.insert(index, utcdatetime)
+            self.psd_values.insert(index, spec)
 
-    def get_percentile(self, percentile=50, hist_cum=None):
+    def get_histogram(self, starttime=None, endtime=None):
+        """
+        Returns the histogram of all segments starting in the given time span
+        computed from the stored psds of the single segments (see
+        `keep_psds` option during initialization).
+
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+            (optional)
+        :param starttime: Only use segments starting at or after this time.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+            (optional)
+        :param endtime: Only use segments starting at or before this time.
+        :returns: Histogram of the same shape as the histogram stack.
+        """
+        if not self.psd_times:
+            msg = "No psds of single segments stored, use keep_psds=True."
+            raise ValueError(msg)
+        index1 = 0
+        index2 = len(self.psd_times)
+        if starttime is not None:
+            index1 = bisect.bisect_left(self.psd_times, starttime)
+        if endtime is not None:
+            index2 = bisect.bisect_right(self.psd_times, endtime)
+        if index1 >= index2:
+            return np.zeros((len(self.period_bins) - 1,
+                             len(self.spec_bins) - 1))
+        return self.__histogram(np.array(self.psd_values[index1:index2]))
+
+    def get_percentile(self, percentile=50, hist_cum=None, starttime=None,
+                       endtime=None):
         """
         Returns periods and approximate psd values for given percentile value.
 
@@ -658,10 +965,21 @@ class PPSD():
                 cumulative histogram can be provided here (to avoid computing
                 it again), otherwise it is computed from the currently stored
                 histogram.
+        :type starttime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+                (optional)
+        :param starttime: Only use segments starting at or after this time,
+                see :meth:`get_histogram`.
+        :type endtime: :class:`~obspy.core.utcdatetime.UTCDateTime`
+                (optional)
+        :param endtime: Only use segments starting at or before this time,
+                see :meth:`get_histogram`.
         :returns: (periods, percentile_values)
         """
         if hist_cum is None:
-            hist_cum = self.__get_normalized_cumulative_histogram()
+            hist = None
+            if starttime is not None or endtime is not None:
+                hist = self.get_histogram(starttime, endtime)
+            hist_cum = self.__get_normalized_cumulative_histogram(hist)
         # go to percent
         percentile = percentile / 100.0
         if percentile == 0:
@@ -676,14 +994,16 @@ class PPSD():
         percentile_values = self.spec_bins[percentile_values]
         return (self.period_bin_centers, percentile_values)
 
-    def __get_normalized_cumulative_histogram(self):
+    def __get_normalized_cumulative_histogram(self, hist=None):
         """
-        Returns the current histogram in a cumulative version normalized per
-        period column, i.e. going from 0 to 1 from low to high psd values for
-        every period column.
+        Returns the current (or the given) histogram in a cumulative version
+        normalized per period column, i.e. going from 0 to 1 from low to high
+        psd values for every period column.
         """
+        if hist is None:
+            hist = self.hist_stack
         # sum up the columns to cumulative entries
-        hist_cum = self.hist_stack.cumsum(axis=1)
+        hist_cum = hist.cumsum(axis=1)
         # normalize every column with its overall number of entries
         # (can vary from the number of self.times because of values outside
         #  the histogram db ranges)
@@ -704,6 +1024,102 @@ class PPSD():
         with open(filename, "w") as file:
             pickle.dump(self, file)
 
+    def save_npz(self, filename):
+        """
+        Saves the histogram, the binning and the time coverage of the PPSD
+        (and the psds of the single segments if stored) as compressed NumPy
+        ``.npz`` file that can be loaded again using :meth:`load_npz`.
+
+        All times are stored as integer nanoseconds. Parser objects are not
+        saved, static poles and zeros only if given as dictionary.
+
+        :type filename: str
+        :param filename: Name of output file
+        """
+        def ns(times):
+            if not times:
+                return np.empty(0, dtype="int64")
+            return UTCDateTimeArray(times).ns
+
+        def ns_spans(spans):
+            return np.array([ns(span) for span in spans],
+                            dtype="int64").reshape(-1, 2)
+
+        hist_stack = self.hist_stack
+        if hist_stack is None:
+            hist_stack = np.zeros((len(self.period_bins) - 1,
+                                   len(self.spec_bins) - 1))
+        psd_values = np.array(self.psd_values, dtype="float64").reshape(
+            len(self.psd_values), len(self.per_octaves))
+        kwargs = {}
+        if isinstance(self.paz, dict) and "poles" in self.paz:
+            kwargs["poles"] = np.array(self.paz["poles"], dtype="complex128")
+            kwargs["zeros"] = np.array(self.paz["zeros"], dtype="complex128")
+            kwargs["gain"] = self.paz["gain"]
+            kwargs["sensitivity"] = self.paz.get("sensitivity", np.nan)
+        elif isinstance(self.paz, dict) and "sensitivity" in self.paz:
+            kwargs["sensitivity"] = self.paz["sensitivity"]
+        np.savez_compressed(
+            filename, id=self.id, sampling_rate=self.sampling_rate,
+            is_rotational_data=self.is_rotational_data,
+            skip_on_gaps=self.merge_method == -1, keep_psds=self.keep_psds,
+            spec_bins=self.spec_bins, hist_stack=hist_stack,
+            times_used=ns(self.times_used),
+            times_data=ns_spans(self.times_data),
+            times_gaps=ns_spans(self.times_gaps),
+            psd_times=ns(self.psd_times), psd_values=psd_values, **kwargs)
+
+    @staticmethod
+    def load_npz(filename, paz=None, parser=None):
+        """
+        Loads a PPSD saved with :meth:`save_npz`.
+
+        :type filename: str
+        :param filename: Name of the ``.npz`` file
+        :type paz: dict (optional)
+        :param paz: Response information used when adding more data, defaults
+                to the saved poles and zeros if present.
+        :type parser: :class:`obspy.xseed.parser.Parser` (optional)
+        :param parser: Parser instance with response information used when
+                adding more data.
+        :rtype: :class:`~obspy.signal.spectral_estimation.PPSD`
+        """
+        npz = np.load(filename)
+        try:
+            data = dict(npz.items())
+        finally:
+            npz.close()
+        network, station, location, channel = str(data["id"]).split(".")
+        stats = AttribDict({"network": network, "station": station,
+                            "location": location, "channel": channel,
+                            "sampling_rate": float(data["sampling_rate"])})
+        if paz is None and "poles" in data:
+            paz = {"poles": data["poles"].tolist(),
+                   "zeros": data["zeros"].tolist(),
+                   "gain": float(data["gain"]),
+                   "sensitivity": float(data["sensitivity"])}
+        elif paz is None and "sensitivity" in data:
+            paz = {"sensitivity": float(data["sensitivity"])}
+        spec_bins = data["spec_bins"]
+        ppsd = PPSD(stats, paz=paz, parser=parser,
+                    skip_on_gaps=bool(data["skip_on_gaps"]),
+                    is_rotational_data=bool(data["is_rotational_data"]),
+                    keep_psds=bool(data["keep_psds"]))
+        ppsd.spec_bins = spec_bins
+        ppsd.yedges = spec_bins
+        hist_stack = data["hist_stack"]
+        if len(data["times_used"]):
+            ppsd.hist_stack = hist_stack
+        # keep the identity of the time lists, ppsd.times is an alias
+        ppsd.times_used.extend(UTCDateTimeArray.fromNs(data["times_used"]))
+        ppsd.times_data = [UTCDateTimeArray.fromNs(span).tolist()
+                           for span in data["times_data"]]
+        ppsd.times_gaps = [UTCDateTimeArray.fromNs(span).tolist()
+                           for span in data["times_gaps"]]
+        ppsd.psd_times = UTCDateTimeArray.fromNs(data["psd_times"]).tolist()
+        ppsd.psd_values = list(data["psd_values"])
+        return ppsd
+
     def plot(self, filename=None, show_coverage=True, show_histogram=True,
              show_percentiles=False, percentiles=[0, 25, 50, 75, 100],
              show_noise_models=True, grid=True, show=True):
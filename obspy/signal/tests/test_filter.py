@@ -5,7 +5,9 @@ The Filter test suite.
 """
 
 from obspy.signal import bandpass, lowpass, highpass
-from obspy.signal.filter import envelope, lowpassCheby2
+import obspy.signal.filter
+from obspy.signal.filter import envelope, lowpassCheby2, filterCacheInfo, \
+    clearFilterCache, polyphaseResample
 import os
 import unittest
 import gzip
@@ -248,6 +250,81 @@ class FilterTestCase(unittest.TestCase):
         # be 0 (1dB ripple) before filter ramp
         self.assertTrue(h_db[freq < 25].min() > -1)
 
+    def test_filterMultidimensional(self):
+        """
+        Two dimensional data is filtered row by row along the last axis.
+        """
+        np.random.seed(815)
+        data = np.random.randn(3, 500)
+        for func, kwargs in [(bandpass, {'freqmin': 1, 'freqmax': 10}),
+                             (lowpass, {'freq': 5}),
+                             (highpass, {'freq': 2}),
+                             (lowpassCheby2, {'freq': 10})]:
+            for zerophase in [False, True]:
+                if func is not lowpassCheby2:
+                    kwargs['zerophase'] = zerophase
+                filtered = func(data, df=100, **kwargs)
+                for row, filtered_row in zip(data, filtered):
+                    np.testing.assert_array_equal(filtered_row,
+                        func(row, df=100, **kwargs))
+
+    def test_filterCache(self):
+        """
+        Filter designs are cached and reused.
+        """
+        data = np.random.randn(100)
+        maxsize = obspy.signal.filter.FILTER_CACHE_SIZE
+        try:
+            clearFilterCache()
+            filtered = bandpass(data, 1.0, 5.0, df=100)
+            info = filterCacheInfo()
+            self.assertEqual(info['misses'], 1)
+            self.assertEqual(info['hits'], 0)
+            np.testing.assert_array_equal(bandpass(data, 1.0, 5.0, df=100),
+                                          filtered)
+            lowpassCheby2(data, 10.0, df=100)
+            lowpassCheby2(data, 10.0, df=100)
+            info = filterCacheInfo()
+            self.assertEqual(info['misses'], 2)
+            self.assertEqual(info['hits'], 2)
+            self.assertEqual(info['size'], 2)
+            # least recently used designs are dropped
+            obspy.signal.filter.FILTER_CACHE_SIZE = 2
+            lowpass(data, 10.0, df=100)
+            self.assertEqual(filterCacheInfo()['size'], 2)
+            lowpassCheby2(data, 10.0, df=100)
+            self.assertEqual(filterCacheInfo()['hits'], 3)
+            bandpass(data, 1.0, 5.0, df=100)
+            self.assertEqual(filterCacheInfo()['misses'], 4)
+        finally:
+            obspy.signal.filter.FILTER_CACHE_SIZE = maxsize
+            clearFilterCache()
+
+    def test_polyphaseResample(self):
+        """
+        Polyphase resampling equals upsampling by zero insertion, FIR
+        filtering and downsampling.
+        """
+        data = np.random.randn(1001)
+        for up, down in [(2, 5), (5, 2), (1, 4), (3, 1), (4, 10)]:
+            resampled = polyphaseResample(data, up, down)
+            divisor = 2 if (up, down) == (4, 10) else 1
+            up_, down_ = up // divisor, down // divisor
+            self.assertEqual(len(resampled), -(-len(data) * up_ // down_))
+            # brute force reference
+            max_rate = max(up_, down_)
+            half_len = 10 * max_rate
+            h = sg.firwin(2 * half_len + 1, 1.0 / max_rate,
+                          window=('kaiser', 5.0)) * up_
+            upsampled = np.zeros(len(data) * up_)
+            upsampled[::up_] = data
+            expected = np.convolve(upsampled, h)[half_len::down_]
+            np.testing.assert_array_almost_equal(
+                resampled, expected[:len(resampled)], 10)
+        np.testing.assert_array_equal(polyphaseResample(data, 3, 3), data)
+        self.assertRaises(TypeError, polyphaseResample, data, 2.5, 1)
+        self.assertRaises(TypeError, polyphaseResample, data, 0, 1)
+
 
 def suite():
     return unittest.makeSuite(FilterTestCase, 'test')
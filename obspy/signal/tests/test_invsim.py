@@ -8,7 +8,9 @@ from obspy import Trace, UTCDateTime, read
 from obspy.core.util.base import NamedTemporaryFile
 from obspy.sac import attach_paz
 from obspy.signal.invsim import seisSim, estimateMagnitude, evalresp
-from obspy.signal.invsim import cosTaper
+from obspy.signal.invsim import cosTaper, pazToFreqResp, cornFreq2Paz
+from obspy.signal.invsim import responseCacheInfo, clearResponseCache
+import obspy.signal.invsim
 import gzip
 import numpy as np
 import os
@@ -303,6 +305,65 @@ class InvSimTestCase(unittest.TestCase):
         #plt.plot(tap2,'g--')
         #plt.show()
 
+    def test_responseCache(self):
+        """
+        Cached frequency responses give the same results as computing them
+        on every call and the cache is bounded in memory.
+        """
+        clearResponseCache()
+        paz = cornFreq2Paz(1.0)
+        paz_copy = {'poles': list(paz['poles']), 'zeros': [0j, 0j],
+                    'gain': 1, 'sensitivity': 1.0}
+        data = np.random.randn(1000)
+        result = seisSim(data, 100.0, paz_remove=PAZ_WWSSN_SP,
+                         paz_simulate=paz)
+        info = responseCacheInfo()
+        self.assertEqual(info['misses'], 3)
+        self.assertEqual(info['size'], 3)
+        # identical PAZ contents of a different dictionary hit the cache
+        result2 = seisSim(data, 100.0, paz_remove=PAZ_WWSSN_SP,
+                          paz_simulate=paz_copy)
+        np.testing.assert_array_equal(result, result2)
+        info = responseCacheInfo()
+        self.assertEqual(info['hits'], 2)
+        self.assertEqual(info['misses'], 3)
+        # different sampling rate
+        seisSim(data, 50.0, paz_remove=PAZ_WWSSN_SP)
+        self.assertEqual(responseCacheInfo()['misses'], 5)
+        # returned responses are writable copies
+        h = pazToFreqResp(paz['poles'], paz['zeros'], paz['gain'], 0.01,
+                          2000)
+        h[:] = 0
+        h2 = pazToFreqResp(paz['poles'], paz['zeros'], paz['gain'], 0.01,
+                           2000)
+        self.assertTrue(np.all(h2[1:] != 0))
+        # results without cache are identical
+        old = obspy.signal.invsim.RESPONSE_CACHE_SIZE
+        try:
+            obspy.signal.invsim.RESPONSE_CACHE_SIZE = 0
+            clearResponseCache()
+            result3 = seisSim(data, 100.0, paz_remove=PAZ_WWSSN_SP,
+                              paz_simulate=paz)
+            info = responseCacheInfo()
+            self.assertEqual(info['size'], 0)
+            self.assertEqual(info['bytes'], 0)
+        finally:
+            obspy.signal.invsim.RESPONSE_CACHE_SIZE = old
+        np.testing.assert_array_equal(result, result3)
+        # memory bound drops least recently used responses
+        try:
+            obspy.signal.invsim.RESPONSE_CACHE_SIZE = 40000
+            clearResponseCache()
+            for nfft in [1000, 2000, 3000]:
+                pazToFreqResp(paz['poles'], paz['zeros'], paz['gain'], 0.01,
+                              nfft)
+            info = responseCacheInfo()
+            self.assertTrue(info['bytes'] <= 40000)
+            self.assertEqual(info['size'], 1)
+        finally:
+            obspy.signal.invsim.RESPONSE_CACHE_SIZE = old
+            clearResponseCache()
+
     def test_evalrespUsingDifferentLineSeparator(self):
         """
         The evalresp needs a file with correct line separator, so '\n' for
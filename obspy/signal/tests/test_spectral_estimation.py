@@ -5,10 +5,13 @@ The psd test suite.
 """
 
 from obspy import Trace, Stream, UTCDateTime
+from obspy.core.util.base import NamedTemporaryFile
 from obspy.signal.spectral_estimation import PPSD, psd, welch_window, \
-    welch_taper
+    welch_taper, _imap_bounded
+import multiprocessing
 import numpy as np
 import os
+import pickle
 import unittest
 import warnings
 
@@ -133,6 +136,139 @@ class PsdTestCase(unittest.TestCase):
         np.testing.assert_array_equal(ppsd.spec_bins, binning['spec_bins'])
         np.testing.assert_array_equal(ppsd.period_bins, binning['period_bins'])
 
+    def test_PPSD_octaveBinning(self):
+        """
+        Octave averaging and histogram counting equal the straightforward
+        masking and np.histogram2d approach.
+        """
+        tr = Trace(np.zeros(10), {'sampling_rate': 20.0})
+        ppsd = PPSD(tr.stats, paz={})
+        np.random.seed(815)
+        specs = np.random.uniform(-210, -40, (20, len(ppsd.per)))
+        # psd values on the upper edge of the db range are counted
+        specs[0] = -50.0
+        expected = 0
+        for spec in specs:
+            spec_octaves = [
+                spec[(left <= ppsd.per) & (ppsd.per <= right)].mean()
+                for left, right in zip(ppsd.per_octaves_left,
+                                       ppsd.per_octaves_right)]
+            hist = np.histogram2d(ppsd.per_octaves, spec_octaves,
+                                  bins=(ppsd.period_bins, ppsd.spec_bins))[0]
+            expected = expected + hist
+            spec_octaves = (ppsd._PPSD__octave_sums * spec) / \
+                ppsd._PPSD__octave_counts
+            ppsd._PPSD__add_to_histogram(spec_octaves)
+        np.testing.assert_array_equal(ppsd.hist_stack, expected)
+        # pickled PPSD objects set up the octave averaging again
+        del ppsd._PPSD__octave_sums
+        ppsd = pickle.loads(pickle.dumps(ppsd))
+        self.assertEqual(ppsd._PPSD__octave_sums.shape,
+                         (len(ppsd.per_octaves), len(ppsd.per)))
+
+    def test_PPSD_batches(self):
+        """
+        Processing segments in batches and in multiple processes gives the
+        same histogram as processing them one by one.
+        """
+        np.random.seed(815)
+        data = np.cumsum(np.random.randn(10 * 3600)).astype(np.int32)
+        tr = Trace(data, {'sampling_rate': 1.0, 'network': 'BW',
+                          'station': 'KW1', 'channel': 'BHZ'})
+        paz = {'gain': 60077000.0,
+               'poles': [(-0.037004 + 0.037016j), (-0.037004 - 0.037016j),
+                         (-251.33 + 0j), (-131.04 - 467.29j),
+                         (-131.04 + 467.29j)],
+               'sensitivity': 2516778400.0,
+               'zeros': [0j, 0j]}
+        ppsds = []
+        for kwargs in ({'batch_size': 1}, {}, {'processes': 2},
+                       {'batch_size': 1, 'processes': 2}):
+            ppsd = PPSD(tr.stats, paz)
+            self.assertTrue(ppsd.add(tr.copy(), **kwargs))
+            ppsds.append(ppsd)
+        self.assertEqual(len(ppsds[0].times), 18)
+        for ppsd in ppsds[1:]:
+            self.assertEqual(ppsd.times, ppsds[0].times)
+            np.testing.assert_array_equal(ppsd.hist_stack,
+                                          ppsds[0].hist_stack)
+        # all segments are already covered
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('ignore', UserWarning)
+            self.assertFalse(ppsds[0].add(tr))
+        # batches are taken from the generator only as results come back
+        taken = []
+
+        def items():
+            for i in xrange(20):
+                taken.append(i)
+                yield i, -i
+        pool = multiprocessing.Pool(2)
+        try:
+            results = _imap_bounded(pool, abs, items(), 4)
+            self.assertEqual(results.next(), (0, 0))
+            self.assertEqual(len(taken), 4)
+            self.assertEqual(list(results), [(i, i) for i in xrange(1, 20)])
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def test_PPSD_mergeAndSaveNpz(self):
+        """
+        PPSDs of consecutive time spans can be merged and saved compactly.
+        """
+        np.random.seed(815)
+        data = np.cumsum(np.random.randn(20 * 3600)).astype(np.int32)
+        tr = Trace(data, {'sampling_rate': 1.0, 'network': 'BW',
+                          'station': 'KW1', 'channel': 'BHZ',
+                          'starttime': UTCDateTime(2012, 1, 1)})
+        paz = {'gain': 60077000.0,
+               'poles': [(-0.037004 + 0.037016j), (-0.037004 - 0.037016j),
+                         (-251.33 + 0j), (-131.04 - 467.29j),
+                         (-131.04 + 467.29j)],
+               'sensitivity': 2516778400.0,
+               'zeros': [0j, 0j]}
+        t = tr.stats.starttime + 10 * 3600
+        ppsd1 = PPSD(tr.stats, paz, keep_psds=True)
+        ppsd1.add(tr.slice(endtime=t - 1))
+        ppsd2 = PPSD(tr.stats, paz, keep_psds=True)
+        ppsd2.add(tr.slice(starttime=t))
+        ppsd = ppsd1 + ppsd2
+        self.assertEqual(len(ppsd.times), 36)
+        self.assertEqual(ppsd.times, sorted(ppsd1.times + ppsd2.times))
+        np.testing.assert_array_equal(ppsd.hist_stack,
+                                      ppsd1.hist_stack + ppsd2.hist_stack)
+        # histograms and percentiles of sub-periods from the stored psds
+        np.testing.assert_array_equal(ppsd.get_histogram(), ppsd.hist_stack)
+        np.testing.assert_array_equal(ppsd.get_histogram(starttime=t),
+                                      ppsd2.hist_stack)
+        np.testing.assert_array_equal(
+            ppsd.get_percentile(starttime=t)[1], ppsd2.get_percentile()[1])
+        # overlapping or incompatible PPSDs can not be merged
+        self.assertRaises(ValueError, ppsd.merge, ppsd1)
+        ppsd3 = PPSD(tr.stats, paz, db_bins=[-200, -50, 1.0])
+        self.assertRaises(TypeError, ppsd1.merge, ppsd3)
+        for kwargs in ({'keep_psds': False},
+                       {'keep_psds': True, 'skip_on_gaps': True}):
+            ppsd3 = PPSD(tr.stats, paz, **kwargs)
+            ppsd3.add(tr.slice(endtime=tr.stats.starttime + 3 * 3600))
+            self.assertRaises(TypeError, ppsd2.merge, ppsd3)
+            self.assertRaises(TypeError, ppsd3.merge, ppsd2)
+        self.assertRaises(TypeError, ppsd1.merge, tr)
+        self.assertRaises(TypeError, ppsd1.__add__, None)
+        self.assertEqual(len(ppsd1.times), 18)
+        # save and load as npz file
+        with NamedTemporaryFile(suffix='.npz') as tf:
+            ppsd.save_npz(tf.name)
+            loaded = PPSD.load_npz(tf.name)
+        self.assertEqual(loaded.id, ppsd.id)
+        self.assertEqual(loaded.paz, ppsd.paz)
+        self.assertEqual(loaded.times, ppsd.times)
+        self.assertEqual(loaded.times_data, ppsd.times_data)
+        self.assertEqual(loaded.psd_times, ppsd.psd_times)
+        np.testing.assert_array_equal(loaded.hist_stack, ppsd.hist_stack)
+        np.testing.assert_array_equal(loaded.psd_values, ppsd.psd_values)
+
 
 def suite():
     return unittest.makeSuite(PsdTestCase, 'test')
@@ -151,6 +151,38 @@ class StreamTestCase(unittest.TestCase):
             st_bkp[i].decimate(10, strict_length=False)
             self.assertEqual(tr, st_bkp[i])
 
+    def test_processWithWorkers(self):
+        """
+        Processing traces in multiple threads gives the same results and
+        processing information as processing them one after another.
+        """
+        st = read()
+        st += read()
+        st[3].data = st[3].data[:2000]
+        paz = {'poles': [-4.44 + 4.44j, -4.44 - 4.44j], 'zeros': [0j, 0j],
+               'gain': 1.0, 'sensitivity': 1.0}
+        for method, args, kwargs in [
+                ('detrend', [], {'type': 'linear'}),
+                ('taper', [], {}),
+                ('filter', ['bandpass'], {'freqmin': 1.0, 'freqmax': 10.0}),
+                ('filter', ['lowpassFIR'], {'freq': 10.0}),
+                ('simulate', [], {'paz_simulate': paz}),
+                ('resample', [20.0], {}),
+                ('resample', [20.0], {'method': 'polyphase'}),
+                ('decimate', [2], {})]:
+            st1 = st.copy()
+            getattr(st1, method)(*args, **kwargs)
+            st2 = st.copy()
+            kwargs['workers'] = 4
+            getattr(st2, method)(*args, **kwargs)
+            st3 = st.copy()
+            st3.process(method, *args, **kwargs)
+            for tr1, tr2, tr3 in zip(st1, st2, st3):
+                np.testing.assert_array_equal(tr1.data, tr2.data)
+                np.testing.assert_array_equal(tr1.data, tr3.data)
+                self.assertEqual(tr1.stats, tr2.stats)
+                self.assertEqual(tr1.stats, tr3.stats)
+
 
 def suite():
     return unittest.makeSuite(StreamTestCase, 'test')
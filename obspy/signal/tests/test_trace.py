@@ -161,6 +161,32 @@ class TraceTestCase(unittest.TestCase):
         tr2.decimate(4, no_filter=True)
         np.testing.assert_array_equal(tr.data, tr2.data)
 
+    def test_decimateMultistage(self):
+        """
+        Tests decimation in several stages with automatic prefiltering.
+        """
+        tr = Trace(data=np.random.randn(4003))
+        tr.stats.sampling_rate = 200.0
+        tr2 = tr.copy()
+        # factor 200 is not possible in a single stage
+        self.assertRaises(ArithmeticError, tr.decimate, 200)
+        self.assertRaises(ArithmeticError, tr.decimate, 34, multistage=True)
+        self.assertRaises(ValueError, tr.decimate, 200, strict_length=True,
+                          multistage=True)
+        tr.decimate(200, multistage=True)
+        self.assertEqual(tr.stats.sampling_rate, 1.0)
+        self.assertEqual(tr.stats.npts, 21)
+        self.assertEqual(len(tr.stats.processing), 6)
+        for factor in [10, 10, 2]:
+            tr2.decimate(factor)
+        np.testing.assert_array_equal(tr.data, tr2.data)
+        self.assertEqual(tr.stats.processing, tr2.stats.processing)
+        # single stage factors are not changed
+        tr = tr2.copy()
+        tr.decimate(7, multistage=True)
+        tr2.decimate(7)
+        np.testing.assert_array_equal(tr.data, tr2.data)
+
 
 def suite():
     return unittest.makeSuite(TraceTestCase, 'test')
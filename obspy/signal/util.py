@@ -86,6 +86,32 @@ def nextpow2(i):
     return int(M.pow(2, buf))
 
 
+def nextFastLength(i, multiple=1):
+    """
+    Find the next length with only prime factors 2, 3 and 5 which is a
+    multiple of the given number.
+
+    FFTs of such lengths are considerably faster than of lengths with large
+    prime factors. If ``multiple`` itself has other prime factors, the
+    smallest multiple of it with a co-factor of prime factors 2, 3 and 5 is
+    returned.
+
+    >>> nextFastLength(1009)
+    1024
+    >>> nextFastLength(1009, multiple=7)
+    1050
+    """
+    k = max(-(-i // multiple), 1)
+    while True:
+        rest = k
+        for prime in (2, 3, 5):
+            while rest % prime == 0:
+                rest //= prime
+        if rest == 1:
+            return k * multiple
+        k += 1
+
+
 def prevpow2(i):
     """
     Find the previous power of two